@@ -0,0 +1,8 @@
+"""Micro-benchmarks for the combat hot path.
+
+Run ``python -m benchmarks`` to compare against ``benchmarks/baseline.json``
+or ``python -m benchmarks --save`` to record a new baseline. Throughput is
+compared relative to a calibration loop, but the baseline is still a local
+reference: record your own before comparing changes.
+``python -m benchmarks.frames`` times scene updates and draws headlessly.
+"""
@@ -0,0 +1,179 @@
+"""Run the combat micro-benchmarks and compare them with a stored baseline.
+
+    python -m benchmarks                 # compare with benchmarks/baseline.json
+    python -m benchmarks --save          # record a new baseline
+    python -m benchmarks -k on_tick --threshold 0.1
+
+Raw throughput is the best of ``--repeat`` timed runs. Memory is measured in a
+separate run under ``tracemalloc``: peak traced bytes and net allocated
+blocks per op (Python exposes no cumulative allocation counter, so net blocks
+catch growth/leaks and peak bytes catch per-op temporaries).
+
+Raw ops/s only means something on the machine that recorded it, so each
+timed run is paired with a run of a fixed pure-Python calibration loop, and
+the median case/calibration ratio (``relative``) is what gets compared
+against ``--threshold``. This cancels out overall machine speed and load
+drift during a run, but not differences between Python versions or CPU
+architectures. Treat the committed ``baseline.json`` as a local reference:
+record your own with ``--save`` before comparing changes, and re-record after
+deliberate performance changes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, Sequence
+
+from benchmarks.combat import CASES, Case
+
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+# Peak-memory changes below this many bytes per op are treated as noise.
+MEMORY_NOISE_BYTES = 64
+CALIBRATION_OPS = 1000
+
+
+def _calibration_op() -> None:
+    total = 0
+    for value in range(CALIBRATION_OPS):
+        total += value * value % 7
+
+
+def _rate(op: Callable[[], Any], ops: int, min_time_s: float) -> float:
+    runs = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time_s:
+        op()
+        runs += 1
+        elapsed = time.perf_counter() - start
+    return runs * ops / elapsed
+
+
+def measure(case: Case, *, min_time_s: float = 0.2, repeat: int = 3) -> Dict[str, Any]:
+    op, ops = case.setup(**case.params)
+    op()  # warm caches and lazy state
+    _calibration_op()
+    rates = []
+    ratios = []
+    for _ in range(repeat):
+        # Time the calibration loop right next to the case so both see the
+        # same machine load.
+        reference = _rate(_calibration_op, CALIBRATION_OPS, min_time_s)
+        rate = _rate(op, ops, min_time_s)
+        rates.append(rate)
+        ratios.append(rate / reference)
+
+    op, ops = case.setup(**case.params)
+    op()
+    tracemalloc.start()
+    try:
+        blocks = sys.getallocatedblocks()
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        op()
+        _, peak = tracemalloc.get_traced_memory()
+        net_blocks = sys.getallocatedblocks() - blocks
+    finally:
+        tracemalloc.stop()
+    return {
+        "ops_per_s": max(rates),
+        "relative": statistics.median(ratios),
+        "peak_bytes_per_op": max(0, peak - base) / ops,
+        "net_blocks_per_op": net_blocks / ops,
+    }
+
+
+def throughput_change(result: Dict[str, Any], baseline: Dict[str, Any]) -> float:
+    """Fractional throughput change, machine-relative when both sides allow."""
+    if "relative" in result and "relative" in baseline:
+        return result["relative"] / baseline["relative"] - 1.0
+    return result["ops_per_s"] / baseline["ops_per_s"] - 1.0
+
+
+def compare(
+    result: Dict[str, Any],
+    baseline: Dict[str, Any] | None,
+    threshold: float,
+) -> list[str]:
+    """Return human-readable regressions of ``result`` against ``baseline``."""
+    if not baseline:
+        return []
+    problems = []
+    change = throughput_change(result, baseline)
+    if change < -threshold:
+        problems.append(f"throughput {change:+.0%}")
+    limit = baseline["peak_bytes_per_op"] * (1.0 + threshold) + MEMORY_NOISE_BYTES
+    if result["peak_bytes_per_op"] > limit:
+        problems.append(
+            f"peak {baseline['peak_bytes_per_op']:.0f}->{result['peak_bytes_per_op']:.0f} B/op"
+        )
+    return problems
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="pattern", help="only run cases whose id contains PATTERN")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save", action="store_true", help="write results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown (0.2 = 20%%)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per timed run")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    stored: Dict[str, Any] = {}
+    if args.baseline.exists():
+        stored = json.loads(args.baseline.read_text(encoding="utf-8")).get("cases", {})
+
+    results: Dict[str, Dict[str, Any]] = {}
+    regressions = 0
+    width = max(len(case.case_id) for case in CASES)
+    print(f"{'case':<{width}}  {'ops/s':>12}  {'B/op':>8}  {'blk/op':>7}  vs baseline")
+    for case in CASES:
+        if args.pattern and args.pattern not in case.case_id:
+            continue
+        result = measure(case, min_time_s=args.min_time, repeat=args.repeat)
+        results[case.case_id] = result
+        base = stored.get(case.case_id)
+        problems = compare(result, base, args.threshold)
+        regressions += bool(problems)
+        if base:
+            verdict = f"{throughput_change(result, base):+.0%}"
+            if problems:
+                verdict += "  REGRESSION: " + ", ".join(problems)
+        else:
+            verdict = "new"
+        print(
+            f"{case.case_id:<{width}}  {result['ops_per_s']:>12,.0f}  "
+            f"{result['peak_bytes_per_op']:>8.1f}  {result['net_blocks_per_op']:>7.2f}  {verdict}"
+        )
+
+    if args.save:
+        merged = {**stored, **results}
+        payload = {
+            "meta": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "machine": platform.machine(),
+                "saved_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            },
+            "cases": merged,
+        }
+        args.baseline.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if regressions:
+        print(f"{regressions} case(s) regressed beyond {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""Benchmark cases for combat, ticking, spawning and levelling.
+
+Each case builds its state in ``setup`` and returns ``(op, ops)``: calling
+``op()`` performs ``ops`` units of work (ticks, attacks, spawns...), so the
+runner can report throughput per unit regardless of how a case batches.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Tuple
+
+from core.data.encounters import DEFAULT_ENCOUNTER_POOLS, EncounterPool
+from core.entities import Actor, Enemy
+from core.gameplay.combat import CombatSystem, TickController
+from core.gameplay.combat.scheduler import AttackScheduler
+from core.gameplay.damage import calc_damage
+
+
+Setup = Callable[..., Tuple[Callable[[], Any], int]]
+
+
+@dataclass
+class Case:
+    name: str
+    setup: Setup
+    params: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def case_id(self) -> str:
+        if not self.params:
+            return self.name
+        args = ",".join(f"{key}={value}" for key, value in self.params.items())
+        return f"{self.name}[{args}]"
+
+
+def _party(size: int) -> List[Actor]:
+    return [
+        Actor(f"A{index}", hp=10**9, atk=6 + index % 3, cd=(0.2, 0.3, 0.4)[index % 3])
+        for index in range(size)
+    ]
+
+
+def _wave(size: int, seed: int = 1) -> List[Enemy]:
+    rng = random.Random(seed)
+    # Effectively unkillable so every measured tick is steady-state combat.
+    return [
+        Enemy(name=f"E{index}", hp=10**9, atk=2, cd=rng.choice([0.8, 1.0, 2.0, 2.5]))
+        for index in range(size)
+    ]
+
+
+def setup_on_tick(party: int, wave: int, ticks: int):
+    cs = CombatSystem(_party(party), enemies=_wave(wave))
+
+    def op():
+        for _ in range(ticks):
+            cs.on_tick(0.2)
+
+    return op, ticks
+
+
+def setup_scheduler(party: int, wave: int, ticks: int):
+    cs = CombatSystem(_party(party), enemies=_wave(wave))
+    scheduler = AttackScheduler(cs, 0.2)
+    seconds = ticks * 0.2
+
+    def op():
+        scheduler.update(seconds, cs.on_tick)
+
+    return op, ticks
+
+
+def setup_tick_controller(ticks: int):
+    tc = TickController(0.2)
+    noop = lambda dt: None  # noqa: E731
+    frames = int(ticks * 0.2 * 60)
+
+    def op():
+        for _ in range(frames):
+            tc.update(1 / 60, noop)
+
+    return op, frames
+
+
+def setup_calc_damage():
+    pairs = [(atk, defense) for atk in range(1, 21) for defense in range(0, 10)]
+
+    def op():
+        for atk, defense in pairs:
+            calc_damage(atk, defense)
+
+    return op, len(pairs)
+
+
+def setup_next_enemy(spawns: int):
+    pool = EncounterPool(
+        DEFAULT_ENCOUNTER_POOLS,
+        default_pool="destiny_islands_beach",
+        rng=random.Random(3),
+    )
+
+    def op():
+        for _ in range(spawns):
+            pool.next_enemy()
+
+    return op, spawns
+
+
+def setup_gain_xp(gains: int):
+    actor = Actor("A", hp=10)
+
+    def op():
+        for _ in range(gains):
+            actor.gain_xp(37)
+
+    return op, gains
+
+
+CASES: List[Case] = [
+    Case("calc_damage", setup_calc_damage),
+    Case("actor_gain_xp", setup_gain_xp, {"gains": 1000}),
+    Case("encounter_next_enemy", setup_next_enemy, {"spawns": 200}),
+    Case("tick_controller_update", setup_tick_controller, {"ticks": 1000}),
+    *[
+        Case("combat_on_tick", setup_on_tick, {"party": party, "wave": wave, "ticks": ticks})
+        for party in (1, 3, 8)
+        for wave in (1, 10, 100, 500)
+        for ticks in (200,)
+    ],
+    Case("combat_on_tick", setup_on_tick, {"party": 3, "wave": 10, "ticks": 2000}),
+    *[
+        Case("scheduler_update", setup_scheduler, {"party": 3, "wave": wave, "ticks": ticks})
+        for wave in (1, 100)
+        for ticks in (200, 2000)
+    ],
+]
+
+
+__all__ = ["CASES", "Case"]
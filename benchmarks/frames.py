@@ -0,0 +1,180 @@
+"""Headless frame-time benchmark for the battle screen and its overlays.
+
+    python -m benchmarks.frames
+    python -m benchmarks.frames --sizes 1280x720,3840x2160 --frames 600 -k Synthesis
+    python -m benchmarks.frames --full-redraw --json frames.json
+
+Each case is a ``Manager`` holding a seeded ``BattleScene``, optionally with
+one overlay opened the way a player would (clicking its HUD button, ``M`` for
+the map). Frames are drawn into an off-screen surface through the SDL dummy
+video driver, so this runs on a box without a display. Update (one 60Hz
+``Manager.advance``) and draw (``Manager.draw``) times are reported as
+p50/p90/p99/max per scene and resolution. ``--full-redraw`` invalidates every
+frame to measure full repaints instead of the dirty-rect path.
+"""
+
+from __future__ import annotations
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import pygame
+
+from core.data.savegame import create_default_state
+from core.scenes.battle_scene import BattleScene
+from core.scenes.scene import Manager
+from core.systems.assets import default_assets
+from core.systems.profiling import percentile
+from core.systems.render.display import parse_size
+
+
+DEFAULT_SIZES: Tuple[Tuple[int, int], ...] = ((1280, 720), (1920, 1080), (3840, 2160))
+FRAME_S = 1 / 60
+WARMUP_FRAMES = 10
+
+
+def _click(button: Callable[[BattleScene], pygame.Rect]) -> Callable[[Manager, BattleScene], None]:
+    def open_overlay(manager: Manager, battle: BattleScene) -> None:
+        pos = button(battle).center
+        manager.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1))
+
+    return open_overlay
+
+
+def _press(key: int) -> Callable[[Manager, BattleScene], None]:
+    def open_overlay(manager: Manager, battle: BattleScene) -> None:
+        manager.handle_event(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode=""))
+
+    return open_overlay
+
+
+# Scene name -> how to get it on top of the battle (None: the battle itself).
+SCENES: Dict[str, Callable[[Manager, BattleScene], None] | None] = {
+    "BattleScene": None,
+    "InventoryScene": _click(lambda battle: battle.hud.inventory_button_rect),
+    "SynthesisScene": _click(lambda battle: battle.hud.synthesis_button_rect),
+    "ItemLevelScene": _click(lambda battle: battle.hud.leveling_button_rect),
+    "MapScene": _press(pygame.K_m),
+}
+
+
+def build_case(scene_name: str, font, surface: pygame.Surface, *, seed: int = 3) -> Manager:
+    """A manager showing ``scene_name`` over a seeded battle, drawn once."""
+    state = create_default_state("benchmark")
+    manager = Manager()
+    battle = BattleScene(
+        font,
+        controller=manager.controller,
+        location_id=state.location_id,
+        inventory=state.inventory,
+        actors=state.actors,
+        seed=seed,
+    )
+    manager.set_scene(battle)
+    # Images decode on a worker; wait so every case draws the same pixels.
+    default_assets().wait(10.0)
+    manager.draw(surface)
+    opener = SCENES[scene_name]
+    if opener is not None:
+        opener(manager, battle)
+        top = manager.scenes[-1]
+        if type(top).__name__ != scene_name:
+            raise RuntimeError(f"Could not open {scene_name} (top scene is {type(top).__name__})")
+    return manager
+
+
+def _summary(samples: Sequence[float]) -> Dict[str, float]:
+    return {
+        "p50_ms": percentile(samples, 0.50) * 1000,
+        "p90_ms": percentile(samples, 0.90) * 1000,
+        "p99_ms": percentile(samples, 0.99) * 1000,
+        "max_ms": max(samples) * 1000 if samples else 0.0,
+    }
+
+
+def measure(
+    scene_name: str,
+    size: Tuple[int, int],
+    font,
+    *,
+    frames: int = 300,
+    full_redraw: bool = False,
+) -> Dict[str, Any]:
+    """Time ``frames`` update+draw frames of one case."""
+    surface = pygame.Surface(size).convert()
+    manager = build_case(scene_name, font, surface)
+    perf_counter = time.perf_counter
+    updates: List[float] = []
+    draws: List[float] = []
+    for frame in range(WARMUP_FRAMES + frames):
+        if full_redraw:
+            manager.invalidate()
+        start = perf_counter()
+        manager.advance(FRAME_S)
+        middle = perf_counter()
+        manager.draw(surface)
+        end = perf_counter()
+        if frame >= WARMUP_FRAMES:
+            updates.append(middle - start)
+            draws.append(end - middle)
+    return {
+        "scene": scene_name,
+        "size": f"{size[0]}x{size[1]}",
+        "update": _summary(updates),
+        "draw": _summary(draws),
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.frames", description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="pattern", help="only run scenes whose name contains PATTERN")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(f"{w}x{h}" for w, h in DEFAULT_SIZES),
+        help="comma-separated WxH resolutions",
+    )
+    parser.add_argument("--frames", type=int, default=300, help="timed frames per case")
+    parser.add_argument("--full-redraw", action="store_true", help="repaint the whole frame every time")
+    parser.add_argument("--json", type=Path, help="also write the results as JSON")
+    args = parser.parse_args(argv)
+    try:
+        sizes = [parse_size(text) for text in args.sizes.split(",") if text]
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode((1, 1))
+    font = pygame.font.Font(None, 24)
+
+    results = []
+    print(f"{'scene':<16} {'size':>9}  {'update p50/p99/max ms':>24}  {'draw p50/p90/p99/max ms':>30}")
+    for size in sizes:
+        for scene_name in SCENES:
+            if args.pattern and args.pattern not in scene_name:
+                continue
+            result = measure(scene_name, size, font, frames=args.frames, full_redraw=args.full_redraw)
+            results.append(result)
+            update, draw = result["update"], result["draw"]
+            print(
+                f"{scene_name:<16} {result['size']:>9}  "
+                f"{update['p50_ms']:7.3f} {update['p99_ms']:7.3f} {update['max_ms']:7.3f}  "
+                f"{draw['p50_ms']:7.3f} {draw['p90_ms']:7.3f} {draw['p99_ms']:7.3f} {draw['max_ms']:7.3f}"
+            )
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"Results written to {args.json}")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
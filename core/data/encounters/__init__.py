@@ -1,5 +1,5 @@
 import random
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Tuple
 
 from core.entities import Enemy
 
@@ -51,6 +51,25 @@ ENEMY_DEFINITIONS: Dict[str, dict] = {
 }
 
 
+# Battles spawn waves of ``randint(MIN_WAVE_SIZE, MAX_WAVE_SIZE)`` enemies.
+MIN_WAVE_SIZE = 2
+MAX_WAVE_SIZE = 4
+
+
+def roll_drops(drops: Iterable[dict], rng: random.Random) -> List[Tuple[int, dict, float, bool]]:
+    """Roll each drop entry once against its ``chance``.
+
+    Returns ``(index, drop, roll, hit)`` per entry, consuming exactly one
+    ``rng.random()`` per entry so seeded callers stay reproducible.
+    """
+    results = []
+    for index, drop in enumerate(drops or ()):
+        chance = float(drop.get("chance", 1.0))
+        roll = rng.random()
+        results.append((index, drop, roll, roll <= chance))
+    return results
+
+
 class EncounterPool:
     """Manage enemy templates and spawn new instances on demand."""
 
@@ -60,6 +79,7 @@ class EncounterPool:
         *,
         default_pool: str,
         enemy_definitions: Dict[str, dict] | None = None,
+        rng: random.Random | None = None,
     ):
         if default_pool not in pools:
             raise KeyError(f"Unknown enemy pool '{default_pool}'")
@@ -68,7 +88,8 @@ class EncounterPool:
         for name, entries in pools.items():
             self._pools[name] = [dict(entry) for entry in entries]
         self._current_pool = default_pool
-        self._rng = random.Random()
+        # Pass a seeded Random to make encounters reproducible.
+        self._rng = rng if rng is not None else random.Random()
         self._enemy_definitions = {
             key: dict(value)
             for key, value in (enemy_definitions or ENEMY_DEFINITIONS).items()
@@ -91,7 +112,17 @@ class EncounterPool:
         candidates = self._pools.get(self._current_pool)
         if not candidates:
             raise ValueError(f"Enemy pool '{self._current_pool}' is empty")
-        template = dict(self._rng.choice(candidates))
+        return self._build_enemy(self._rng.choice(candidates))
+
+    def pool_enemies(self, pool_name: str | None = None) -> List[Enemy]:
+        """Build one enemy per template, in pool order, without rolling."""
+        name = pool_name or self._current_pool
+        if name not in self._pools:
+            raise KeyError(f"Unknown enemy pool '{name}'")
+        return [self._build_enemy(entry) for entry in self._pools[name]]
+
+    def _build_enemy(self, entry: dict) -> Enemy:
+        template = dict(entry)
         if "enemy_id" in template:
             enemy_id = template.pop("enemy_id")
             try:
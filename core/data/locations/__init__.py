@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from typing import Dict, Iterable
+from typing import Dict, Iterable, Tuple
 
 
 @dataclass(frozen=True)
@@ -69,9 +69,17 @@ def iter_locations() -> Iterable[LocationDef]:
     return _LOCATIONS.values()
 
 
+def adjacent_locations(location_id: str) -> Tuple[LocationDef, ...]:
+    """Locations next to ``location_id`` on the map, i.e. likely next travel."""
+    order = list(_LOCATIONS)
+    index = order.index(get_location(location_id).location_id)
+    return tuple(_LOCATIONS[order[i]] for i in (index - 1, index + 1) if 0 <= i < len(order))
+
+
 __all__ = [
     "LocationDef",
     "DEFAULT_LOCATION_ID",
+    "adjacent_locations",
     "get_location",
     "iter_locations",
 ]
@@ -13,6 +13,7 @@ from core.data.locations import DEFAULT_LOCATION_ID, get_location
 from core.data.spells import get_spell
 from core.entities import Actor
 from core.gameplay.inventory import Inventory
+from core.gameplay.offline import OfflineReport, apply_offline_progress
 from core.gameplay.party import DEFAULT_PARTY_TEMPLATES, build_party
 
 SAVE_DIR_ENV = "INCREMENTAL_SAVE_DIR"
@@ -50,6 +51,7 @@ class GameState:
     created_at: datetime | None = None
     updated_at: datetime | None = None
     summary: Dict[str, Any] = field(default_factory=dict)
+    offline_report: OfflineReport | None = None
 
 
 def _resolve_save_dir(base_path: str | os.PathLike[str] | None = None) -> Path:
@@ -247,6 +249,40 @@ def create_default_state(
     )
 
 
+def serialize_state(state: GameState) -> Dict[str, Any]:
+    """Return the JSON-compatible payload written to a save slot."""
+    return {
+        "version": SAVE_VERSION,
+        "slot_id": state.slot_id,
+        "created_at": state.created_at.isoformat() if state.created_at else None,
+        "updated_at": state.updated_at.isoformat() if state.updated_at else None,
+        "location_id": state.location_id,
+        "inventory": _serialize_inventory(state.inventory),
+        "actors": [_serialize_actor(actor) for actor in state.actors],
+        "summary": {
+            "party_names": [actor.name for actor in state.actors],
+            "munny": int(state.inventory.munny),
+        },
+    }
+
+
+def state_from_payload(slot_id: str, payload: Dict[str, Any]) -> GameState:
+    """Rebuild a ``GameState`` from a payload produced by ``serialize_state``."""
+    inventory_payload = payload.get("inventory", {})
+    actors_payload = payload.get("actors", [])
+    inventory = _build_inventory(inventory_payload)
+    actors = [_build_actor(entry, inventory=inventory) for entry in actors_payload]
+    return GameState(
+        slot_id=slot_id,
+        location_id=payload.get("location_id", DEFAULT_LOCATION_ID),
+        inventory=inventory,
+        actors=actors,
+        created_at=_parse_datetime(payload.get("created_at")),
+        updated_at=_parse_datetime(payload.get("updated_at")),
+        summary=payload.get("summary", {}),
+    )
+
+
 def save_state(
     state: GameState,
     *,
@@ -258,19 +294,7 @@ def save_state(
     if state.created_at is None:
         state.created_at = now
     state.updated_at = now
-    payload = {
-        "version": SAVE_VERSION,
-        "slot_id": state.slot_id,
-        "created_at": state.created_at.isoformat(),
-        "updated_at": state.updated_at.isoformat(),
-        "location_id": state.location_id,
-        "inventory": _serialize_inventory(state.inventory),
-        "actors": [_serialize_actor(actor) for actor in state.actors],
-        "summary": {
-            "party_names": [actor.name for actor in state.actors],
-            "munny": int(state.inventory.munny),
-        },
-    }
+    payload = serialize_state(state)
     directory = _resolve_save_dir(base_path)
     _ensure_directory(directory)
     path = directory / f"{state.slot_id}{SAVE_FILE_SUFFIX}"
@@ -282,7 +306,10 @@ def load_state(
     slot_id: str,
     *,
     base_path: str | os.PathLike[str] | None = None,
+    offline_progress: bool = False,
+    now: datetime | None = None,
 ) -> GameState | None:
+    """Load a slot; with ``offline_progress`` grant rewards since the last save."""
     path = _slot_path(slot_id, base_path=base_path)
     if not path.exists():
         return None
@@ -291,19 +318,9 @@ def load_state(
             payload = json.load(handle)
     except (OSError, json.JSONDecodeError):
         return None
-    inventory_payload = payload.get("inventory", {})
-    actors_payload = payload.get("actors", [])
-    inventory = _build_inventory(inventory_payload)
-    actors = [_build_actor(entry, inventory=inventory) for entry in actors_payload]
-    state = GameState(
-        slot_id=slot_id,
-        location_id=payload.get("location_id", DEFAULT_LOCATION_ID),
-        inventory=inventory,
-        actors=actors,
-        created_at=_parse_datetime(payload.get("created_at")),
-        updated_at=_parse_datetime(payload.get("updated_at")),
-        summary=payload.get("summary", {}),
-    )
+    state = state_from_payload(slot_id, payload)
+    if offline_progress:
+        state.offline_report = apply_offline_progress(state, now=now)
     return state
 
 
@@ -337,6 +354,8 @@ __all__ = [
     "GameState",
     "SaveSlotInfo",
     "create_default_state",
+    "serialize_state",
+    "state_from_payload",
     "save_state",
     "load_state",
     "list_slots",
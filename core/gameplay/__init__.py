@@ -5,6 +5,7 @@ __all__ = [
     "combat",
     "damage",
     "inventory",
+    "offline",
     "party",
     "stats",
 ]
@@ -1,12 +1,71 @@
 from __future__ import annotations
 
-from typing import Callable, Iterable, Optional, TYPE_CHECKING
+import heapq
+import time
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
 
 from core.gameplay.damage import calc_damage
 
 
 if TYPE_CHECKING:
     from core.entities.character import Character
+    from core.gameplay.combat.instrumentation import CombatStats
+
+
+# Seconds a knocked-out party member stays down before reviving in battle.
+KO_REVIVE_S = 5.0
+# Slack for float drift when KO timers are charged a batch at a time.
+KO_EPSILON_S = 1e-9
+
+
+def _check_tick_length(tick_length_s: float) -> float:
+    dt = float(tick_length_s)
+    if dt <= 0.0:
+        raise ValueError("tick_length_s must be positive")
+    return dt
+
+
+@lru_cache(maxsize=512)
+def _timer_steps(elapsed_s: float, cooldown_s: float, tick_length_s: float) -> Tuple[float, ...]:
+    # ``elapsed_s`` after 0, 1, 2, ... calls of ``AttackState.tick`` until it
+    # is ready. Timers restart from 0.0 after every attack, so few starting
+    # points ever occur and each table is at most ``cooldown / dt`` long.
+    steps = [elapsed_s]
+    while elapsed_s < cooldown_s:
+        elapsed_s += tick_length_s
+        steps.append(elapsed_s)
+    return tuple(steps)
+
+
+def ticks_until_ready(elapsed_s: float, cooldown_s: float, tick_length_s: float) -> int:
+    """Return how many ticks of ``tick_length_s`` until an attack fires.
+
+    Mirrors ``AttackState.tick``/``ready`` exactly, including float
+    accumulation, so callers can predict the tick ``CombatSystem.on_tick``
+    would attack on. Always at least 1 because ``on_tick`` ticks first.
+    """
+
+    dt = _check_tick_length(tick_length_s)
+    steps = _timer_steps(float(elapsed_s), float(cooldown_s), dt)
+    return max(1, len(steps) - 1)
+
+
+def elapsed_after_ticks(elapsed_s: float, ticks: int, cooldown_s: float, tick_length_s: float) -> float:
+    """``AttackState.time_since_attack_s`` after ``ticks`` idle ticks.
+
+    Bit-for-bit what ``ticks`` calls of ``AttackState.tick`` give up to the
+    tick the timer becomes ready, looked up rather than looped. Past that
+    point only readiness matters, so the rest is added in one step.
+    """
+
+    if ticks <= 0:
+        return float(elapsed_s)
+    dt = _check_tick_length(tick_length_s)
+    steps = _timer_steps(float(elapsed_s), float(cooldown_s), dt)
+    if ticks < len(steps):
+        return steps[ticks]
+    return steps[-1] + (ticks - len(steps) + 1) * dt
 
 
 class TickController:
@@ -16,18 +75,121 @@ class TickController:
         tc = TickController(0.2)
         tc.update(0.1, on_tick)  # no tick yet
         tc.update(0.1, on_tick)  # on_tick(0.2) called once
+
+    ``feed`` and ``drain`` split ``update`` in two so callers can bank a lot
+    of time (time acceleration, catch-up) and work it off in bounded batches;
+    whatever is not drained yet is reported by ``backlog_s``.
     """
 
     def __init__(self, tick_length_s: float = 0.2) -> None:
         self.tick_length_s = float(tick_length_s)
         self._accum = 0.0
+        # Optional CombatStats; records ticks per update/drain call.
+        self.instrumentation: Optional[CombatStats] = None
 
     def update(self, dt: float, on_tick: Callable[[float], None]) -> None:
+        if self.instrumentation is not None:
+            self.feed(dt)
+            self.instrumentation.record_frame(self.drain(on_tick, batch_ticks=1 << 30))
+            return
         self._accum += float(dt)
         while self._accum >= self.tick_length_s:
             on_tick(self.tick_length_s)
             self._accum -= self.tick_length_s
 
+    @property
+    def backlog_s(self) -> float:
+        """Simulated time banked but not yet run."""
+        return self._accum
+
+    @property
+    def pending_ticks(self) -> int:
+        return int(self._accum // self.tick_length_s)
+
+    def feed(self, dt: float) -> None:
+        self._accum += float(dt)
+
+    def clear_backlog(self) -> None:
+        """Drop all whole pending ticks, keeping the partial remainder."""
+        self._accum %= self.tick_length_s
+
+    def drain(
+        self,
+        on_tick: Callable[[float], None],
+        *,
+        max_ticks: Optional[int] = None,
+        batch_ticks: int = 50,
+        deadline: Optional[float] = None,
+        on_batch: Optional[Callable[[int], None]] = None,
+        stop: Optional[Callable[[], bool]] = None,
+    ) -> int:
+        """Run pending ticks in batches of ``batch_ticks``; return ticks run.
+
+        Stops once the backlog holds less than a tick, after ``max_ticks``, or
+        when ``time.perf_counter()`` passes ``deadline`` (checked between
+        batches). ``on_batch(ticks)`` runs after every batch, which is where
+        callers settle state such as respawns between batches. ``stop()`` is
+        checked after every tick that called ``on_tick``; once it is true the
+        batch ends on that tick, its remaining ticks stay banked and, unless
+        ``on_batch`` settled things so that ``stop()`` is false again, the
+        drain returns there.
+        """
+
+        batch_ticks = max(1, int(batch_ticks))
+        ran = 0
+        while max_ticks is None or ran < max_ticks:
+            limit = batch_ticks if max_ticks is None else min(batch_ticks, max_ticks - ran)
+            ticks = self._count_ticks(limit)
+            if not ticks:
+                break
+            ticks = self._run_batch(ticks, on_tick, stop)
+            self._take_ticks(ticks)
+            ran += ticks
+            if on_batch is not None:
+                on_batch(ticks)
+            if stop is not None and stop():
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        return ran
+
+    def drain_frame(self, on_tick: Callable[[float], None], **kwargs) -> int:
+        """``drain`` once for a frame, recording the frame's tick count."""
+        ran = self.drain(on_tick, **kwargs)
+        if self.instrumentation is not None:
+            self.instrumentation.record_frame(ran)
+        return ran
+
+    def _count_ticks(self, limit: int) -> int:
+        # What ``_take_ticks(limit)`` would take, without taking it.
+        accum = self._accum
+        ticks = 0
+        while ticks < limit and accum >= self.tick_length_s:
+            accum -= self.tick_length_s
+            ticks += 1
+        return ticks
+
+    def _take_ticks(self, limit: int) -> int:
+        # Repeated subtraction, so draining matches ``update`` exactly.
+        ticks = 0
+        while ticks < limit and self._accum >= self.tick_length_s:
+            self._accum -= self.tick_length_s
+            ticks += 1
+        return ticks
+
+    def _run_batch(
+        self,
+        ticks: int,
+        on_tick: Callable[[float], None],
+        stop: Optional[Callable[[], bool]] = None,
+    ) -> int:
+        """Run up to ``ticks`` ticks; return how many ran before ``stop``."""
+        for ran in range(1, ticks + 1):
+            on_tick(self.tick_length_s)
+            if stop is not None and stop():
+                return ran
+        return ticks
+
     def __str__(self) -> str:
         return (
             "TickController("
@@ -35,25 +197,156 @@ class TickController:
         )
 
 
+class _EnemyTimer:
+    """Lazy attack timer: ``elapsed`` as of ``anchor`` plus idle ticks since."""
+
+    __slots__ = ("index", "anchor", "elapsed", "due")
+
+    def __init__(self, index: int, anchor: int, elapsed: float) -> None:
+        self.index = index
+        self.anchor = anchor
+        self.elapsed = elapsed
+        self.due: Optional[int] = None
+
+
 class CombatSystem:
-    """Coordinates combat ticks between party actors and a single enemy."""
+    """Coordinates combat ticks between party actors and a roster of enemies.
+
+    Actor timers tick every call as before. Enemy timers are lazy: each living
+    enemy sits in a heap keyed by the tick it next attacks on (predicted with
+    ``ticks_until_ready``), so a tick only touches the enemies that actually
+    attack and waves of hundreds of enemies cost no more per tick than one.
+    An enemy's ``attack_state`` is brought up to date when it attacks, dies,
+    or is read through ``enemy``; call ``sync_timers`` before reading the
+    timers of the whole roster. Once an enemy is in the roster the system owns
+    its timer; use ``set_enemies``/``add_enemy`` to change the roster.
+    """
 
     def __init__(
         self,
         actors: Iterable[Character],
-        enemy: Character,
+        enemy: Optional[Character] = None,
         *,
+        enemies: Optional[Iterable[Character]] = None,
         select_actor_target: Optional[Callable[[Character], Optional[Character]]] = None,
         select_enemy_target: Optional[Callable[[Character], Optional[Character]]] = None,
     ) -> None:
         self.actors = list(actors)
-        self.enemy: Character = enemy
+        self.tick_count = 0
+        self._tick_length_s: Optional[float] = None
+        self._in_actor_phase = False
+        self._enemies: List[Character] = []
+        self._timers: Dict[Character, _EnemyTimer] = {}
+        self._due: List[Tuple[int, int]] = []
+        self._idle: Dict[Character, _EnemyTimer] = {}
+        roster = list(enemies) if enemies is not None else []
+        if enemy is not None:
+            roster.insert(0, enemy)
+        self.set_enemies(roster)
         self._select_actor_target = (
             select_actor_target if select_actor_target is not None else self._default_actor_target
         )
         self._select_enemy_target = (
             select_enemy_target if select_enemy_target is not None else self._default_enemy_target
         )
+        # Optional ``(attacker, defender, damage)`` hook, e.g. for recording.
+        self.attack_listener: Optional[Callable[[Character, Character, int], None]] = None
+        # Optional CombatStats; see enable_instrumentation.
+        self.instrumentation: Optional[CombatStats] = None
+
+    def enable_instrumentation(self, stats: Optional[CombatStats] = None) -> CombatStats:
+        """Start collecting counters and timings into ``stats`` (or a new one)."""
+        from core.gameplay.combat.instrumentation import CombatStats
+
+        self.disable_instrumentation()
+        stats = stats if stats is not None else CombatStats()
+        self.instrumentation = stats
+        self._select_actor_target = stats.timed_selector(self._select_actor_target)
+        self._select_enemy_target = stats.timed_selector(self._select_enemy_target)
+        return stats
+
+    def disable_instrumentation(self) -> Optional[CombatStats]:
+        stats = self.instrumentation
+        if stats is None:
+            return None
+        self.instrumentation = None
+        self._select_actor_target = self._select_actor_target.__wrapped__
+        self._select_enemy_target = self._select_enemy_target.__wrapped__
+        return stats
+
+    @property
+    def enemies(self) -> List[Character]:
+        return list(self._enemies)
+
+    @property
+    def enemy(self) -> Optional[Character]:
+        """First living enemy in the roster (or the first one if all are dead)."""
+        for candidate in self._enemies:
+            if not candidate.health.is_dead():
+                self._materialise(candidate)
+                return candidate
+        return self._enemies[0] if self._enemies else None
+
+    @enemy.setter
+    def enemy(self, value: Character) -> None:
+        self.set_enemies([value])
+
+    def set_enemies(self, enemies: Iterable[Character]) -> None:
+        """Replace the roster; timers continue from each enemy's attack state."""
+        self.sync_timers()
+        self._enemies = []
+        self._timers = {}
+        self._due = []
+        self._idle = {}
+        for enemy in enemies:
+            self.add_enemy(enemy)
+
+    def add_enemy(self, enemy: Character) -> None:
+        if enemy in self._timers:
+            return
+        index = len(self._enemies)
+        self._enemies.append(enemy)
+        if enemy.health.is_dead():
+            return
+        timer = _EnemyTimer(index, self._current_tick(), enemy.attack_state.time_since_attack_s)
+        self._timers[enemy] = timer
+        self._schedule(timer)
+
+    def living_enemies(self) -> List[Character]:
+        return [enemy for enemy in self._enemies if not enemy.health.is_dead()]
+
+    def sync_timers(self) -> None:
+        """Bring every tracked enemy's ``attack_state`` up to date."""
+        for enemy in self._timers:
+            self._materialise(enemy)
+
+    def ticks_until_enemy_attack(self, tick_length_s: float, *, include_idle: bool = True) -> Optional[int]:
+        """Ticks from now until the next scheduled enemy attack, if any.
+
+        Enemies that were ready but had no target count as due next tick when
+        ``include_idle`` is set.
+        """
+        self._ensure_tick_length(tick_length_s)
+        if include_idle and self._idle:
+            return 1
+        while self._due:
+            due, index = self._due[0]
+            timer = self._timers.get(self._enemies[index])
+            if timer is None or timer.due != due or timer.index != index:
+                heapq.heappop(self._due)
+                continue
+            return due - self.tick_count
+        return None
+
+    def advance_idle(self, ticks: int, tick_length_s: float) -> None:
+        """Account for ``ticks`` ticks on which no enemy attacks.
+
+        Used by drivers that skip ticks; actor timers are theirs to advance.
+        """
+        if ticks <= 0:
+            return
+        self._ensure_tick_length(tick_length_s)
+        self.tick_count += ticks
 
     def _default_actor_target(self, actor: Character) -> Optional[Character]:
         return self.enemy
@@ -65,30 +358,109 @@ class CombatSystem:
             return actor
         return None
 
-    def on_tick(self, dt: float) -> None:
-        """Advance attack timers and perform basic attacks when ready."""
-        for actor in self.actors:
-            if actor.health.is_dead():
-                continue
-            actor.attack_state.tick(dt)
-            if not actor.attack_state.ready(actor.attack_profile.cooldown_s):
-                continue
-            target = self._select_actor_target(actor)
-            if target is None or target.health.is_dead():
-                continue
-            self.basic_attack(actor, target)
+    def _current_tick(self) -> int:
+        # During the actor phase the enemies have not ticked yet.
+        return self.tick_count - 1 if self._in_actor_phase else self.tick_count
 
-        if self.enemy.health.is_dead():
+    def _ensure_tick_length(self, dt: float) -> None:
+        dt = float(dt)
+        if dt == self._tick_length_s:
             return
+        if self._tick_length_s is not None:
+            self.sync_timers()
+        self._tick_length_s = dt
+        self._due = []
+        for enemy, timer in self._timers.items():
+            timer.due = None
+            if enemy not in self._idle:
+                self._schedule(timer)
 
-        self.enemy.attack_state.tick(dt)
-        if not self.enemy.attack_state.ready(self.enemy.attack_profile.cooldown_s):
+    def _schedule(self, timer: _EnemyTimer) -> None:
+        if self._tick_length_s is None:
             return
+        enemy = self._enemies[timer.index]
+        timer.due = timer.anchor + ticks_until_ready(
+            timer.elapsed,
+            enemy.attack_profile.cooldown_s,
+            self._tick_length_s,
+        )
+        heapq.heappush(self._due, (timer.due, timer.index))
 
-        target = self._select_enemy_target(self.enemy)
-        if target is None or target.health.is_dead():
+    def _materialise(self, enemy: Character) -> None:
+        timer = self._timers.get(enemy)
+        if timer is None:
             return
-        self.basic_attack(self.enemy, target)
+        now = self._current_tick()
+        if self._tick_length_s is not None:
+            timer.elapsed = elapsed_after_ticks(
+                timer.elapsed,
+                now - timer.anchor,
+                enemy.attack_profile.cooldown_s,
+                self._tick_length_s,
+            )
+        timer.anchor = now
+        enemy.attack_state.time_since_attack_s = timer.elapsed
+
+    def _note_defeat(self, defender: Character) -> None:
+        if defender in self._timers and defender.health.is_dead():
+            self._materialise(defender)
+            del self._timers[defender]
+            self._idle.pop(defender, None)
+
+    def _pop_due_enemies(self) -> List[Character]:
+        fired: Dict[int, Character] = {}
+        while self._due and self._due[0][0] <= self.tick_count:
+            due, index = heapq.heappop(self._due)
+            enemy = self._enemies[index]
+            timer = self._timers.get(enemy)
+            if timer is None or timer.due != due:
+                continue
+            timer.due = None
+            fired[index] = enemy
+        for enemy, timer in self._idle.items():
+            fired[timer.index] = enemy
+        self._idle = {}
+        return [fired[index] for index in sorted(fired)]
+
+    def on_tick(self, dt: float) -> None:
+        """Advance attack timers and perform basic attacks when ready."""
+        if self.instrumentation is not None:
+            self.instrumentation.ticks += 1
+        self._ensure_tick_length(dt)
+        self.tick_count += 1
+        self._in_actor_phase = True
+        try:
+            for actor in self.actors:
+                if actor.health.is_dead():
+                    continue
+                actor.attack_state.tick(dt)
+                if not actor.attack_state.ready(actor.attack_profile.cooldown_s):
+                    continue
+                target = self._select_actor_target(actor)
+                if target is None or target.health.is_dead():
+                    continue
+                self.basic_attack(actor, target)
+                self._note_defeat(target)
+        finally:
+            self._in_actor_phase = False
+
+        for enemy in self._pop_due_enemies():
+            timer = self._timers.get(enemy)
+            if timer is None:
+                continue
+            if enemy.health.is_dead():
+                del self._timers[enemy]
+                continue
+            self._materialise(enemy)
+            target = self._select_enemy_target(enemy)
+            if target is None or target.health.is_dead():
+                # Ready but idle: retried on every later tick until it attacks.
+                self._idle[enemy] = timer
+                continue
+            self.basic_attack(enemy, target)
+            timer.anchor = self.tick_count
+            timer.elapsed = enemy.attack_state.time_since_attack_s
+            self._schedule(timer)
 
     def basic_attack(self, attacker: Character, defender: Character) -> int:
         """Compute damage and apply it to defender; grant attacker MP.
@@ -101,12 +473,19 @@ class CombatSystem:
             mana.current = 0
         defender.health.current -= damage
         defender.health.clamp()
+        self._note_defeat(defender)
         if mana is not None:
             mana.current += attacker.attack_profile.mp_gain_on_attack
             mana.clamp()
         attacker.attack_state.reset()
+        if self.attack_listener is not None:
+            self.attack_listener(attacker, defender, damage)
+        if self.instrumentation is not None:
+            self.instrumentation.record_attack(attacker, damage)
         return damage
 
     def __str__(self) -> str:
-        enemy_name = type(self.enemy).__name__
-        return f"CombatSystem(actors={len(self.actors)}, enemy={enemy_name})"
+        return (
+            f"CombatSystem(actors={len(self.actors)}, "
+            f"enemies={len(self.living_enemies())}/{len(self._enemies)})"
+        )
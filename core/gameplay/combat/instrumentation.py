@@ -0,0 +1,125 @@
+"""Opt-in counters and timings for the combat hot path.
+
+``CombatSystem`` and ``TickController`` carry an ``instrumentation``
+attribute that is ``None`` by default; the hot path checks it once and does
+nothing else. Attaching a ``CombatStats`` (see
+``CombatSystem.enable_instrumentation``) starts collecting ticks, attacks,
+damage per attacker, target-selection time, ticks per frame and any named
+sections the caller times. Read the fields directly or ``dump`` them as JSON.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+
+class CombatStats:
+    """Mutable counters shared by a combat system and its tick driver."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.started_at = time.perf_counter()
+        # ``on_tick`` calls; the event-driven scheduler skips idle ticks, so
+        # ``frame_ticks_total`` counts simulated ticks instead.
+        self.ticks = 0
+        self.attacks = 0
+        self.damage_by_attacker: Dict[str, int] = {}
+        self.attacks_by_attacker: Dict[str, int] = {}
+        self.target_selections = 0
+        self.target_selection_s = 0.0
+        self.frames = 0
+        self.frame_ticks_total = 0
+        self.frame_ticks_max = 0
+        self.ticks_per_frame: Counter[int] = Counter()
+        self.sections: Dict[str, Dict[str, float]] = {}
+
+    def record_attack(self, attacker, damage: int) -> None:
+        name = getattr(attacker, "name", type(attacker).__name__)
+        self.attacks += 1
+        self.damage_by_attacker[name] = self.damage_by_attacker.get(name, 0) + damage
+        self.attacks_by_attacker[name] = self.attacks_by_attacker.get(name, 0) + 1
+
+    def record_frame(self, ticks: int) -> None:
+        self.frames += 1
+        self.frame_ticks_total += ticks
+        self.ticks_per_frame[ticks] += 1
+        if ticks > self.frame_ticks_max:
+            self.frame_ticks_max = ticks
+
+    def timed_selector(
+        self,
+        select: Callable[[Any], Optional[T]],
+    ) -> Callable[[Any], Optional[T]]:
+        """Wrap a target selector so its calls are counted and timed."""
+
+        clock = time.perf_counter
+
+        def timed(combatant):
+            start = clock()
+            try:
+                return select(combatant)
+            finally:
+                self.target_selection_s += clock() - start
+                self.target_selections += 1
+
+        timed.__wrapped__ = select  # type: ignore[attr-defined]
+        return timed
+
+    @contextmanager
+    def section(self, name: str) -> Iterator[None]:
+        """Accumulate call count and wall time under ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_section_time(name, time.perf_counter() - start)
+
+    def add_section_time(self, name: str, seconds: float) -> None:
+        entry = self.sections.setdefault(name, {"calls": 0, "total_s": 0.0})
+        entry["calls"] += 1
+        entry["total_s"] += seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self.started_at
+        return {
+            "elapsed_s": elapsed,
+            "ticks": self.ticks,
+            "ticks_per_s": self.ticks / elapsed if elapsed > 0 else 0.0,
+            "attacks": self.attacks,
+            "damage_by_attacker": dict(self.damage_by_attacker),
+            "attacks_by_attacker": dict(self.attacks_by_attacker),
+            "target_selections": self.target_selections,
+            "target_selection_s": self.target_selection_s,
+            "frames": self.frames,
+            "frame_ticks_total": self.frame_ticks_total,
+            "frame_ticks_max": self.frame_ticks_max,
+            "frame_ticks_mean": self.frame_ticks_total / self.frames if self.frames else 0.0,
+            "ticks_per_frame": {str(k): v for k, v in sorted(self.ticks_per_frame.items())},
+            "sections": {name: dict(entry) for name, entry in self.sections.items()},
+        }
+
+    def dump(self, path: str | os.PathLike[str]) -> Path:
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        return target
+
+    def __str__(self) -> str:
+        return (
+            f"CombatStats(ticks={self.ticks}, attacks={self.attacks}, "
+            f"frames={self.frames}, select={self.target_selection_s * 1000:.1f}ms)"
+        )
+
+
+__all__ = ["CombatStats"]
@@ -0,0 +1,159 @@
+"""Event-driven combat driver that skips the ticks where nobody attacks."""
+
+from __future__ import annotations
+
+import heapq
+from typing import Callable, List, Optional, Tuple, TYPE_CHECKING
+
+from core.gameplay.combat import CombatSystem, TickController, elapsed_after_ticks, ticks_until_ready
+
+
+if TYPE_CHECKING:
+    from core.entities.character import Character
+
+
+class AttackScheduler(TickController):
+    """Drop-in replacement for ``TickController`` driving a ``CombatSystem``.
+
+    Instead of calling ``on_tick`` for every elapsed tick, the scheduler keeps
+    a priority queue of the tick each living actor will next attack on
+    (derived from ``AttackProfile.cooldown_s``) and asks the combat system
+    when its next enemy attack is due. Idle ticks are applied to the attack
+    timers in bulk and ``on_tick`` only runs on ticks where an attack is due,
+    so the fight plays out exactly as with polling.
+
+    While a living actor attacks on every tick (cooldown at or below the
+    tick length) there are no idle ticks to skip, and the queue only adds
+    overhead, so such runs call ``on_tick`` for every tick as
+    ``TickController`` does.
+
+    Combat state is re-read at the start of every ``update``; anything that
+    changes combatants between frames (respawns, revives, manual attacks) is
+    picked up automatically. Within one ``update`` targets can only die, so a
+    combatant that is ready but has no target stays idle until the next call.
+    """
+
+    def __init__(self, combat: CombatSystem, tick_length_s: float = 0.2) -> None:
+        super().__init__(tick_length_s)
+        self.combat = combat
+        self.ticks_processed = 0
+        self.events_processed = 0
+
+    def update(self, dt: float, on_tick: Callable[[float], None]) -> None:
+        self._accum += float(dt)
+        # Count by repeated subtraction like ``TickController.update``; floor
+        # division rounds differently (``10.0 // 0.2 == 49.0``).
+        ticks = self._take_ticks(1 << 62)
+        if ticks:
+            self._run(ticks, on_tick)
+        if self.instrumentation is not None:
+            self.instrumentation.record_frame(ticks)
+
+    def _run_batch(
+        self,
+        ticks: int,
+        on_tick: Callable[[float], None],
+        stop: Optional[Callable[[], bool]] = None,
+    ) -> int:
+        return self._run(ticks, on_tick, stop)
+
+    def _run(
+        self,
+        ticks: int,
+        on_tick: Callable[[float], None],
+        stop: Optional[Callable[[], bool]] = None,
+    ) -> int:
+        dt = self.tick_length_s
+        combat = self.combat
+        actors = list(combat.actors)
+        if any(
+            not actor.health.is_dead() and actor.attack_profile.cooldown_s <= dt
+            for actor in actors
+        ):
+            ran = super()._run_batch(ticks, on_tick, stop)
+            self.events_processed += ran
+            self.ticks_processed += ran
+            return ran
+        queue: List[Tuple[int, int]] = []
+        for order, actor in enumerate(actors):
+            if actor.health.is_dead():
+                continue
+            due = ticks_until_ready(
+                actor.attack_state.time_since_attack_s,
+                actor.attack_profile.cooldown_s,
+                dt,
+            )
+            queue.append((due, order))
+        heapq.heapify(queue)
+
+        now = 0
+        # Idle enemies get one retry per update; targets only die within it.
+        include_idle = True
+        while True:
+            due = queue[0][0] if queue else None
+            enemy_due = combat.ticks_until_enemy_attack(dt, include_idle=include_idle)
+            if enemy_due is not None:
+                enemy_due += now
+                due = enemy_due if due is None else min(due, enemy_due)
+            if due is None or due > ticks:
+                break
+            fired: List[int] = []
+            while queue and queue[0][0] == due:
+                _, order = heapq.heappop(queue)
+                if not actors[order].health.is_dead():
+                    fired.append(order)
+            if not fired and enemy_due != due:
+                continue
+            self._skip(actors, due - 1 - now)
+            on_tick(dt)
+            self.events_processed += 1
+            include_idle = False
+            now = due
+            if stop is not None and stop():
+                self.ticks_processed += now
+                return now
+            for order in fired:
+                actor = actors[order]
+                if actor.health.is_dead():
+                    continue
+                if actor.attack_state.time_since_attack_s != 0.0:
+                    # Ready without a target; it cannot gain one this update.
+                    continue
+                next_due = now + ticks_until_ready(
+                    0.0,
+                    actor.attack_profile.cooldown_s,
+                    dt,
+                )
+                heapq.heappush(queue, (next_due, order))
+
+        self._skip(actors, ticks - now)
+        self.ticks_processed += ticks
+        return ticks
+
+    def _skip(self, actors: List[Character], ticks: int) -> None:
+        """Apply ``ticks`` idle ticks to the actors and the enemy roster."""
+
+        if ticks <= 0:
+            return
+        dt = self.tick_length_s
+        self.combat.advance_idle(ticks, dt)
+        for actor in actors:
+            if actor.health.is_dead():
+                continue
+            state = actor.attack_state
+            state.time_since_attack_s = elapsed_after_ticks(
+                state.time_since_attack_s,
+                ticks,
+                actor.attack_profile.cooldown_s,
+                dt,
+            )
+
+    def __str__(self) -> str:
+        return (
+            "AttackScheduler("
+            f"dt={self.tick_length_s}s, accum={self._accum:.3f}, "
+            f"events={self.events_processed}/{self.ticks_processed})"
+        )
+
+
+__all__ = ["AttackScheduler"]
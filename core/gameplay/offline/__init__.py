@@ -0,0 +1,274 @@
+"""Closed-form offline progress for time spent away from the game.
+
+Rates are derived from the party's stats and cooldowns, ``calc_damage`` and
+the templates of the location's encounter pool, so projecting any amount of
+elapsed time is constant work instead of a replay of every combat tick.
+
+Model notes:
+
+* Waves of ``MIN_WAVE_SIZE``-``MAX_WAVE_SIZE`` enemies are drawn uniformly
+  from the pool. The party focuses one enemy at a time while every living
+  enemy of the wave attacks (as ``CombatSystem``'s default targeting does).
+* Attacks land every ``ticks_until_ready`` ticks, MP bursts add
+  ``magic_damage`` once per ``ceil(mp_max / mp_gain)`` attacks, and each
+  kill costs whole hits: the killing blow's overkill is lost.
+* Enemies hit the first living party member; each knockout benches that
+  member for ``KO_REVIVE_S``. Uptime is the share of the party still
+  fighting: ``1 - members down / party size`` while knockouts are spread
+  out, or, once the party is overwhelmed, the share of each revive cycle a
+  lone member survives the idle enemies' opening volley. Whichever is
+  higher applies; a party that never survives a volley makes no progress.
+* Stat growth from level-ups is ignored, so projections err on the low side.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Dict, List, Sequence, TYPE_CHECKING
+
+from core.data.encounters import DEFAULT_ENCOUNTER_POOLS, MAX_WAVE_SIZE, MIN_WAVE_SIZE, EncounterPool
+from core.data.locations import get_location
+from core.entities import Actor, Enemy
+from core.gameplay.combat import KO_REVIVE_S, ticks_until_ready
+from core.gameplay.damage import calc_damage
+
+
+if TYPE_CHECKING:
+    from core.data.savegame import GameState
+
+
+DEFAULT_TICK_LENGTH_S = 0.2
+
+
+@dataclass
+class OfflineRates:
+    """Expected steady-state farming rates for a party at one location."""
+
+    seconds_per_kill: float
+    kills_per_s: float
+    xp_per_s: float
+    munny_per_s: float
+    damage_taken_per_s: float
+    uptime: float
+    materials_per_s: Dict[str, float] = field(default_factory=dict)
+    items_per_s: Dict[str, float] = field(default_factory=dict)
+    # Seconds to kill each of the ``enemies`` passed in, in order.
+    enemy_kill_s: List[float] = field(default_factory=list)
+
+
+@dataclass
+class OfflineReport:
+    """Rewards granted (or projected) for a stretch of offline time."""
+
+    elapsed_s: float = 0.0
+    simulated_s: float = 0.0
+    kills: int = 0
+    xp: int = 0
+    munny: int = 0
+    materials: Dict[str, int] = field(default_factory=dict)
+    items: Dict[str, int] = field(default_factory=dict)
+    levels_gained: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def capped(self) -> bool:
+        return self.simulated_s < self.elapsed_s
+
+    def describe(self) -> str:
+        if not self.kills:
+            return "No offline progress."
+        minutes = int(self.simulated_s // 60)
+        return (
+            f"Offline {minutes}m: {self.kills} kills, "
+            f"+{self.xp} XP, +{self.munny} munny"
+        )
+
+
+def _attack_period_s(character, tick_length_s: float) -> float:
+    ticks = ticks_until_ready(0.0, character.attack_profile.cooldown_s, tick_length_s)
+    return ticks * tick_length_s
+
+
+def _burst_bonus_per_attack(actor) -> float:
+    mana = getattr(actor, "mana", None)
+    if mana is None:
+        return 0.0
+    magic = float(getattr(actor, "magic_damage", 0))
+    if mana.max <= 0:
+        return magic
+    gain = actor.attack_profile.mp_gain_on_attack
+    if gain <= 0:
+        return 0.0
+    return magic / math.ceil(mana.max / gain)
+
+
+def _actor_dps(actor, enemy: Enemy, tick_length_s: float) -> float:
+    damage = calc_damage(actor.stats.atk, enemy.stats.defense)
+    damage += _burst_bonus_per_attack(actor)
+    return damage / _attack_period_s(actor, tick_length_s)
+
+
+def _kill_s(party: Sequence[Actor], enemy: Enemy, tick_length_s: float) -> float:
+    # Overkill of the killing blow, averaged over who lands it.
+    hp = enemy.health.max
+    rates = [1.0 / _attack_period_s(actor, tick_length_s) for actor in party]
+    overkill = 0.0
+    for actor, rate in zip(party, rates):
+        hit = calc_damage(actor.stats.atk, enemy.stats.defense)
+        overkill += rate * (math.ceil(hp / hit) * hit - hp)
+    party_dps = sum(_actor_dps(actor, enemy, tick_length_s) for actor in party)
+    return (hp + overkill / sum(rates)) / party_dps
+
+
+def estimate_rates(
+    actors: Sequence[Actor],
+    enemies: Sequence[Enemy],
+    *,
+    tick_length_s: float = DEFAULT_TICK_LENGTH_S,
+) -> OfflineRates | None:
+    """Return expected farming rates, or ``None`` if no kills are possible."""
+
+    party = [actor for actor in actors if not actor.health.is_dead()]
+    if not party or not enemies:
+        return None
+    front = party[0]
+    count = len(enemies)
+
+    kill_times = [_kill_s(party, enemy, tick_length_s) for enemy in enemies]
+    hits = [calc_damage(enemy.stats.atk, front.stats.defense) for enemy in enemies]
+    enemy_dps = [hit / _attack_period_s(enemy, tick_length_s) for hit, enemy in zip(hits, enemies)]
+    mean_kill_s = sum(kill_times) / count
+    mean_dps = sum(enemy_dps) / count
+    mean_hit = sum(hits) / count
+
+    # While the k-th enemy of a wave is fought, it and every enemy after it
+    # attack. Over wave sizes w: E[w] own-kill terms and E[w(w-1)/2] pairs.
+    sizes = range(MIN_WAVE_SIZE, MAX_WAVE_SIZE + 1)
+    mean_size = sum(sizes) / len(sizes)
+    mean_pairs = sum(size * (size - 1) / 2 for size in sizes) / len(sizes)
+    own = sum(t * d for t, d in zip(kill_times, enemy_dps)) / count
+    damage_per_s = (mean_size * own + mean_pairs * mean_kill_s * mean_dps) / (mean_size * mean_kill_s)
+
+    # Members down on average (knockouts per second times KO_REVIVE_S).
+    avg_hp = sum(actor.health.max for actor in party) / len(party)
+    down = damage_per_s / avg_hp * KO_REVIVE_S
+    # Overwhelmed: members fall one by one and each revive first takes a
+    # volley from every idle enemy (damage_per_s / mean_dps of them).
+    volley = damage_per_s / mean_dps * mean_hit if mean_dps > 0 else 0.0
+    alive_s = max(0.0, avg_hp - volley) / damage_per_s if damage_per_s > 0 else math.inf
+    lone = 1.0 if math.isinf(alive_s) else alive_s / (alive_s + KO_REVIVE_S)
+    uptime = max(1.0 - down / len(party), lone)
+    if uptime <= 0.0:
+        return None
+
+    cycle_s = mean_kill_s / uptime
+    materials: Dict[str, float] = defaultdict(float)
+    items: Dict[str, float] = defaultdict(float)
+    for enemy in enemies:
+        for drop in enemy.drops:
+            chance = float(drop.get("chance", 1.0))
+            if drop.get("item_id"):
+                items[drop["item_id"]] += chance
+            elif drop.get("material_id"):
+                amount = int(drop.get("amount", 1) or 1)
+                materials[drop["material_id"]] += chance * amount
+    # A kill takes ``cycle_s``; rewards average over the pool.
+    per_kill_s = cycle_s * count
+    return OfflineRates(
+        seconds_per_kill=cycle_s,
+        kills_per_s=1.0 / cycle_s,
+        xp_per_s=sum(e.xp_reward for e in enemies) / per_kill_s,
+        munny_per_s=sum(max(0, int(e.munny_reward or 0)) for e in enemies) / per_kill_s,
+        damage_taken_per_s=damage_per_s,
+        uptime=uptime,
+        materials_per_s={key: value / per_kill_s for key, value in materials.items()},
+        items_per_s={key: value / per_kill_s for key, value in items.items()},
+        enemy_kill_s=[t / uptime for t in kill_times],
+    )
+
+
+def project_rewards(rates: OfflineRates | None, elapsed_s: float) -> OfflineReport:
+    """Expected (floored) rewards for ``elapsed_s`` seconds at ``rates``."""
+
+    elapsed_s = max(0.0, float(elapsed_s))
+    report = OfflineReport(elapsed_s=elapsed_s)
+    if rates is None:
+        return report
+    report.simulated_s = elapsed_s
+    report.kills = int(rates.kills_per_s * elapsed_s)
+    report.xp = int(rates.xp_per_s * elapsed_s)
+    report.munny = int(rates.munny_per_s * elapsed_s)
+    for material_id, rate in rates.materials_per_s.items():
+        amount = int(rate * elapsed_s)
+        if amount > 0:
+            report.materials[material_id] = amount
+    for item_id, rate in rates.items_per_s.items():
+        amount = int(rate * elapsed_s)
+        if amount > 0:
+            report.items[item_id] = amount
+    return report
+
+
+def location_enemies(location_id: str) -> List[Enemy]:
+    location = get_location(location_id)
+    pool = EncounterPool(DEFAULT_ENCOUNTER_POOLS, default_pool=location.encounter_pool)
+    return pool.pool_enemies()
+
+
+def apply_offline_progress(
+    state: GameState,
+    *,
+    now: datetime | None = None,
+    tick_length_s: float = DEFAULT_TICK_LENGTH_S,
+) -> OfflineReport:
+    """Grant the rewards earned since ``state.updated_at`` to ``state``."""
+
+    if state.updated_at is None:
+        return OfflineReport()
+    now = now or datetime.now(UTC)
+    elapsed_s = (now - state.updated_at).total_seconds()
+    if elapsed_s <= 0:
+        return OfflineReport()
+    try:
+        enemies = location_enemies(state.location_id)
+    except (KeyError, ValueError):
+        return OfflineReport(elapsed_s=elapsed_s)
+    rates = estimate_rates(state.actors, enemies, tick_length_s=tick_length_s)
+    report = project_rewards(rates, elapsed_s)
+
+    inventory = state.inventory
+    if report.munny:
+        inventory.add_munny(report.munny)
+    for material_id, amount in report.materials.items():
+        try:
+            inventory.add_material(material_id, amount)
+        except (KeyError, ValueError):
+            continue
+    granted_items: Dict[str, int] = {}
+    for item_id, amount in report.items.items():
+        for _ in range(amount):
+            try:
+                inventory.add_item(item_id)
+            except (KeyError, ValueError):
+                break
+            granted_items[item_id] = granted_items.get(item_id, 0) + 1
+    report.items = granted_items
+    if report.xp:
+        for actor in state.actors:
+            level = actor.level
+            actor.gain_xp(report.xp)
+            if actor.level > level:
+                report.levels_gained[actor.name] = actor.level - level
+    return report
+
+
+__all__ = [
+    "OfflineRates",
+    "OfflineReport",
+    "estimate_rates",
+    "project_rewards",
+    "location_enemies",
+    "apply_offline_progress",
+]
@@ -1,12 +1,20 @@
-import os
+import math
 import random
+import time
 from datetime import datetime
-from typing import Iterable
+from typing import Callable, Iterable, Mapping, NamedTuple, Sequence
 
 import pygame
 
-from core.gameplay.combat import CombatSystem, TickController
-from core.data.encounters import DEFAULT_ENCOUNTER_POOLS, EncounterPool
+from core.gameplay.combat import KO_EPSILON_S, KO_REVIVE_S, CombatSystem, TickController
+from core.gameplay.combat.scheduler import AttackScheduler
+from core.data.encounters import (
+    DEFAULT_ENCOUNTER_POOLS,
+    MAX_WAVE_SIZE,
+    MIN_WAVE_SIZE,
+    EncounterPool,
+    roll_drops,
+)
 from core.entities import Actor, Enemy
 from core.gameplay.inventory import Inventory
 from core.data.items import get_item
@@ -14,6 +22,7 @@ from core.data.locations import DEFAULT_LOCATION_ID, get_location
 from core.scenes.scene import Manager, Scene
 from core.data.spells import spell_ids
 from core.data.savegame import GameState, save_state
+from core.systems.assets import PORTRAIT_SIZE, default_assets
 from core.systems.render import RenderSystem
 from core.ui.actionbar import ActionBar
 from core.ui.battle_hud import BattleHUD
@@ -22,9 +31,44 @@ from core.scenes.inventory_scene import InventoryScene
 from core.scenes.board import HexBoard
 from core.scenes.synthesis_scene import SynthesisScene
 from core.scenes.item_level_scene import ItemLevelScene
+from core.systems.recording import SIDE_ACTOR, SIDE_ENEMY, CombatLog, CommandKind
+from core.systems.simulation import (
+    BattleSnapshot,
+    CombatantView,
+    SimulationThread,
+    frozen_mapping,
+)
+from core.ui.text_cache import render_text
+
+
+class _Frame(NamedTuple):
+    """Values one battle frame is drawn from: live state or a sim snapshot."""
+
+    munny: int
+    actors: Sequence
+    ko_timers: Mapping
+    board: Mapping
+    save_message: str | None
+    time_scale: float
+    sim_backlog_s: float
+    hp_of: Callable[[object], float]
 
 
 class BattleScene(Scene):
+    TIME_SCALES = (1.0, 2.0, 5.0, 10.0, 100.0, 1000.0)
+    # Wall-clock seconds per frame the accelerated sim may use.
+    SIM_BUDGET_S = 0.008
+    # Most ticks run between two settles; kills, knockouts and revives end a
+    # batch early, so this only bounds how often the deadline is checked.
+    SIM_BATCH_TICKS = 25
+    # Default for ``threaded``: run combat on a SimulationThread.
+    THREADED_SIM = False
+    # Size of the surface battles draw into, if known before the first draw
+    # (``run_game`` sets it); backgrounds are prefetched at this size.
+    DRAW_SIZE: tuple[int, int] | None = None
+    # More changed regions than this in one frame repaint the whole screen.
+    MAX_DIRTY_RECTS = 16
+
     def __init__(
         self,
         font,
@@ -36,8 +80,14 @@ class BattleScene(Scene):
         save_slot: str | None = None,
         save_created_at: datetime | None = None,
         save_updated_at: datetime | None = None,
+        event_driven: bool = False,
+        seed: int | None = None,
+        recorder: CombatLog | None = None,
+        threaded: bool | None = None,
     ):
         self.font = font
+        self.seed = seed
+        self.recorder = recorder
         self.controller = controller
         self.save_slot = save_slot
         self._save_created_at = save_created_at
@@ -60,6 +110,7 @@ class BattleScene(Scene):
         self.encounter_pool = EncounterPool(
             DEFAULT_ENCOUNTER_POOLS,
             default_pool=location.encounter_pool,
+            rng=self._seeded_rng("encounters"),
         )
         if inventory is not None:
             self.inventory = inventory
@@ -78,25 +129,40 @@ class BattleScene(Scene):
             actor.health.clamp()
         self.actor_positions: dict[Actor, tuple[int, int]] = {}
         self._assign_actor_slots()
-        self.actor_portraits = [
-            self._load_portrait(actor.portrait_path)
-            for actor in self.actors
-        ]
+        # Decoded on the asset worker; placeholders until then (see draw).
+        self.assets = default_assets()
+        for actor in self.actors:
+            self.assets.request(actor.portrait_path, PORTRAIT_SIZE)
+        self._draw_size = self.DRAW_SIZE
+        self.assets.prefetch_location(self.location_id, self._draw_size)
+        self._portraits_generation: int | None = None
+        self.actor_portraits: list[pygame.Surface] = []
+        self._refresh_portraits()
         self.enemies: list[Enemy] = []
-        self.enemy_positions: dict[Enemy, tuple[int, int] | None] = {}
         self.board: HexBoard | None = None
         self._recent_drop_messages: list[str] = []
-        self._rng = random.Random()
+        # Board placement depends on when the board is first drawn, so it
+        # gets its own stream to keep wave and drop rolls reproducible.
+        self._rng = self._seeded_rng("battle")
+        self._placement_rng = self._seeded_rng("placement")
+        self._enemy_serials: dict[Enemy, int] = {}
+        self._next_enemy_serial = 0
         self.available_spells = spell_ids()
         self._ko_timers: dict[Actor, float] = {}
         self._ko_mana: dict[Actor, int] = {}
+        # Set when a kill or knockout needs settling before the next tick.
+        self._settle_due = False
+        self._new_knockouts: set[Actor] = set()
+        # HP at the start of the latest sim step, for interpolated bars.
+        self._hp_previous: dict[object, int] = {}
+        self._alpha = 1.0
         self._spawn_wave()
         current_enemy = self._current_enemy()
         if current_enemy is None:
             raise RuntimeError("Encounter pool did not provide any enemies")
         self.cs = CombatSystem(
             self.actors,
-            current_enemy,
+            enemies=self.enemies,
             select_actor_target=self._closest_enemy_for,
             select_enemy_target=self._closest_actor_for,
         )
@@ -110,24 +176,220 @@ class BattleScene(Scene):
             return damage
 
         self.cs.basic_attack = wrapped_basic_attack
-        self.tc = TickController(0.2)
+        if self.recorder is not None:
+            self.cs.attack_listener = self._record_attack
+        self.event_driven = event_driven
+        self.tc = self._build_tick_driver()
+        self.time_scale = 1.0
         self.action_bar = ActionBar(
             font=self.font,
-            on_attack=self._handle_action_attack,
-            on_spell_assign=self._assign_spell_to_actor,
+            on_attack=lambda: self._command(self._handle_action_attack),
+            on_spell_assign=lambda index, spell_id: self._command(
+                self._assign_spell_to_actor, index, spell_id
+            ),
             get_party=lambda: self.actors,
             get_spells=self._spells_for_actor,
         )
         self.hud = BattleHUD(self.font, action_bar=self.action_bar)
+        # In threaded mode the sim thread owns combat, board occupancy and
+        # rewards; the main thread draws ``sim_thread.latest`` and sends
+        # every state change through ``_command``.
+        self.threaded = self.THREADED_SIM if threaded is None else bool(threaded)
+        self._requested_board_size: tuple[int, int] | None = None
+        self._drawn_signature: dict | None = None
+        self.sim_thread: SimulationThread | None = None
+        if self.threaded:
+            self.sim_thread = SimulationThread(
+                self._sim_step,
+                self.snapshot,
+                step_s=Manager.SIM_STEP_S,
+                name="battle-sim",
+            )
+
 
+    def _seeded_rng(self, stream: str) -> random.Random:
+        if self.seed is None:
+            return random.Random()
+        return random.Random(f"{self.seed}/{stream}")
+
+    def _combatant_ref(self, combatant) -> tuple[int, int]:
+        if isinstance(combatant, Enemy):
+            return SIDE_ENEMY, self._enemy_serials.get(combatant, 0)
+        try:
+            return SIDE_ACTOR, self.actors.index(combatant)
+        except ValueError:
+            return SIDE_ACTOR, 0
+
+    def _record_attack(self, attacker, defender, damage: int) -> None:
+        self.recorder.attack(
+            self._combatant_ref(attacker),
+            self._combatant_ref(defender),
+            damage,
+            defender.health.current,
+        )
+
+    def record_state(self) -> None:
+        """Write a snapshot of munny and party stats to the recorder."""
+        if self.recorder is None:
+            return
+        self.recorder.state(
+            self.inventory.munny,
+            [
+                (
+                    actor.health.current,
+                    actor.mana.current if hasattr(actor, "mana") else 0,
+                    actor.xp,
+                    actor.level,
+                )
+                for actor in self.actors
+            ],
+        )
 
-    @staticmethod
-    def _hex_distance(a: tuple[int, int], b: tuple[int, int]) -> int:
-        aq, ar = a
-        bq, br = b
-        dq = bq - aq
-        dr = br - ar
-        return (abs(dq) + abs(dq + dr) + abs(dr)) // 2
+    def finish_recording(self) -> None:
+        """Snapshot the final state and close the recorder, if any."""
+        if self.recorder is None:
+            return
+        self.pause_simulation()
+        self.record_state()
+        recorder, self.recorder = self.recorder, None
+        self.cs.attack_listener = None
+        recorder.close()
+
+    def _build_tick_driver(self) -> TickController:
+        if self.event_driven:
+            return AttackScheduler(self.cs, 0.2)
+        return TickController(0.2)
+
+    def set_event_driven(self, enabled: bool) -> None:
+        """Switch between polled ticks and the event-driven attack scheduler."""
+        if enabled == self.event_driven:
+            return
+        self.event_driven = enabled
+        backlog = self.tc.backlog_s
+        stats = self.tc.instrumentation
+        self.tc = self._build_tick_driver()
+        self.tc.feed(backlog)
+        self.tc.instrumentation = stats
+
+    @property
+    def instrumentation(self):
+        return self.cs.instrumentation
+
+    def enable_instrumentation(self):
+        """Collect combat counters/timings (see ``CombatStats``)."""
+        stats = self.cs.enable_instrumentation()
+        self.tc.instrumentation = stats
+        return stats
+
+    def disable_instrumentation(self):
+        self.tc.instrumentation = None
+        return self.cs.disable_instrumentation()
+
+    def toggle_instrumentation(self, dump_path: str = "combat_stats.json") -> None:
+        if self.instrumentation is None:
+            self.enable_instrumentation()
+            self._set_save_feedback("Combat stats: recording")
+            return
+        stats = self.disable_instrumentation()
+        try:
+            path = stats.dump(dump_path)
+        except OSError as exc:  # pragma: no cover - log branch
+            print(f"[Stats] Failed to write {dump_path}: {exc}")
+            self._set_save_feedback("Combat stats: dump failed")
+            return
+        self._set_save_feedback(f"Combat stats written to {path}")
+
+    def set_time_scale(self, scale: float) -> None:
+        """Run the simulation ``scale`` times faster than real time.
+
+        Recordings replay frame by frame at 1x, so scaling is unavailable
+        while a recorder is attached.
+        """
+        if self.recorder is not None:
+            self._set_save_feedback("Speed is locked while recording.")
+            return
+        scale = min(max(float(scale), 1.0), self.TIME_SCALES[-1])
+        if scale == self.time_scale:
+            return
+        self.time_scale = scale
+        if scale == 1.0:
+            # Back to real time: forget what acceleration could not keep up with.
+            self.tc.clear_backlog()
+        self._set_save_feedback(f"Speed x{scale:g}")
+
+    def step_time_scale(self, direction: int) -> None:
+        scales = self.TIME_SCALES
+        index = min(
+            range(len(scales)),
+            key=lambda i: abs(scales[i] - self.time_scale),
+        )
+        index = min(max(index + direction, 0), len(scales) - 1)
+        self.set_time_scale(scales[index])
+
+    def queue_sim_time(self, seconds: float) -> None:
+        """Bank ``seconds`` of simulated time to be worked off in batches."""
+        if seconds > 0:
+            self.tc.feed(seconds)
+
+    @property
+    def sim_backlog_s(self) -> float:
+        return self.tc.backlog_s
+
+    def _run_accelerated(self, dt: float) -> None:
+        self._run_ticks(dt * self.time_scale, deadline=time.perf_counter() + self.SIM_BUDGET_S)
+
+    def _run_ticks(self, sim_dt: float, *, deadline: float | None = None) -> None:
+        """Feed ``sim_dt`` to the tick driver and run the whole ticks it covers.
+
+        A batch ends on the tick an enemy dies or a party member is knocked
+        out, and before the tick a knocked-out member revives on, so kills,
+        respawns and revives land on the same ticks at any time scale.
+        """
+        tick_length = self.tc.tick_length_s
+        stats = self.cs.instrumentation
+
+        def settle(ticks: int) -> None:
+            start = time.perf_counter() if stats is not None else 0.0
+            self._settle_due = False
+            # Members knocked out on this batch's last tick start from there.
+            self._update_ko_timers(ticks * tick_length, skip=self._new_knockouts)
+            self._new_knockouts.clear()
+            self._handle_defeated_enemies()
+            if self._current_enemy() is None:
+                self._spawn_wave()
+            if stats is not None:
+                stats.add_section_time("battle.settle", time.perf_counter() - start)
+
+        settle(0)
+        if self._current_enemy() is None:
+            return
+        self.tc.feed(sim_dt)
+        ran = 0
+        while True:
+            batch = min(self.SIM_BATCH_TICKS, self._ticks_until_revive(tick_length))
+            ticks = self.tc.drain(
+                self.cs.on_tick,
+                max_ticks=batch,
+                batch_ticks=batch,
+                stop=self._settle_requested,
+            )
+            if not ticks:
+                break
+            ran += ticks
+            settle(ticks)
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        if self.tc.instrumentation is not None:
+            self.tc.instrumentation.record_frame(ran)
+
+    def _settle_requested(self) -> bool:
+        return self._settle_due
+
+    def _ticks_until_revive(self, tick_length: float) -> int:
+        if not self._ko_timers:
+            return self.SIM_BATCH_TICKS
+        remaining = min(self._ko_timers.values())
+        return max(1, math.ceil(remaining / tick_length - KO_EPSILON_S))
 
     def _assign_actor_slots(self) -> None:
         slot_spacing = 2
@@ -138,58 +400,38 @@ class BattleScene(Scene):
 
     def _closest_enemy_for(self, actor: Actor) -> Enemy | None:
         actor_coord = self.actor_positions.get(actor)
-        if not actor_coord:
+        if not actor_coord or self.board is None:
             return None
-
-        closest_enemy: Enemy | None = None
-        closest_dist: int | None = None
-
-        for enemy in self.enemies:
-            if enemy.health.is_dead():
-                continue
-            enemy_coord = self.enemy_positions.get(enemy)
-            if not enemy_coord:
-                continue
-            distance = self._hex_distance(actor_coord, enemy_coord)
-            if closest_dist is None or distance < closest_dist:
-                closest_dist = distance
-                closest_enemy = enemy
-
-        return closest_enemy
+        return self.board.targeting.nearest_occupant(actor_coord)
 
     def _closest_actor_for(self, enemy: Enemy) -> Actor | None:
-        enemy_coord = self.enemy_positions.get(enemy)
-        if not enemy_coord:
+        if self.board is None:
             return None
-
-        closest_actor: Actor | None = None
-        closest_dist: int | None = None
-
-        for actor, coord in self.actor_positions.items():
-            if actor.health.is_dead():
-                continue
-            distance = self._hex_distance(coord, enemy_coord)
-            if closest_dist is None or distance < closest_dist:
-                closest_dist = distance
-                closest_actor = actor
-
-        return closest_actor
+        enemy_coord = self.board.position_of(enemy)
+        if enemy_coord is None:
+            return None
+        return self.board.targeting.nearest_unit(enemy_coord)
 
     def _handle_post_attack(self, attacker, defender) -> None:
+        if defender.health.is_dead():
+            self._settle_due = True
         if isinstance(defender, Actor) and defender.health.is_dead():
             if defender not in self._ko_timers:
-                self._ko_timers[defender] = 5.0
+                self._ko_timers[defender] = KO_REVIVE_S
+                self._new_knockouts.add(defender)
                 if hasattr(defender, "mana"):
                     self._ko_mana[defender] = defender.mana.current
                 defender.attack_state.reset()
 
-    def _update_ko_timers(self, dt: float) -> None:
+    def _update_ko_timers(self, dt: float, *, skip: Iterable[Actor] = ()) -> None:
         if not self._ko_timers:
             return
         finished: list[Actor] = []
         for actor, remaining in list(self._ko_timers.items()):
+            if actor in skip:
+                continue
             remaining -= dt
-            if remaining <= 0:
+            if remaining <= KO_EPSILON_S:
                 finished.append(actor)
             else:
                 self._ko_timers[actor] = remaining
@@ -230,6 +472,8 @@ class BattleScene(Scene):
         if location_id == self.location_id:
             self.controller.pop()
             return
+        self.finish_recording()
+        self.close()
         new_scene = BattleScene(
             self.font,
             controller=self.controller,
@@ -239,13 +483,20 @@ class BattleScene(Scene):
             save_slot=self.save_slot,
             save_created_at=self._save_created_at,
             save_updated_at=self._save_updated_at,
+            event_driven=self.event_driven,
+            threaded=self.threaded,
         )
+        new_scene.time_scale = self.time_scale
         self.controller.replace(new_scene)
 
     def _set_save_feedback(self, message: str, duration: float = 2.0) -> None:
         self._save_message = message
         self._save_message_timer = max(0.0, float(duration))
 
+    def show_message(self, message: str, duration: float = 2.0) -> None:
+        """Show a transient message in the save feedback area."""
+        self._set_save_feedback(message, duration)
+
     def _build_game_state(self) -> GameState:
         if not self.save_slot:
             raise ValueError("Save slot is not assigned for this battle")
@@ -287,9 +538,13 @@ class BattleScene(Scene):
         next_id = self.available_spells[
             (current_idx + 1) % len(self.available_spells)
         ]
+        if self.recorder is not None:
+            self.recorder.command(CommandKind.CYCLE_SPELL, actor_index)
         actor.set_spell(next_id)
 
     def _handle_action_attack(self) -> None:
+        if self.recorder is not None:
+            self.recorder.command(CommandKind.ATTACK)
         for actor in self.actors:
             if actor.health.is_dead():
                 continue
@@ -302,6 +557,8 @@ class BattleScene(Scene):
     def _assign_spell_to_actor(self, actor_index: int, spell_id: str) -> None:
         if not (0 <= actor_index < len(self.actors)):
             return
+        if self.recorder is not None:
+            self.recorder.command(CommandKind.ASSIGN_SPELL, actor_index, spell_id)
         actor = self.actors[actor_index]
         actor.set_spell(spell_id)
 
@@ -311,13 +568,20 @@ class BattleScene(Scene):
     def _spawn_wave(self, *, count: int | None = None) -> None:
         self._clear_board_enemies()
         self.enemies.clear()
-        self.enemy_positions.clear()
-        wave_size = count if count is not None else self._rng.randint(2, 4)
+        wave_size = count if count is not None else self._rng.randint(MIN_WAVE_SIZE, MAX_WAVE_SIZE)
         wave_size = max(1, min(wave_size, self.board.cols * self.board.rows if self.board else wave_size))
         for _ in range(wave_size):
             enemy = self.encounter_pool.next_enemy()
+            self._next_enemy_serial += 1
+            self._enemy_serials[enemy] = self._next_enemy_serial
+            if self.recorder is not None:
+                self.recorder.spawn(
+                    self._next_enemy_serial,
+                    enemy.name,
+                    enemy.level,
+                    enemy.health.current,
+                )
             self.enemies.append(enemy)
-            self.enemy_positions[enemy] = None
         self._recent_drop_messages = []
         self._sync_combat_target()
         if self.board:
@@ -330,17 +594,20 @@ class BattleScene(Scene):
         return None
 
     def _sync_combat_target(self) -> None:
-        current = self._current_enemy()
-        if current is None:
-            return
         if hasattr(self, "cs"):
-            self.cs.enemy = current
+            self.cs.set_enemies(self.enemies)
 
     def _grant_enemy_drops(self, enemy) -> list:
         messages = []
-        for drop in getattr(enemy, "drops", []):
-            chance = float(drop.get("chance", 1.0))
-            if self._rng.random() > chance:
+        for index, drop, roll, hit in roll_drops(getattr(enemy, "drops", []), self._rng):
+            if self.recorder is not None:
+                self.recorder.drop(
+                    self._enemy_serials.get(enemy, 0),
+                    index,
+                    roll,
+                    hit,
+                )
+            if not hit:
                 continue
             item_id = drop.get("item_id")
             material_id = drop.get("material_id")
@@ -367,53 +634,34 @@ class BattleScene(Scene):
         return list(self._recent_drop_messages)
 
     def _clear_board_enemies(self) -> None:
-        if not self.board:
-            return
-        for q, r in self.board.tiles():
-            if self.board.occupant_at(q, r) is not None:
-                try:
-                    self.board.remove(q, r)
-                except ValueError:
-                    pass
+        if self.board:
+            self.board.clear()
 
     def _place_enemies_on_board(self) -> None:
-        if not self.board:
+        """Put enemies that have no tile yet onto random free tiles.
+
+        Only runs when occupancy changes (spawn, death, board rebuild); the
+        board keeps its free-tile set and token positions up to date.
+        """
+        board = self.board
+        if not board or board.occupant_count >= len(self.enemies):
             return
-        # Remove any stale occupants from previous waves.
-        for q, r in self.board.tiles():
-            occupant = self.board.occupant_at(q, r)
-            if occupant is None:
-                continue
-            if occupant not in self.enemies:
-                try:
-                    self.board.remove(q, r)
-                except ValueError:
-                    pass
-        available = [
-            (q, r)
-            for q, r in self.board.tiles()
-            if self.board.occupant_at(q, r) is None
-        ]
-        self._rng.shuffle(available)
+        available = sorted(board.free_tiles)
+        self._placement_rng.shuffle(available)
         for enemy in self.enemies:
-            coord = self.enemy_positions.get(enemy)
-            if coord and self.board.occupant_at(*coord) is enemy:
-                continue
             if not available:
-                self.enemy_positions[enemy] = None
+                break
+            if board.position_of(enemy) is not None:
                 continue
-            coord = available.pop()
-            try:
-                self.board.place(enemy, *coord)
-            except ValueError:
-                self.enemy_positions[enemy] = None
-                continue
-            self.enemy_positions[enemy] = coord
+            board.place(enemy, *available.pop())
 
     def _handle_enemy_defeated(self, defeated_enemy: Enemy) -> None:
         reward = getattr(defeated_enemy, "xp_reward", 0)
-        for actor in self.actors:
+        for index, actor in enumerate(self.actors):
+            level = actor.level
             actor.gain_xp(reward)
+            if self.recorder is not None and actor.level != level:
+                self.recorder.level_up(index, actor.level)
         messages = self._grant_enemy_drops(defeated_enemy)
         munny_reward = getattr(defeated_enemy, "munny_reward", 0)
         munny_reward = max(0, int(munny_reward or 0))
@@ -422,65 +670,236 @@ class BattleScene(Scene):
             messages.append(f"Collected {munny_reward} munny.")
         self._recent_drop_messages = messages
 
-        coord = self.enemy_positions.pop(defeated_enemy, None)
-        if self.board and coord:
-            try:
-                self.board.remove(*coord)
-            except ValueError:
-                pass
+        if self.board:
+            self.board.remove_token(defeated_enemy)
         try:
             self.enemies.remove(defeated_enemy)
         except ValueError:
             pass
+        self._enemy_serials.pop(defeated_enemy, None)
 
-        next_enemy = self._current_enemy()
-        if next_enemy is None:
+        if not self.enemies:
             self._spawn_wave()
-            next_enemy = self._current_enemy()
-        if next_enemy is not None:
-            self.cs.enemy = next_enemy
-            if self.board:
-                self._place_enemies_on_board()
-
-    def _load_portrait(self, portrait_path, size=(96, 96)):
-        surface = pygame.Surface(size)
-        surface.fill((60, 60, 60))
-        if portrait_path and os.path.exists(portrait_path):
-            try:
-                image = pygame.image.load(portrait_path)
-                surface = pygame.transform.smoothscale(image, size)
-            except pygame.error:
-                pass
+        elif self.board:
+            self._place_enemies_on_board()
+
+    def _handle_defeated_enemies(self) -> None:
+        for enemy in [enemy for enemy in self.enemies if enemy.health.is_dead()]:
+            self._handle_enemy_defeated(enemy)
+
+    def _refresh_portraits(self) -> None:
+        generation = self.assets.generation
+        if generation == self._portraits_generation:
+            return
+        self._portraits_generation = generation
+        self.actor_portraits = [
+            self._portrait(actor.portrait_path) for actor in self.actors
+        ]
+
+    def _portrait(self, portrait_path, size=PORTRAIT_SIZE):
+        image = self.assets.get(portrait_path, size)
+        if image is not None:
+            surface = image.copy()
+        else:
+            surface = pygame.Surface(size)
+            surface.fill((60, 60, 60))
         pygame.draw.rect(surface, (10, 10, 10), surface.get_rect(), 2)
         return surface.convert_alpha()
 
-    def draw(self, surface):
-        screen_rect = surface.get_rect()
+    def sync_board(self, screen_rect) -> None:
+        """Build the board for ``screen_rect`` and place the current wave."""
         board_rebuilt = self.render_system.ensure_board(screen_rect)
         board_obj = self.render_system.board
         self.board = board_obj if isinstance(board_obj, HexBoard) else None
         if board_rebuilt and self.board is not None:
-            for enemy in self.enemies:
-                self.enemy_positions[enemy] = None
-        if self.board is not None:
+            self.board.hp_source = self.display_hp
+            self.board.targeting.set_units(self.actor_positions)
             self._place_enemies_on_board()
-        self.render_system.draw(surface)
-        self.hud.draw(
-            surface,
+
+    def _frame(self) -> "_Frame":
+        if self.sim_thread is not None:
+            snap = self.sim_thread.latest
+            return _Frame(
+                munny=snap.munny,
+                actors=snap.actors,
+                ko_timers=snap.ko_timers,
+                board=snap.board,
+                save_message=snap.save_message,
+                time_scale=snap.time_scale,
+                sim_backlog_s=snap.sim_backlog_s,
+                hp_of=self.display_hp,
+            )
+        return _Frame(
             munny=self.inventory.munny,
             actors=self.actors,
-            portraits=self.actor_portraits,
             ko_timers=self._ko_timers,
+            board=self.board.occupied if self.board is not None else {},
+            save_message=self._save_message,
+            time_scale=self.time_scale,
+            sim_backlog_s=self.tc.backlog_s,
+            hp_of=self.display_hp,
+        )
+
+    def _prepare_board(self, screen_rect) -> None:
+        if screen_rect.size != self._draw_size:
+            # Neighbouring backgrounds at the size we really draw at, so
+            # travelling does not start on a plain frame.
+            self._draw_size = screen_rect.size
+            self.assets.prefetch_location(self.location_id, self._draw_size)
+        if self.sim_thread is None:
+            self.sync_board(screen_rect)
+        elif screen_rect.size != self._requested_board_size:
+            self._requested_board_size = screen_rect.size
+            self._command(self.sync_board, screen_rect.copy())
+
+    def draw(self, surface):
+        self._prepare_board(surface.get_rect())
+        frame = self._frame()
+        self._render(surface, frame)
+        self._drawn_signature = self._signature(frame)
+
+    def draw_dirty(self, surface):
+        """Repaint only the regions whose drawn values changed."""
+        previous = self._drawn_signature
+        if previous is None:
+            return None
+        self._prepare_board(surface.get_rect())
+        frame = self._frame()
+        signature = self._signature(frame)
+        rects = []
+        for key in previous.keys() | signature.keys():
+            if previous.get(key) == signature.get(key):
+                continue
+            rect = self._region_for(key, surface.get_rect())
+            if rect is None:
+                return None
+            rects.append(rect)
+        if len(rects) > self.MAX_DIRTY_RECTS:
+            return None
+        clip = surface.get_clip()
+        try:
+            for rect in rects:
+                surface.set_clip(rect)
+                self._render(surface, frame)
+        finally:
+            surface.set_clip(clip)
+        self._drawn_signature = signature
+        return rects
+
+    def _signature(self, frame: "_Frame") -> dict:
+        """What each dirty-trackable region shows this frame."""
+        hp_of = frame.hp_of
+        signature: dict = {
+            "munny": frame.munny,
+            "speed": (frame.time_scale, f"{frame.sim_backlog_s:.0f}"),
+            "save": frame.save_message,
+            "action_bar": self.action_bar.state_key(),
+            # Newly decoded images can land anywhere: redraw everything.
+            "assets": self.assets.generation,
+        }
+        for index, actor in enumerate(frame.actors):
+            mana = getattr(actor, "mana", None)
+            ko = frame.ko_timers.get(actor)
+            signature[("actor", index)] = (
+                hp_of(actor),
+                actor.health.current,
+                actor.health.max,
+                mana.current if mana is not None else 0,
+                mana.max if mana is not None else 0,
+                getattr(actor.current_spell, "name", None),
+                actor.level,
+                actor.xp,
+                actor.xp_to_level,
+                None if ko is None else f"{max(0.0, ko):.1f}",
+            )
+        for coord, token in frame.board.items():
+            signature[("tile", coord)] = (
+                token.name,
+                token.level,
+                token.portrait_path,
+                hp_of(token),
+                token.health.max,
+            )
+        return signature
+
+    def _region_for(self, key, screen_rect) -> pygame.Rect | None:
+        if key == "save":
+            height = self.font.get_height()
+            return pygame.Rect(0, screen_rect.height - 24 - height, screen_rect.width, height)
+        if isinstance(key, tuple) and key[0] == "tile":
+            return self.board.token_rect(key[1]) if self.board is not None else None
+        return self.hud.regions.get(key)
+
+    def _render(self, surface, frame: "_Frame") -> None:
+        self._refresh_portraits()
+        self.render_system.draw(surface, board_occupants=frame.board)
+        self.hud.draw(
+            surface,
+            munny=frame.munny,
+            actors=frame.actors,
+            portraits=self.actor_portraits,
+            ko_timers=frame.ko_timers,
             available_spells=len(self.available_spells),
             location_name=self.location_name,
             location_subtitle=self.location_subtitle,
+            time_scale=frame.time_scale,
+            sim_backlog_s=frame.sim_backlog_s,
+            display_hp=frame.hp_of,
         )
+        self._draw_save_message(surface, frame.save_message)
 
-        if self._save_message:
-            message = self.font.render(self._save_message, True, (245, 245, 255))
-            message_rect = message.get_rect()
-            message_rect.midbottom = (screen_rect.centerx, screen_rect.height - 24)
-            surface.blit(message, message_rect)
+    def _draw_save_message(self, surface, text: str | None) -> None:
+        if not text:
+            return
+        screen_rect = surface.get_rect()
+        message = render_text(self.font, text, True, (245, 245, 255))
+        message_rect = message.get_rect()
+        message_rect.midbottom = (screen_rect.centerx, screen_rect.height - 24)
+        surface.blit(message, message_rect)
+
+    def snapshot(self) -> BattleSnapshot:
+        """Immutable copy of the state ``draw`` reads."""
+        previous_hp = self._hp_previous
+        actor_views = [CombatantView.of(actor, previous_hp=previous_hp.get(actor)) for actor in self.actors]
+        by_actor = dict(zip(self.actors, actor_views))
+        enemy_views = [CombatantView.of(enemy, previous_hp=previous_hp.get(enemy)) for enemy in self.enemies]
+        board = {}
+        if self.board is not None:
+            for enemy, view in zip(self.enemies, enemy_views):
+                coord = self.board.position_of(enemy)
+                if coord is not None:
+                    board[coord] = view
+        return BattleSnapshot(
+            step=self.sim_thread.steps if self.sim_thread is not None else 0,
+            munny=self.inventory.munny,
+            actors=tuple(actor_views),
+            enemies=tuple(enemy_views),
+            board=frozen_mapping(board),
+            ko_timers=frozen_mapping(
+                {by_actor[actor]: remaining for actor, remaining in self._ko_timers.items() if actor in by_actor}
+            ),
+            drop_messages=tuple(self._recent_drop_messages),
+            save_message=self._save_message,
+            time_scale=self.time_scale,
+            sim_backlog_s=self.tc.backlog_s,
+        )
+
+    def _command(self, command, *args) -> None:
+        """Apply a state change now, or on the sim thread in threaded mode."""
+        if self.sim_thread is not None:
+            self.sim_thread.submit(command, *args)
+        else:
+            command(*args)
+
+    def pause_simulation(self) -> None:
+        """Let the main thread touch battle state (threaded mode)."""
+        if self.sim_thread is not None:
+            self.sim_thread.pause()
+
+    def close(self) -> None:
+        """Stop the simulation thread, if any."""
+        if self.sim_thread is not None:
+            self.sim_thread.stop()
 
     def handle_event(self, event) -> bool:
         if self.action_bar.handle_event(event):
@@ -490,15 +909,34 @@ class BattleScene(Scene):
                 return False
             elif event.key in (pygame.K_1, pygame.K_2, pygame.K_3):
                 idx = event.key - pygame.K_1
-                self.cycle_actor_spell(idx)
+                self._command(self.cycle_actor_spell, idx)
+                return True
+            elif event.key == pygame.K_RIGHTBRACKET:
+                self._command(self.step_time_scale, 1)
+                return True
+            elif event.key == pygame.K_LEFTBRACKET:
+                self._command(self.step_time_scale, -1)
+                return True
+            elif event.key == pygame.K_F9:
+                self._command(self.toggle_instrumentation)
                 return True
             elif event.key == pygame.K_F5:
-                self._save_game()
+                self._command(self._save_game)
                 return True
             elif event.key == pygame.K_m:
+                self.pause_simulation()
                 self._open_map_scene()
                 return True
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            overlay_buttons = (
+                self.hud.inventory_button_rect,
+                self.hud.synthesis_button_rect,
+                self.hud.leveling_button_rect,
+                self.hud.map_button_rect,
+            )
+            if any(rect.collidepoint(event.pos) for rect in overlay_buttons):
+                # Overlays edit the party and inventory on this thread.
+                self.pause_simulation()
             if self.hud.inventory_button_rect.collidepoint(event.pos):
                 inventory_scene = InventoryScene(
                     self.font,
@@ -531,20 +969,56 @@ class BattleScene(Scene):
                 return True
         return False
 
+    def interpolate(self, alpha: float) -> None:
+        self._alpha = alpha
+
+    def display_hp(self, combatant) -> float:
+        """HP to draw for ``combatant``, blended between the last two sim steps."""
+        current = combatant.health.current
+        if isinstance(combatant, CombatantView):
+            # Snapshot views carry the HP they had when their step began.
+            previous = current if combatant.previous_hp is None else combatant.previous_hp
+        else:
+            previous = self._hp_previous.get(combatant, current)
+        return previous + (current - previous) * self._alpha
+
+    def _remember_hp(self) -> None:
+        previous = {actor: actor.health.current for actor in self.actors}
+        for enemy in self.enemies:
+            previous[enemy] = enemy.health.current
+        self._hp_previous = previous
+
     def update(self, dt):
-        self._update_ko_timers(dt)
-        current_enemy = self._current_enemy()
-        if current_enemy is None:
-            self._spawn_wave()
-            current_enemy = self._current_enemy()
-            if current_enemy is None:
-                return
-        self.cs.enemy = current_enemy
-        self.tc.update(dt, self.cs.on_tick)
-        if current_enemy.health.is_dead():
-            self._handle_enemy_defeated(current_enemy)
+        if self.sim_thread is not None:
+            self.sim_thread.start()
+            if self.sim_thread.paused and self.controller.top is self:
+                # The overlay that paused the simulation has closed.
+                self.sim_thread.resume()
+            self.sim_thread.feed(dt)
+            return
+        self._sim_step(dt)
+
+    def _sim_step(self, dt):
+        self._remember_hp()
+        stats = self.cs.instrumentation
+        if stats is None:
+            self._update_frame(dt)
+            return
+        with stats.section("battle.update"):
+            self._update_frame(dt)
+
+    def _update_frame(self, dt):
+        if self.recorder is not None:
+            self.recorder.frame(dt)
+        if self.time_scale == 1.0 and not self.tc.pending_ticks:
+            self._run_ticks(dt)
+        else:
+            self._run_accelerated(dt)
 
         if self._save_message_timer > 0.0:
             self._save_message_timer = max(0.0, self._save_message_timer - dt)
             if self._save_message_timer <= 0.0:
                 self._save_message = None
+
+        if self.recorder is not None:
+            self.recorder.flush()
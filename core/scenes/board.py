@@ -1,11 +1,127 @@
 import math
-from typing import Any
+from typing import Any, Callable, Iterable, Mapping
 
 import pygame
 
+from core.systems.assets import default_assets
+from core.ui.battle_hud import draw_hp_bar
+
+Coord = tuple[int, int]
+
+
+def hex_distance(a: Coord, b: Coord) -> int:
+    aq, ar = a
+    bq, br = b
+    dq = bq - aq
+    dr = br - ar
+    return (abs(dq) + abs(dq + dr) + abs(dr)) // 2
+
+
+def _is_targetable(token) -> bool:
+    health = getattr(token, "health", None)
+    return health is None or not health.is_dead()
+
+
+class TargetingIndex:
+    """Nearest-target lookups for a ``HexBoard``.
+
+    Distance rows (every board tile sorted by distance from a source coord)
+    are computed once per source and kept for the board's lifetime. The
+    nearest-occupant answer per source is cached as a position in that row
+    and dropped whenever the board's occupancy changes. Deaths are handled
+    lazily: a dead cached answer resumes the scan from where it stopped, so
+    repeated queries are amortised O(1). Tokens that come back to life
+    without a board change need an explicit ``invalidate``.
+
+    Off-board units (the party, standing left of the grid) are registered
+    with ``set_units`` and answered by ``nearest_unit``.
+    """
+
+    def __init__(self, board: "HexBoard") -> None:
+        self._board = board
+        self._rows: dict[Coord, list[Coord]] = {}
+        self._distances: dict[Coord, dict[Coord, int]] = {}
+        self._nearest: dict[Coord, int] = {}
+        self._units: dict[Any, Coord] = {}
+        self._unit_rows: dict[Coord, list[Any]] = {}
+
+    def _row(self, source: Coord) -> list[Coord]:
+        row = self._rows.get(source)
+        if row is None:
+            distances = self.distances_from(source)
+            # Ties keep board tile order so answers are deterministic.
+            row = sorted(self._board.tiles(), key=distances.__getitem__)
+            self._rows[source] = row
+        return row
+
+    def distances_from(self, source: Coord) -> dict[Coord, int]:
+        distances = self._distances.get(source)
+        if distances is None:
+            distances = {tile: hex_distance(source, tile) for tile in self._board.tiles()}
+            self._distances[source] = distances
+        return distances
+
+    def distance(self, a: Coord, b: Coord) -> int:
+        distances = self._distances.get(a)
+        if distances is not None and b in distances:
+            return distances[b]
+        return hex_distance(a, b)
+
+    def invalidate(self) -> None:
+        """Forget cached nearest-occupant answers after occupancy changes."""
+        self._nearest.clear()
+
+    def nearest_occupant(self, source: Coord):
+        """Closest living board occupant to ``source`` (on or off the board)."""
+        row = self._row(source)
+        index = self._nearest.get(source, 0)
+        occupants = self._board._occupants
+        while index < len(row):
+            token = occupants[row[index]]
+            if token is not None and _is_targetable(token):
+                self._nearest[source] = index
+                return token
+            index += 1
+        self._nearest[source] = index
+        return None
+
+    def set_units(self, units: dict[Any, Coord] | Iterable[tuple[Any, Coord]]) -> None:
+        """Register off-board units (in priority order) for ``nearest_unit``."""
+        items = units.items() if isinstance(units, dict) else units
+        self._units = dict(items)
+        self._unit_rows.clear()
+
+    def nearest_unit(self, source: Coord):
+        """Closest living registered unit to ``source``.
+
+        Units can be revived, so the (tiny) sorted row is rescanned from the
+        front; only the sort is cached.
+        """
+        row = self._unit_rows.get(source)
+        if row is None:
+            order = list(self._units)
+            row = sorted(
+                order,
+                key=lambda unit: self.distance(source, self._units[unit]),
+            )
+            self._unit_rows[source] = row
+        for unit in row:
+            if _is_targetable(unit):
+                return unit
+        return None
+
+
 class HexBoard:
     DIRECTIONS = [(1, 0), (1, -1), (0, -1), (-1, 0), (-1, 1), (0, 1)]
     SQRT3 = math.sqrt(3)
+    FILL_COLOR = (45, 45, 70)
+    BORDER_COLOR = (90, 90, 140)
+    BORDER_WIDTH = 2
+    # Pointy-top corner directions, computed once for every board.
+    _CORNER_UNITS = tuple(
+        (math.cos(math.radians(60 * i - 30)), math.sin(math.radians(60 * i - 30)))
+        for i in range(6)
+    )
 
     def __init__(self, screen_rect, cols=6, rows=6, *, size=48, margin=40):
         self.cols = cols
@@ -18,7 +134,22 @@ class HexBoard:
         self._occupants: dict[tuple[int, int], object | None] = {
             (q, r): None for q in range(cols) for r in range(rows)
         }
-        self._sprite_cache: dict[Any, pygame.Surface] = {}
+        # Kept in step with _occupants by place/remove so callers never scan.
+        self._free: set[Coord] = set(self._occupants)
+        self._positions: dict[Any, Coord] = {}
+        self._tokens: dict[Coord, Any] = {}
+        # Tokens in draw order, re-sorted only when occupancy changes or
+        # ``draw`` is handed a different mapping.
+        self._draw_order: list[tuple[Coord, Any]] | None = None
+        self._draw_order_source: Mapping[Coord, Any] | None = None
+        # Shared across boards, so sprites survive rebuilds and scene changes.
+        self.assets = default_assets()
+        # Tiles never change, so they are drawn once (see ``render_static``).
+        self._static: pygame.Surface | None = None
+        self._static_pos: tuple[int, int] = (0, 0)
+        self.targeting = TargetingIndex(self)
+        # Optional HP to draw per token (e.g. interpolated); None hides bars.
+        self.hp_source: Callable[[Any], float] | None = None
 
     def _calculate_bounds(self) -> tuple[float, float, float, float]:
         min_x = float("inf")
@@ -70,20 +201,68 @@ class HexBoard:
     def occupant_at(self, q, r):
         return self._occupants.get((q, r))
 
+    def position_of(self, token) -> Coord | None:
+        return self._positions.get(token)
+
+    @property
+    def free_tiles(self) -> set[Coord]:
+        """Unoccupied tiles; a live view, do not mutate."""
+        return self._free
+
+    @property
+    def occupied(self) -> Mapping[Coord, Any]:
+        """Occupied tiles, coord -> token; a live view, do not mutate."""
+        return self._tokens
+
+    @property
+    def occupant_count(self) -> int:
+        return len(self._positions)
+
     def place(self, token, q, r):
         if not self.in_bounds(q, r):
             raise ValueError("out of bounds")
         if self._occupants[(q, r)] is not None:
             raise ValueError("tile already occupied")
+        if token in self._positions:
+            raise ValueError("token already on the board")
         self._occupants[(q, r)] = token
+        self._free.discard((q, r))
+        self._positions[token] = (q, r)
+        self._tokens[(q, r)] = token
+        self._draw_order = None
+        self.targeting.invalidate()
 
     def remove(self, q, r):
         if not self.in_bounds(q, r):
             raise ValueError("out of bounds")
         token = self._occupants[(q, r)]
         self._occupants[(q, r)] = None
+        if token is not None:
+            self._free.add((q, r))
+            del self._positions[token]
+            del self._tokens[(q, r)]
+            self._draw_order = None
+            self.targeting.invalidate()
         return token
 
+    def remove_token(self, token) -> Coord | None:
+        """Remove ``token`` wherever it is; return its old tile, if any."""
+        coord = self._positions.get(token)
+        if coord is not None:
+            self.remove(*coord)
+        return coord
+
+    def clear(self) -> None:
+        if not self._positions:
+            return
+        for coord in self._positions.values():
+            self._occupants[coord] = None
+            self._free.add(coord)
+        self._positions.clear()
+        self._tokens.clear()
+        self._draw_order = None
+        self.targeting.invalidate()
+
     def move(self, src, dest):
         src_q, src_r = src
         dest_q, dest_r = dest
@@ -101,14 +280,8 @@ class HexBoard:
         return token
 
     def _hex_corners_local(self, cx: float, cy: float) -> list[tuple[float, float]]:
-        corners: list[tuple[float, float]] = []
-        for i in range(6):
-            angle_deg = 60 * i - 30
-            angle_rad = math.radians(angle_deg)
-            x = cx + self.size * math.cos(angle_rad)
-            y = cy + self.size * math.sin(angle_rad)
-            corners.append((x, y))
-        return corners
+        size = self.size
+        return [(cx + size * ux, cy + size * uy) for ux, uy in self._CORNER_UNITS]
 
     def _hex_corners(self, cx: float, cy: float) -> list[tuple[int, int]]:
         return [(int(x), int(y)) for x, y in self._hex_corners_local(cx, cy)]
@@ -117,36 +290,60 @@ class HexBoard:
         sprite = getattr(token, "board_sprite", None)
         if sprite is not None:
             return sprite
-
-        cache_key = getattr(token, "portrait_path", None)
-        if not cache_key:
-            return None
-        cached = self._sprite_cache.get(cache_key)
-        if cached is not None:
-            return cached
-        try:
-            image = pygame.image.load(cache_key)
-        except pygame.error:
-            return None
         size = int(self.size * 1.6)
-        sprite = pygame.transform.smoothscale(image, (size, size))
-        sprite = sprite.convert_alpha()
-        self._sprite_cache[cache_key] = sprite
-        return sprite
-
-    def draw(self, surface):
-        fill_color = (45, 45, 70)
-        border_color = (90, 90, 140)
+        return self.assets.get(getattr(token, "portrait_path", None), (size, size))
+
+    def token_rect(self, coord: Coord) -> pygame.Rect:
+        """Screen area a token (sprite and HP bar) on ``coord`` can cover."""
+        cx, cy = self.axial_to_pixel(*coord)
+        half = int(self.size * 0.8) + 2
+        rect = pygame.Rect(0, 0, 2 * half, half + int(self.size * 0.6) + 10)
+        rect.topleft = (int(cx) - half, int(cy) - half)
+        return rect
+
+    def render_static(self) -> pygame.Surface:
+        """Draw every tile once to an off-screen surface and keep it."""
+        min_x, min_y, width, height = self._bounds
+        pad = self.BORDER_WIDTH
+        static = pygame.Surface(
+            (math.ceil(width) + 2 * pad + 1, math.ceil(height) + 2 * pad + 1),
+            pygame.SRCALPHA,
+        )
+        # Tile corners are truncated in screen space, so keep the surface on
+        # whole pixels and truncate at the same place.
+        origin_x, origin_y = self.origin
+        left = int(origin_x + min_x) - pad
+        top = int(origin_y + min_y) - pad
         for q, r in self.tiles():
             cx, cy = self.axial_to_pixel(q, r)
-            corners = self._hex_corners(cx, cy)
-            pygame.draw.polygon(surface, fill_color, corners)
-            pygame.draw.polygon(surface, border_color, corners, width=2)
+            corners = [(x - left, y - top) for x, y in self._hex_corners(cx, cy)]
+            pygame.draw.polygon(static, self.FILL_COLOR, corners)
+            pygame.draw.polygon(static, self.BORDER_COLOR, corners, width=self.BORDER_WIDTH)
+        if pygame.display.get_surface() is not None:
+            static = static.convert_alpha()
+        self._static = static
+        self._static_pos = (left, top)
+        return static
 
-            token = self.occupant_at(q, r)
+    def draw(self, surface, occupants=None):
+        """Blit the tiles and draw the tokens.
+
+        ``occupants`` (coord -> token) overrides the live occupancy; it must
+        not change between draws (pass a new mapping instead). Only
+        occupied tiles cost anything per frame, whatever the board size.
+        """
+        if self._static is None:
+            self.render_static()
+        surface.blit(self._static, self._static_pos)
+        if occupants is None:
+            occupants = self._tokens
+        if self._draw_order is None or occupants is not self._draw_order_source:
+            self._draw_order = sorted(occupants.items(), key=lambda item: item[0])
+            self._draw_order_source = occupants
+        for (q, r), token in self._draw_order:
             if token is None:
                 continue
-
+            cx, cy = self.axial_to_pixel(q, r)
             sprite = self._sprite_for_token(token)
             if sprite is None:
                 radius = int(self.size * 0.35)
@@ -156,7 +353,16 @@ class HexBoard:
                     (int(cx), int(cy)),
                     radius,
                 )
-                continue
+            else:
+                sprite_rect = sprite.get_rect(center=(int(cx), int(cy)))
+                surface.blit(sprite, sprite_rect)
+            self._draw_hp_bar(surface, token, cx, cy)
 
-            sprite_rect = sprite.get_rect(center=(int(cx), int(cy)))
-            surface.blit(sprite, sprite_rect)
+    def _draw_hp_bar(self, surface, token, cx: float, cy: float) -> None:
+        health = getattr(token, "health", None)
+        if self.hp_source is None or health is None:
+            return
+        width = int(self.size * 1.2)
+        rect = pygame.Rect(0, 0, width, 6)
+        rect.midtop = (int(cx), int(cy + self.size * 0.6))
+        draw_hp_bar(surface, rect, self.hp_source(token), health.max)
@@ -4,6 +4,8 @@ import pygame
 
 from core.gameplay.inventory import Inventory
 from core.scenes.scene import Manager, Scene
+from core.ui.panels import draw_panel
+from core.ui.text_cache import render_text
 
 
 class InventoryScene(Scene):
@@ -22,7 +24,8 @@ class InventoryScene(Scene):
         self.actors = actors
         self.battle_scene = battle_scene
         self._back_button_rect = pygame.Rect(0, 0, 0, 0)
-        self._back_button_label = self.font.render(
+        self._back_button_label = render_text(
+            self.font,
             "Back to Battle",
             True,
             (0, 0, 0),
@@ -53,8 +56,7 @@ class InventoryScene(Scene):
         payload_list: list | None = None,
         payload: dict | None = None,
     ) -> None:
-        surface.fill(fill_color, rect)
-        pygame.draw.rect(surface, border_color, rect, width=2)
+        draw_panel(surface, rect, fill_color, border_color)
         if highlight:
             pygame.draw.rect(
                 surface,
@@ -63,7 +65,7 @@ class InventoryScene(Scene):
                 width=3,
             )
 
-        label_surf = self.font.render(label, True, text_color)
+        label_surf = render_text(self.font, label, True, text_color)
         label_rect = label_surf.get_rect()
         label_rect.midleft = (rect.left + 12, rect.centery)
         surface.blit(label_surf, label_rect)
@@ -99,7 +101,7 @@ class InventoryScene(Scene):
         panel_top = self._back_button_rect.bottom + 40
         y = panel_top
         for idx, actor in enumerate(self.actors):
-            name_surf = self.font.render(actor.name, True, (245, 245, 255))
+            name_surf = render_text(self.font, actor.name, True, (245, 245, 255))
             surface.blit(name_surf, (panel_left, y))
             y += name_surf.get_height() + panel_padding
 
@@ -140,11 +142,12 @@ class InventoryScene(Scene):
         inv_left = screen_rect.right - column_width - 60
         inv_top = self._back_button_rect.bottom + 40
 
-        header = self.font.render("Inventory", True, (235, 235, 235))
+        header = render_text(self.font, "Inventory", True, (235, 235, 235))
         surface.blit(header, (inv_left, inv_top))
         inv_top += header.get_height() + 10
 
-        munny_text = self.font.render(
+        munny_text = render_text(
+            self.font,
             f"Munny: {self.inventory.munny}",
             True,
             (230, 230, 230),
@@ -168,7 +171,8 @@ class InventoryScene(Scene):
                 available_items.append((slot, counts))
 
         if not available_items:
-            empty_text = self.font.render(
+            empty_text = render_text(
+                self.font,
                 "(No unequipped items)",
                 True,
                 (200, 200, 200),
@@ -177,7 +181,8 @@ class InventoryScene(Scene):
             inv_top += empty_text.get_height()
         else:
             for slot, item_counts in available_items:
-                slot_header = self.font.render(
+                slot_header = render_text(
+                    self.font,
                     f"{slot.title()}s",
                     True,
                     (210, 210, 230),
@@ -223,7 +228,7 @@ class InventoryScene(Scene):
         if drop_messages:
             inv_top += 20
             for message in drop_messages:
-                text = self.font.render(message, True, (250, 220, 120))
+                text = render_text(self.font, message, True, (250, 220, 120))
                 surface.blit(text, (inv_left, inv_top))
                 inv_top += text.get_height() + 6
 
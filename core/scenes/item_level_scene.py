@@ -8,6 +8,8 @@ from core.data.items import get_item
 from core.data.materials import material_name
 from core.gameplay.inventory import Inventory
 from core.scenes.scene import Manager, Scene
+from core.ui.panels import draw_overlay, draw_panel
+from core.ui.text_cache import render_text
 
 
 class ItemLevelScene(Scene):
@@ -69,12 +71,11 @@ class ItemLevelScene(Scene):
             self._selected_item_id = None
 
     def _draw_panel_background(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
-        surface.fill((35, 35, 60), rect)
-        pygame.draw.rect(surface, (90, 90, 140), rect, width=2)
+        draw_panel(surface, rect)
 
     def _render_materials_panel(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
         self._draw_panel_background(surface, rect)
-        title = self.font.render("Materials", True, (230, 230, 240))
+        title = render_text(self.font, "Materials", True, (230, 230, 240))
         surface.blit(title, (rect.left + 16, rect.top + 16))
 
         y = rect.top + 16 + title.get_height() + 12
@@ -83,25 +84,25 @@ class ItemLevelScene(Scene):
             key=lambda item: material_name(item[0]),
         )
         if not materials:
-            empty = self.font.render("(None)", True, (200, 200, 210))
+            empty = render_text(self.font, "(None)", True, (200, 200, 210))
             surface.blit(empty, (rect.left + 16, y))
             return
         for material_id, qty in materials:
             label = f"{material_name(material_id)} x{qty}"
-            label_surf = self.font.render(label, True, (220, 220, 230))
+            label_surf = render_text(self.font, label, True, (220, 220, 230))
             surface.blit(label_surf, (rect.left + 16, y))
             y += label_surf.get_height() + 8
 
     def _render_items_panel(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
         self._draw_panel_background(surface, rect)
-        title = self.font.render("Items", True, (230, 230, 240))
+        title = render_text(self.font, "Items", True, (230, 230, 240))
         surface.blit(title, (rect.left + 16, rect.top + 16))
 
         y = rect.top + 16 + title.get_height() + 12
         button_height = self.font.get_height() + 12
         self._item_buttons = []
         if not self._ordered_items:
-            empty = self.font.render("(No items)", True, (200, 200, 210))
+            empty = render_text(self.font, "(No items)", True, (200, 200, 210))
             surface.blit(empty, (rect.left + 16, y))
             return
         for item_id in self._ordered_items:
@@ -122,9 +123,8 @@ class ItemLevelScene(Scene):
             )
             is_selected = item_id == self._selected_item_id
             fill = (70, 100, 140) if is_selected else (50, 65, 95)
-            surface.fill(fill, rect_button)
-            pygame.draw.rect(surface, (20, 20, 30), rect_button, width=2)
-            label_surf = self.font.render(label, True, (245, 245, 245))
+            draw_panel(surface, rect_button, fill, (20, 20, 30))
+            label_surf = render_text(self.font, label, True, (245, 245, 245))
             surface.blit(label_surf, (rect_button.left + 12, rect_button.top + 6))
             self._item_buttons.append({
                 "rect": rect_button,
@@ -147,7 +147,8 @@ class ItemLevelScene(Scene):
         current_item = self.inventory.leveled_item(item_id)
         next_level = current_level + 1
         requirement = self.inventory.next_level_requirement(item_id)
-        current_title = self.font.render(
+        current_title = render_text(
+            self.font,
             f"{base_item.name} Lv.{current_level}",
             True,
             (235, 235, 245),
@@ -161,13 +162,13 @@ class ItemLevelScene(Scene):
             f"MP: {current_item.mp}",
         ]
         for line in stat_lines:
-            surf = self.font.render(line, True, (230, 230, 240))
+            surf = render_text(self.font, line, True, (230, 230, 240))
             surface.blit(surf, (rect.left + 16, stats_y))
             stats_y += surf.get_height() + 6
 
         stats_y += 10
         if requirement is None:
-            max_text = self.font.render("Max level reached", True, (220, 200, 200))
+            max_text = render_text(self.font, "Max level reached", True, (220, 200, 200))
             surface.blit(max_text, (rect.left + 16, stats_y))
             self._level_button_rect = pygame.Rect(0, 0, 0, 0)
             return
@@ -179,17 +180,18 @@ class ItemLevelScene(Scene):
             f"Next MP: {next_item.mp}",
         ]
         for line in preview_lines:
-            surf = self.font.render(line, True, (220, 220, 240))
+            surf = render_text(self.font, line, True, (220, 220, 240))
             surface.blit(surf, (rect.left + 16, stats_y))
             stats_y += surf.get_height() + 6
 
         stats_y += 10
-        cost_label = self.font.render("Cost:", True, (235, 235, 245))
+        cost_label = render_text(self.font, "Cost:", True, (235, 235, 245))
         surface.blit(cost_label, (rect.left + 16, stats_y))
         stats_y += cost_label.get_height() + 6
 
         duplicates = self.inventory.item_count(item_id)
-        dup_text = self.font.render(
+        dup_text = render_text(
+            self.font,
             f"Copies needed: {requirement.item_cost} (Have {duplicates})",
             True,
             (220, 220, 230),
@@ -203,12 +205,12 @@ class ItemLevelScene(Scene):
             color = (220, 220, 230)
             if have < qty:
                 color = (220, 170, 170)
-            surf = self.font.render(label, True, color)
+            surf = render_text(self.font, label, True, color)
             surface.blit(surf, (rect.left + 32, stats_y))
             stats_y += surf.get_height() + 4
 
         button_padding = 16
-        button_label = self.font.render("Level Up", True, (0, 0, 0))
+        button_label = render_text(self.font, "Level Up", True, (0, 0, 0))
         btn_w = button_label.get_width() + button_padding * 2
         btn_h = button_label.get_height() + button_padding
         self._level_button_rect = pygame.Rect(
@@ -219,8 +221,7 @@ class ItemLevelScene(Scene):
         )
         affordable = self.inventory.can_level_item(item_id)
         fill_color = (200, 200, 200) if affordable else (90, 90, 90)
-        surface.fill(fill_color, self._level_button_rect)
-        pygame.draw.rect(surface, (50, 50, 50), self._level_button_rect, 2)
+        draw_panel(surface, self._level_button_rect, fill_color, (50, 50, 50))
         surface.blit(
             button_label,
             button_label.get_rect(center=self._level_button_rect.center),
@@ -228,12 +229,10 @@ class ItemLevelScene(Scene):
 
     def draw(self, surface: pygame.Surface) -> None:
         screen_rect = surface.get_rect()
-        overlay = pygame.Surface(screen_rect.size, pygame.SRCALPHA)
-        overlay.fill((15, 15, 35, 235))
-        surface.blit(overlay, (0, 0))
+        draw_overlay(surface)
 
         button_padding = 16
-        back_label = self.font.render("Back", True, (0, 0, 0))
+        back_label = render_text(self.font, "Back", True, (0, 0, 0))
         btn_w = back_label.get_width() + button_padding * 2
         btn_h = back_label.get_height() + button_padding
         self._back_button_rect = pygame.Rect(60, 40, btn_w, btn_h)
@@ -242,7 +241,7 @@ class ItemLevelScene(Scene):
         back_label_rect = back_label.get_rect(center=self._back_button_rect.center)
         surface.blit(back_label, back_label_rect)
 
-        header = self.font.render("Item Leveling", True, (235, 235, 245))
+        header = render_text(self.font, "Item Leveling", True, (235, 235, 245))
         surface.blit(header, (screen_rect.centerx - header.get_width() // 2, 50))
 
         panel_top = self._back_button_rect.bottom + 30
@@ -271,7 +270,8 @@ class ItemLevelScene(Scene):
             self._render_details(surface, detail_rect, self._selected_item_id)
         else:
             self._draw_panel_background(surface, detail_rect)
-            empty = self.font.render(
+            empty = render_text(
+                self.font,
                 "Select an item to see details",
                 True,
                 (200, 200, 210),
@@ -279,7 +279,7 @@ class ItemLevelScene(Scene):
             surface.blit(empty, (detail_rect.left + 16, detail_rect.top + 16))
 
         if self._message:
-            msg_label = self.font.render(self._message, True, (250, 220, 120))
+            msg_label = render_text(self.font, self._message, True, (250, 220, 120))
             msg_rect = msg_label.get_rect()
             msg_rect.midbottom = (
                 screen_rect.centerx,
@@ -12,6 +12,7 @@ from core.data.savegame import (
     save_state,
 )
 from core.scenes.scene import Manager, Scene
+from core.ui.text_cache import render_text
 
 
 class LoadSaveScene(Scene):
@@ -27,11 +28,11 @@ class LoadSaveScene(Scene):
         surface.fill((18, 24, 40))
         screen_rect = surface.get_rect()
 
-        header = self.font.render("Select Save Slot", True, (240, 240, 255))
+        header = render_text(self.font, "Select Save Slot", True, (240, 240, 255))
         header_rect = header.get_rect(center=(screen_rect.centerx, 80))
         surface.blit(header, header_rect)
 
-        hint = self.font.render("ESC to return to Main Menu", True, (190, 190, 210))
+        hint = render_text(self.font, "ESC to return to Main Menu", True, (190, 190, 210))
         hint_rect = hint.get_rect(center=(screen_rect.centerx, header_rect.bottom + 24))
         surface.blit(hint, hint_rect)
 
@@ -47,7 +48,7 @@ class LoadSaveScene(Scene):
             self._draw_slot(surface, rect, info)
             self._slot_buttons.append((rect, info))
 
-        footer = self.font.render("Enter number keys (1-3) or click to confirm", True, (180, 180, 200))
+        footer = render_text(self.font, "Enter number keys (1-3) or click to confirm", True, (180, 180, 200))
         footer_rect = footer.get_rect(center=(screen_rect.centerx, screen_rect.height - 60))
         surface.blit(footer, footer_rect)
 
@@ -59,7 +60,7 @@ class LoadSaveScene(Scene):
         pygame.draw.rect(surface, border, rect, width=3, border_radius=12)
 
         title_text = f"{info.title} - {'Continue' if is_existing else 'New Game'}"
-        title = self.font.render(title_text, True, (245, 245, 255))
+        title = render_text(self.font, title_text, True, (245, 245, 255))
         title_rect = title.get_rect()
         title_rect.midtop = (rect.centerx, rect.top + 16)
         surface.blit(title, title_rect)
@@ -77,7 +78,7 @@ class LoadSaveScene(Scene):
             body_lines.append("Start a new adventure from the beginning.")
 
         for offset, line in enumerate(body_lines):
-            text = self.font.render(line, True, (220, 220, 235))
+            text = render_text(self.font, line, True, (220, 220, 235))
             text_rect = text.get_rect()
             text_rect.midtop = (rect.centerx, title_rect.bottom + 12 + offset * (self.font.get_height() + 4))
             surface.blit(text, text_rect)
@@ -101,11 +102,12 @@ class LoadSaveScene(Scene):
 
     def _start_slot(self, info: SaveSlotInfo) -> None:
         if info.exists:
-            state = load_state(info.slot_id)
+            state = load_state(info.slot_id, offline_progress=True)
             if state is None:
                 # Fallback: treat as new game if load failed.
                 state = create_default_state(info.slot_id)
-                save_state(state)
+            # Persist offline rewards right away so they cannot be claimed twice.
+            save_state(state)
         else:
             state = create_default_state(info.slot_id)
             save_state(state)
@@ -121,6 +123,9 @@ class LoadSaveScene(Scene):
             save_created_at=state.created_at,
             save_updated_at=state.updated_at,
         )
+        report = state.offline_report
+        if report is not None and report.kills:
+            battle_scene.show_message(report.describe(), duration=5.0)
         self.controller.replace(battle_scene)
 
     def blocks_draw(self) -> bool:
@@ -6,6 +6,7 @@ import pygame
 
 from core.data.locations import get_location, iter_locations
 from core.scenes.scene import Manager, Scene
+from core.ui.text_cache import render_text
 
 
 class MapScene(Scene):
@@ -52,12 +53,12 @@ class MapScene(Scene):
         self._world_buttons = []
         self._location_buttons = []
 
-        header = self.font.render("World Map", True, (245, 245, 255))
+        header = render_text(self.font, "World Map", True, (245, 245, 255))
         header_rect = header.get_rect()
         header_rect.midtop = (screen_rect.centerx, 40)
         surface.blit(header, header_rect)
 
-        hint = self.font.render("Click a destination", True, (200, 200, 220))
+        hint = render_text(self.font, "Click a destination", True, (200, 200, 220))
         hint_rect = hint.get_rect()
         hint_rect.midtop = (screen_rect.centerx, header_rect.bottom + 12)
         surface.blit(hint, hint_rect)
@@ -87,7 +88,7 @@ class MapScene(Scene):
             pygame.draw.rect(surface, fill, rect)
             pygame.draw.rect(surface, border, rect, width=2)
 
-            label_surf = self.font.render(info["name"], True, (240, 240, 250))
+            label_surf = render_text(self.font, info["name"], True, (240, 240, 250))
             label_rect = label_surf.get_rect(center=rect.center)
             surface.blit(label_surf, label_rect)
 
@@ -112,7 +113,7 @@ class MapScene(Scene):
             pygame.draw.rect(surface, border, rect, width=2)
 
             label = f"{location.title} - {location.subtitle}"
-            label_surf = self.font.render(label, True, (240, 240, 250))
+            label_surf = render_text(self.font, label, True, (240, 240, 250))
             label_rect = label_surf.get_rect(center=rect.center)
             surface.blit(label_surf, label_rect)
 
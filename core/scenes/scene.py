@@ -1,5 +1,10 @@
+import math
+import time
+
 import pygame
 
+from core.ui.text_cache import render_text
+
 
 class Scene:
     def update(self, dt):
@@ -11,6 +16,18 @@ class Scene:
     def draw(self, surface):
         return None
 
+    def draw_dirty(self, surface) -> list[pygame.Rect] | None:
+        """Repaint only what changed since the last draw and return those rects.
+
+        ``None`` (the default) asks for a full ``draw`` instead. Only called
+        when the previous frame drew this scene alone onto the same surface.
+        """
+        return None
+
+    def interpolate(self, alpha: float) -> None:
+        """Called before ``draw`` with how far (0..1) the clock is into the next sim step."""
+        return None
+
     def blocks_update(self) -> bool:
         return True
 
@@ -22,6 +39,20 @@ class Scene:
 
 
 class Manager:
+    """Scene stack driven by a fixed simulation step.
+
+    ``advance`` feeds wall-clock frame time into an accumulator and runs
+    ``update`` in whole ``sim_step_s`` steps, so a slow frame changes how
+    many steps run, never their length: the simulation plays out the same
+    at any frame rate. Steps per frame are capped so rendering keeps up
+    after a hitch; the remainder carries over to later frames, and only a
+    backlog beyond ``MAX_BACKLOG_S`` (e.g. after a suspend) is dropped.
+    """
+
+    SIM_STEP_S = 1.0 / 60.0
+    MAX_STEPS_PER_FRAME = 12
+    MAX_BACKLOG_S = 5.0
+
     class Controller:
         def __init__(self, manager: "Manager") -> None:
             self._manager = manager
@@ -35,9 +66,26 @@ class Manager:
         def pop(self) -> None:
             self._manager.pop_scene()
 
-    def __init__(self, initial_scene: Scene | None = None):
+        @property
+        def top(self) -> Scene | None:
+            scenes = self._manager.scenes
+            return scenes[-1] if scenes else None
+
+    def __init__(
+        self,
+        initial_scene: Scene | None = None,
+        *,
+        sim_step_s: float | None = None,
+    ):
         self._stack: list[Scene] = []
         self._controller = Manager.Controller(self)
+        self.sim_step_s = float(sim_step_s or self.SIM_STEP_S)
+        self._accumulator = 0.0
+        self.alpha = 0.0
+        self._full_redraw = True
+        self._drawn_size: tuple[int, int] | None = None
+        # Optional ``core.systems.profiling.Profiler`` timing each scene.
+        self.profiler = None
         if initial_scene is not None:
             self.set_scene(initial_scene)
 
@@ -45,19 +93,48 @@ class Manager:
     def controller(self) -> "Manager.Controller":
         return self._controller
 
+    @property
+    def scenes(self) -> tuple[Scene, ...]:
+        """The scene stack, bottom first."""
+        return tuple(self._stack)
+
+    def invalidate(self) -> None:
+        """Make the next ``draw`` repaint the whole surface."""
+        self._full_redraw = True
+
     def set_scene(self, scene: Scene | None) -> None:
+        self._full_redraw = True
         self._stack.clear()
         if scene is not None:
             self._stack.append(scene)
 
     def push_scene(self, scene: Scene) -> None:
+        self._full_redraw = True
         if scene is not None:
             self._stack.append(scene)
 
     def pop_scene(self) -> None:
+        self._full_redraw = True
         if self._stack:
             self._stack.pop()
 
+    def advance(self, frame_dt: float, *, catch_up: bool = False) -> int:
+        """Run the fixed steps covered by ``frame_dt``; return how many ran.
+
+        ``catch_up`` lifts the per-frame step cap, for loops that wake rarely
+        (e.g. low-power mode) but must not fall behind.
+        """
+        step = self.sim_step_s
+        self._accumulator = min(self._accumulator + max(0.0, float(frame_dt)), self.MAX_BACKLOG_S)
+        max_steps = math.inf if catch_up else self.MAX_STEPS_PER_FRAME
+        steps = 0
+        while self._accumulator >= step and steps < max_steps:
+            self.update(step)
+            self._accumulator -= step
+            steps += 1
+        self.alpha = min(1.0, self._accumulator / step)
+        return steps
+
     def update(self, dt) -> None:
         if not self._stack:
             return
@@ -67,7 +144,7 @@ class Manager:
                 start_index = idx
                 break
         for scene in self._stack[start_index:]:
-            scene.update(dt)
+            self._scene_call(scene, "update", dt)
 
     def handle_event(self, event) -> None:
         for scene in reversed(self._stack):
@@ -75,16 +152,46 @@ class Manager:
             if handled or scene.blocks_input():
                 break
 
-    def draw(self, surface) -> None:
+    def draw(self, surface) -> list[pygame.Rect] | None:
+        """Draw the visible scenes; return the changed rects, or ``None`` for all.
+
+        A lone visible scene may repaint just its dirty regions. Scene
+        changes, overlays and a new surface size fall back to a full draw.
+        """
         if not self._stack:
-            return
+            return None
         start_index = 0
         for idx in range(len(self._stack) - 1, -1, -1):
             if self._stack[idx].blocks_draw():
                 start_index = idx
                 break
-        for scene in self._stack[start_index:]:
-            scene.draw(surface)
+        visible = self._stack[start_index:]
+        size = surface.get_size()
+        if not self._full_redraw and size == self._drawn_size and len(visible) == 1:
+            scene = visible[0]
+            scene.interpolate(self.alpha)
+            rects = self._scene_call(scene, "draw_dirty", surface)
+            if rects is not None:
+                return rects
+        for scene in visible:
+            scene.interpolate(self.alpha)
+            self._scene_call(scene, "draw", surface)
+        # Overlays are redrawn in full every frame.
+        self._full_redraw = len(visible) > 1
+        self._drawn_size = size
+        return None
+
+    def _scene_call(self, scene: Scene, method: str, *args):
+        profiler = self.profiler
+        if profiler is None or not profiler.enabled:
+            return getattr(scene, method)(*args)
+        start = time.perf_counter()
+        try:
+            return getattr(scene, method)(*args)
+        finally:
+            # Partial and full repaints both count as the scene's draw time.
+            kind = "draw" if method == "draw_dirty" else method
+            profiler.record(f"{type(scene).__name__}.{kind}", time.perf_counter() - start)
 
 
 class MainMenu(Scene):
@@ -95,7 +202,8 @@ class MainMenu(Scene):
     def draw(self, surface):
         screen_rect = surface.get_rect()
         surface.fill((30, 30, 30))
-        title = self.font.render(
+        title = render_text(
+            self.font,
             "Main Menu - Press Enter to Select Save",
             True,
             (255, 255, 255),
@@ -5,6 +5,8 @@ from core.data.items import get_item
 from core.data.materials import material_name
 from core.scenes.scene import Manager, Scene
 from core.data.synthesis import SynthesisRecipe, iter_recipes
+from core.ui.panels import draw_overlay, draw_panel
+from core.ui.text_cache import render_text
 
 
 class SynthesisScene(Scene):
@@ -42,17 +44,14 @@ class SynthesisScene(Scene):
         return self._recipes.get(self._selected_recipe_id)
 
     def _draw_panel_background(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
-        surface.fill((35, 35, 60), rect)
-        pygame.draw.rect(surface, (90, 90, 140), rect, width=2)
+        draw_panel(surface, rect)
 
     def draw(self, surface: pygame.Surface) -> None:
         screen_rect = surface.get_rect()
-        overlay = pygame.Surface(screen_rect.size, pygame.SRCALPHA)
-        overlay.fill((15, 15, 35, 235))
-        surface.blit(overlay, (0, 0))
+        draw_overlay(surface)
 
         button_padding = 16
-        back_label = self.font.render("Back", True, (0, 0, 0))
+        back_label = render_text(self.font, "Back", True, (0, 0, 0))
         btn_w = back_label.get_width() + button_padding * 2
         btn_h = back_label.get_height() + button_padding
         self._back_button_rect = pygame.Rect(60, 40, btn_w, btn_h)
@@ -61,7 +60,7 @@ class SynthesisScene(Scene):
         back_label_rect = back_label.get_rect(center=self._back_button_rect.center)
         surface.blit(back_label, back_label_rect)
 
-        header = self.font.render("Synthesis", True, (235, 235, 245))
+        header = render_text(self.font, "Synthesis", True, (235, 235, 245))
         surface.blit(header, (screen_rect.centerx - header.get_width() // 2, 50))
 
         panel_top = self._back_button_rect.bottom + 30
@@ -69,7 +68,7 @@ class SynthesisScene(Scene):
         material_panel_rect = pygame.Rect(60, panel_top, material_panel_width, 420)
         self._draw_panel_background(surface, material_panel_rect)
 
-        title = self.font.render("Materials", True, (230, 230, 240))
+        title = render_text(self.font, "Materials", True, (230, 230, 240))
         surface.blit(title, (material_panel_rect.left + 16, material_panel_rect.top + 16))
 
         y = material_panel_rect.top + 16 + title.get_height() + 12
@@ -78,13 +77,13 @@ class SynthesisScene(Scene):
             key=lambda item: material_name(item[0])
         )
         if not materials:
-            empty = self.font.render("(None)", True, (200, 200, 210))
+            empty = render_text(self.font, "(None)", True, (200, 200, 210))
             surface.blit(empty, (material_panel_rect.left + 16, y))
             y += empty.get_height() + 8
         else:
             for material_id, qty in materials:
                 label = f"{material_name(material_id)} x{qty}"
-                label_surf = self.font.render(label, True, (220, 220, 230))
+                label_surf = render_text(self.font, label, True, (220, 220, 230))
                 surface.blit(label_surf, (material_panel_rect.left + 16, y))
                 y += label_surf.get_height() + 8
 
@@ -98,7 +97,7 @@ class SynthesisScene(Scene):
         )
         self._draw_panel_background(surface, recipe_panel_rect)
 
-        recipe_title = self.font.render("Recipes", True, (230, 230, 240))
+        recipe_title = render_text(self.font, "Recipes", True, (230, 230, 240))
         surface.blit(recipe_title, (recipe_panel_rect.left + 16, recipe_panel_rect.top + 16))
 
         self._recipe_buttons = []
@@ -115,13 +114,12 @@ class SynthesisScene(Scene):
             fill = (40, 80, 45) if craftable else (80, 40, 40)
             if recipe.recipe_id == self._selected_recipe_id:
                 fill = (70, 100, 140)
-            surface.fill(fill, rect)
-            pygame.draw.rect(surface, (20, 20, 30), rect, width=2)
+            draw_panel(surface, rect, fill, (20, 20, 30))
 
             label = f"{recipe.name}"
             if not craftable:
                 label += " (Missing)"
-            label_surf = self.font.render(label, True, (245, 245, 245))
+            label_surf = render_text(self.font, label, True, (245, 245, 245))
             surface.blit(label_surf, (rect.left + 12, rect.top + 6))
 
             self._recipe_buttons.append({
@@ -137,12 +135,13 @@ class SynthesisScene(Scene):
             cost_text = ", ".join(
                 f"{material_name(mid)} x{qty}" for mid, qty in selected.materials.items()
             ) or "No materials"
-            cost_label = self.font.render(f"Cost: {cost_text}", True, (235, 235, 245))
+            cost_label = render_text(self.font, f"Cost: {cost_text}", True, (235, 235, 245))
             surface.blit(cost_label, (recipe_panel_rect.left, details_top))
             details_top += cost_label.get_height() + 12
 
             result = get_item(selected.output_item_id)
-            result_label = self.font.render(
+            result_label = render_text(
+                self.font,
                 f"Creates: {result.name}",
                 True,
                 (235, 235, 245),
@@ -150,7 +149,7 @@ class SynthesisScene(Scene):
             surface.blit(result_label, (recipe_panel_rect.left, details_top))
             details_top += result_label.get_height() + 20
 
-            craft_label = self.font.render("Craft Item", True, (0, 0, 0))
+            craft_label = render_text(self.font, "Craft Item", True, (0, 0, 0))
             btn_w = craft_label.get_width() + button_padding * 2
             btn_h = craft_label.get_height() + button_padding
             self._craft_button_rect = pygame.Rect(
@@ -161,15 +160,14 @@ class SynthesisScene(Scene):
             )
             craftable = self.inventory.has_materials(selected.materials)
             fill_color = (200, 200, 200) if craftable else (90, 90, 90)
-            surface.fill(fill_color, self._craft_button_rect)
-            pygame.draw.rect(surface, (50, 50, 50), self._craft_button_rect, 2)
+            draw_panel(surface, self._craft_button_rect, fill_color, (50, 50, 50))
             surface.blit(
                 craft_label,
                 craft_label.get_rect(center=self._craft_button_rect.center),
             )
 
         if self._message:
-            msg_label = self.font.render(self._message, True, (250, 220, 120))
+            msg_label = render_text(self.font, self._message, True, (250, 220, 120))
             msg_rect = msg_label.get_rect()
             msg_rect.midbottom = (
                 screen_rect.centerx,
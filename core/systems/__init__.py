@@ -1,5 +1,10 @@
 """Engine-level systems that support rendering and other shared services."""
 
 __all__ = [
+    "assets",
+    "power",
+    "profiling",
+    "recording",
+    "simulation",
     "render",
 ]
@@ -0,0 +1,185 @@
+"""Shared image cache that decodes on a worker thread.
+
+Images are keyed by path and target size. ``request`` queues a decode (file
+read, ``image.load`` and ``smoothscale``) on a daemon thread; ``pump``, run
+on the main thread, converts finished images for the display and files them,
+and ``get`` returns whatever is ready without blocking. ``generation`` goes
+up whenever new images arrive so scenes know to redraw. Files that are
+missing or fail to decode are remembered as missing and never retried.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+import pygame
+
+from core.data.encounters import DEFAULT_ENCOUNTER_POOLS, ENEMY_DEFINITIONS
+from core.data.locations import adjacent_locations, get_location
+
+
+Size = Optional[Tuple[int, int]]
+AssetKey = Tuple[str, Size, bool]
+
+# Portrait and board sprite sizes the battle screen asks for.
+PORTRAIT_SIZE = (96, 96)
+SPRITE_SIZE = (76, 76)
+
+_MISSING = object()
+
+
+class AssetManager:
+    """Images keyed by ``(path, size, alpha)``, decoded off the main thread."""
+
+    def __init__(self) -> None:
+        self._surfaces: Dict[AssetKey, object] = {}
+        self._requested: set[AssetKey] = set()
+        self._jobs: "queue.SimpleQueue[AssetKey | None]" = queue.SimpleQueue()
+        self._done: "queue.SimpleQueue[Tuple[AssetKey, pygame.Surface | None]]" = queue.SimpleQueue()
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._thread: threading.Thread | None = None
+        self.generation = 0
+
+    # --- main thread ---------------------------------------------------------
+
+    def request(self, path: str | None, size: Size = None, *, alpha: bool = True) -> None:
+        """Queue ``path`` for decoding at ``size`` unless already known."""
+        if not path:
+            return
+        key = (path, None if size is None else tuple(size), bool(alpha))
+        if key in self._requested:
+            return
+        self._requested.add(key)
+        with self._cond:
+            self._in_flight += 1
+        self._ensure_worker()
+        self._jobs.put(key)
+
+    def get(self, path: str | None, size: Size = None, *, alpha: bool = True) -> pygame.Surface | None:
+        """The converted image if it is ready; otherwise request it and return None."""
+        if not path:
+            return None
+        self.pump()
+        key = (path, None if size is None else tuple(size), bool(alpha))
+        surface = self._surfaces.get(key)
+        if surface is None:
+            self.request(path, size, alpha=alpha)
+            return None
+        return None if surface is _MISSING else surface
+
+    def ready(self, path: str | None, size: Size = None, *, alpha: bool = True) -> bool:
+        """True once ``path`` has been decoded or found missing."""
+        if not path:
+            return True
+        self.pump()
+        return (path, None if size is None else tuple(size), bool(alpha)) in self._surfaces
+
+    def pump(self) -> int:
+        """Convert and store finished decodes; return how many arrived."""
+        arrived = 0
+        while True:
+            try:
+                key, image = self._done.get_nowait()
+            except queue.Empty:
+                break
+            self._surfaces[key] = _MISSING if image is None else self._convert(image, key[2])
+            arrived += 1
+        if arrived:
+            self.generation += 1
+        return arrived
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until every requested image is decoded, then ``pump``."""
+        with self._cond:
+            done = self._cond.wait_for(lambda: self._in_flight == 0, timeout)
+        self.pump()
+        return done
+
+    def prefetch(self, paths: Iterable[Tuple[str | None, Size]], *, alpha: bool = True) -> None:
+        for path, size in paths:
+            self.request(path, size, alpha=alpha)
+
+    def prefetch_location(self, location_id: str, screen_size: Size = None) -> None:
+        """Queue the background and enemy sprites of a location and its neighbours.
+
+        Backgrounds are scaled to ``screen_size``, the size of the surface
+        scenes draw into (not the window, when the display is scaled); they
+        are skipped until that is known.
+        """
+        for location in (get_location(location_id), *adjacent_locations(location_id)):
+            if screen_size is not None:
+                self.request(location.background_image, screen_size, alpha=False)
+            for entry in DEFAULT_ENCOUNTER_POOLS.get(location.encounter_pool, ()):
+                template = {**ENEMY_DEFINITIONS.get(entry.get("enemy_id"), {}), **entry}
+                self.request(template.get("portrait_path"), SPRITE_SIZE)
+
+    def clear(self) -> None:
+        self.pump()
+        self._surfaces.clear()
+        self._requested.clear()
+
+    def stats(self) -> dict:
+        return {
+            "images": sum(1 for surface in self._surfaces.values() if surface is not _MISSING),
+            "missing": sum(1 for surface in self._surfaces.values() if surface is _MISSING),
+            "pending": self._in_flight,
+            "generation": self.generation,
+        }
+
+    @staticmethod
+    def _convert(image: pygame.Surface, alpha: bool) -> pygame.Surface:
+        if pygame.display.get_surface() is None:
+            return image
+        return image.convert_alpha() if alpha else image.convert()
+
+    # --- worker thread -------------------------------------------------------
+
+    def _ensure_worker(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="assets", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        # Only the scaled result is served, so full-size decodes are not
+        # kept; another size of the same file is decoded again.
+        missing: set[str] = set()
+        while True:
+            key = self._jobs.get()
+            if key is None:
+                return
+            path, size, _ = key
+            image = None
+            try:
+                if path not in missing:
+                    image = pygame.image.load(path)
+                if image is not None and size is not None and image.get_size() != size:
+                    image = pygame.transform.smoothscale(image, size)
+            except (pygame.error, OSError, ValueError):
+                missing.add(path)
+                image = None
+            finally:
+                self._done.put((key, image))
+                with self._cond:
+                    self._in_flight -= 1
+                    self._cond.notify_all()
+
+
+_default_assets: AssetManager | None = None
+
+
+def default_assets() -> AssetManager:
+    global _default_assets
+    if _default_assets is None:
+        _default_assets = AssetManager()
+    return _default_assets
+
+
+__all__ = [
+    "AssetManager",
+    "PORTRAIT_SIZE",
+    "SPRITE_SIZE",
+    "default_assets",
+]
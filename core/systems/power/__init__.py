@@ -0,0 +1,128 @@
+"""Throttle rendering while nobody is watching.
+
+``FramePacer`` follows window and input events and picks a mode: ACTIVE
+(full frame rate), IDLE (no input for ``idle_after_s``), UNFOCUSED or
+HIDDEN (minimised). Outside ACTIVE the game loop sleeps in
+``pygame.event.wait`` for ``wait_ms`` and draws at most ``draw_fps`` times
+a second (never while hidden); the simulation still runs every fixed step,
+just in larger batches per wake-up. Any input wakes the loop immediately
+and returns it to ACTIVE.
+"""
+
+from __future__ import annotations
+
+from enum import Enum, auto
+
+import pygame
+
+
+class PowerMode(Enum):
+    ACTIVE = auto()
+    IDLE = auto()
+    UNFOCUSED = auto()
+    HIDDEN = auto()
+
+
+_INPUT_EVENTS = frozenset(
+    (
+        pygame.KEYDOWN,
+        pygame.KEYUP,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEMOTION,
+        pygame.MOUSEWHEEL,
+        pygame.TEXTINPUT,
+        pygame.JOYBUTTONDOWN,
+        pygame.JOYAXISMOTION,
+    )
+)
+_HIDE_EVENTS = frozenset((pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN))
+_SHOW_EVENTS = frozenset((pygame.WINDOWRESTORED, pygame.WINDOWSHOWN, pygame.WINDOWMAXIMIZED))
+
+
+class FramePacer:
+    """Decides how often the game loop wakes and draws."""
+
+    IDLE_AFTER_S = 60.0
+    # Frames drawn per second in each low-power mode (0 = none).
+    DRAW_FPS = {PowerMode.IDLE: 5.0, PowerMode.UNFOCUSED: 2.0, PowerMode.HIDDEN: 0.0}
+    # How often the loop wakes to advance the simulation while throttled.
+    WAKE_HZ = 4.0
+
+    def __init__(self, max_fps: int = 60, *, idle_after_s: float | None = None, enabled: bool = True) -> None:
+        self.max_fps = max_fps
+        self.idle_after_s = self.IDLE_AFTER_S if idle_after_s is None else float(idle_after_s)
+        self.enabled = enabled
+        self.focused = True
+        self.hidden = False
+        self._last_input: float | None = None
+        self._last_draw: float | None = None
+        self._now = 0.0
+
+    @property
+    def mode(self) -> PowerMode:
+        if not self.enabled:
+            return PowerMode.ACTIVE
+        if self.hidden:
+            return PowerMode.HIDDEN
+        if not self.focused:
+            return PowerMode.UNFOCUSED
+        if (
+            self.idle_after_s > 0
+            and self._last_input is not None
+            and self._now - self._last_input >= self.idle_after_s
+        ):
+            return PowerMode.IDLE
+        return PowerMode.ACTIVE
+
+    @property
+    def active(self) -> bool:
+        return self.mode is PowerMode.ACTIVE
+
+    def observe(self, event, now: float) -> bool:
+        """Note ``event``; return True if it woke the loop back to ACTIVE."""
+        was_active = self.active
+        self._now = now
+        if event.type in _INPUT_EVENTS:
+            self._last_input = now
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            self.focused = False
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            self.focused = True
+            self.hidden = False
+            self._last_input = now
+        elif event.type in _HIDE_EVENTS:
+            self.hidden = True
+        elif event.type in _SHOW_EVENTS:
+            self.hidden = False
+        return not was_active and self.active
+
+    def tick(self, now: float) -> None:
+        """Advance the pacer's clock; idleness starts counting from the first tick."""
+        self._now = now
+        if self._last_input is None:
+            self._last_input = now
+
+    def wait_ms(self) -> int:
+        """How long a throttled loop may sleep waiting for events."""
+        wake = self.WAKE_HZ
+        draw = self.DRAW_FPS.get(self.mode, 0.0)
+        return int(1000 / max(wake, draw))
+
+    def should_draw(self, now: float) -> bool:
+        """Whether to render a frame at ``now``; records the draw if so."""
+        mode = self.mode
+        if mode is not PowerMode.ACTIVE:
+            fps = self.DRAW_FPS.get(mode, 0.0)
+            if fps <= 0:
+                return False
+            if self._last_draw is not None and now - self._last_draw < 1.0 / fps:
+                return False
+        self._last_draw = now
+        return True
+
+
+__all__ = [
+    "FramePacer",
+    "PowerMode",
+]
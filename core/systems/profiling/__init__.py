@@ -0,0 +1,183 @@
+"""Rolling frame and subsystem timings for the in-game profiler overlay.
+
+Timings are ``perf_counter`` spans kept in fixed-size windows. Subsystem
+methods are timed by wrappers that ``enable`` installs on their classes and
+``disable`` removes again, so while the overlay is off the game runs the
+original, untouched methods and pays nothing. ``Manager`` times each scene's
+update and draw itself when it has an enabled profiler.
+"""
+
+from __future__ import annotations
+
+import functools
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Tuple
+
+WINDOW = 240
+
+
+def percentile(values, q: float) -> float:
+    """Nearest-rank ``q`` percentile (0..1) of ``values``; 0.0 when empty."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class SpanStats:
+    """The last ``WINDOW`` durations of one span, in seconds."""
+
+    def __init__(self, window: int = WINDOW) -> None:
+        self.samples: deque[float] = deque(maxlen=window)
+        self._frame_total = 0.0
+
+    def add(self, seconds: float) -> None:
+        self._frame_total += seconds
+
+    def close_frame(self) -> None:
+        self.samples.append(self._frame_total)
+        self._frame_total = 0.0
+
+    @property
+    def last(self) -> float:
+        return self.samples[-1] if self.samples else 0.0
+
+    @property
+    def p50(self) -> float:
+        return percentile(self.samples, 0.50)
+
+    @property
+    def p99(self) -> float:
+        return percentile(self.samples, 0.99)
+
+
+class Profiler:
+    """Collects per-frame span totals while ``enabled``."""
+
+    def __init__(self, window: int = WINDOW) -> None:
+        self.window = window
+        self.enabled = False
+        self.frames: deque[float] = deque(maxlen=window)
+        self.spans: Dict[str, SpanStats] = {}
+        self._targets: List[Tuple[type, str, str]] = []
+        self._originals: Dict[Tuple[type, str], Callable] = {}
+        self._frame_start: float | None = None
+
+    # --- collection ----------------------------------------------------------
+
+    def record(self, name: str, seconds: float) -> None:
+        stats = self.spans.get(name)
+        if stats is None:
+            stats = self.spans[name] = SpanStats(self.window)
+        stats.add(seconds)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def end_frame(self, now: float | None = None) -> None:
+        """Close the frame: store its length and every span's total for it."""
+        now = time.perf_counter() if now is None else now
+        if not self.enabled:
+            self._frame_start = None
+            return
+        if self._frame_start is not None:
+            self.frames.append(now - self._frame_start)
+            # Spans may be recorded from the simulation thread meanwhile.
+            for stats in list(self.spans.values()):
+                stats.close_frame()
+        self._frame_start = now
+
+    @property
+    def frame_p50(self) -> float:
+        return percentile(self.frames, 0.50)
+
+    @property
+    def frame_p99(self) -> float:
+        return percentile(self.frames, 0.99)
+
+    # --- method instrumentation ---------------------------------------------
+
+    def instrument(self, cls: type, method: str, name: str | None = None) -> None:
+        """Time ``cls.method`` as span ``name`` whenever the profiler is enabled."""
+        self._targets.append((cls, method, name or f"{cls.__name__}.{method}"))
+        if self.enabled:
+            self._patch(*self._targets[-1])
+
+    def enable(self) -> None:
+        if self.enabled:
+            return
+        self.enabled = True
+        for target in self._targets:
+            self._patch(*target)
+
+    def disable(self) -> None:
+        if not self.enabled:
+            return
+        self.enabled = False
+        for (cls, method), original in self._originals.items():
+            setattr(cls, method, original)
+        self._originals.clear()
+        self.frames.clear()
+        self.spans.clear()
+        self._frame_start = None
+
+    def toggle(self) -> bool:
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+        return self.enabled
+
+    def _patch(self, cls: type, method: str, name: str) -> None:
+        if (cls, method) in self._originals:
+            return
+        original = cls.__dict__[method]
+        record = self.record
+        perf_counter = time.perf_counter
+
+        @functools.wraps(original)
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                record(name, perf_counter() - start)
+
+        self._originals[(cls, method)] = original
+        setattr(cls, method, timed)
+
+
+def install_default_spans(profiler: Profiler) -> Profiler:
+    """Instrument the render and combat entry points the overlay reports."""
+    from core.gameplay.combat import TickController
+    from core.gameplay.combat.scheduler import AttackScheduler
+    from core.scenes.board import HexBoard
+    from core.systems.render import RenderSystem
+    from core.ui.battle_hud import BattleHUD
+
+    profiler.instrument(RenderSystem, "draw")
+    profiler.instrument(HexBoard, "draw")
+    profiler.instrument(BattleHUD, "draw")
+    profiler.instrument(TickController, "update")
+    # BattleScene runs its ticks through ``drain`` (shared by the scheduler).
+    profiler.instrument(TickController, "drain")
+    profiler.instrument(AttackScheduler, "update")
+    return profiler
+
+
+__all__ = [
+    "Profiler",
+    "SpanStats",
+    "install_default_spans",
+    "percentile",
+]
@@ -0,0 +1,411 @@
+"""Compact binary combat logs for seeded, reproducible battle sessions.
+
+A log starts with a header (seed, location, tick length, screen size and the
+starting save payload) followed by struct-packed records for every frame,
+attack, spawn, drop roll, level-up and player command. ``CombatRecorder``
+writes them from a background thread through a bounded queue; ``replay_log``
+re-runs a log headless and checks the battle reproduces it byte for byte.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import struct
+import threading
+import zlib
+from dataclasses import dataclass, field
+from enum import IntEnum
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+LOG_MAGIC = b"KHCL"
+LOG_VERSION = 1
+
+_HEADER = struct.Struct("<4sHqdHHHI")
+_TYPE = struct.Struct("<B")
+_FRAME = struct.Struct("<d")
+_ATTACK = struct.Struct("<BIBIii")
+_SPAWN = struct.Struct("<IHiB")
+_DROP = struct.Struct("<IBdB")
+_LEVEL_UP = struct.Struct("<HH")
+_COMMAND = struct.Struct("<BHB")
+_STATE = struct.Struct("<qH")
+_STATE_ACTOR = struct.Struct("<iiiH")
+
+SIDE_ACTOR = 0
+SIDE_ENEMY = 1
+
+
+class RecordType(IntEnum):
+    FRAME = 1
+    ATTACK = 2
+    SPAWN = 3
+    DROP = 4
+    LEVEL_UP = 5
+    COMMAND = 6
+    STATE = 7
+
+
+class CommandKind(IntEnum):
+    ATTACK = 0
+    ASSIGN_SPELL = 1
+    CYCLE_SPELL = 2
+
+
+@dataclass
+class LogHeader:
+    seed: int
+    location_id: str
+    tick_length_s: float
+    screen_size: Tuple[int, int]
+    initial_state: Dict[str, Any] = field(default_factory=dict)
+
+
+class CombatLog:
+    """Encodes combat events into an in-memory record buffer."""
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+        self.record_count = 0
+
+    def _append(self, record_type: RecordType, payload: bytes) -> None:
+        self.buffer += _TYPE.pack(record_type)
+        self.buffer += payload
+        self.record_count += 1
+
+    def frame(self, dt: float) -> None:
+        self._append(RecordType.FRAME, _FRAME.pack(dt))
+
+    def attack(
+        self,
+        attacker: Tuple[int, int],
+        defender: Tuple[int, int],
+        damage: int,
+        hp_after: int,
+    ) -> None:
+        self._append(
+            RecordType.ATTACK,
+            _ATTACK.pack(attacker[0], attacker[1], defender[0], defender[1], damage, hp_after),
+        )
+
+    def spawn(self, serial: int, name: str, level: int, hp: int) -> None:
+        encoded = name.encode("utf-8")[:255]
+        self._append(
+            RecordType.SPAWN,
+            _SPAWN.pack(serial, level, hp, len(encoded)) + encoded,
+        )
+
+    def drop(self, serial: int, index: int, roll: float, hit: bool) -> None:
+        self._append(RecordType.DROP, _DROP.pack(serial, index, roll, int(hit)))
+
+    def level_up(self, actor_index: int, level: int) -> None:
+        self._append(RecordType.LEVEL_UP, _LEVEL_UP.pack(actor_index, level))
+
+    def command(
+        self,
+        kind: CommandKind,
+        actor_index: int = 0,
+        spell_id: str | None = None,
+    ) -> None:
+        encoded = (spell_id or "").encode("utf-8")[:255]
+        self._append(
+            RecordType.COMMAND,
+            _COMMAND.pack(kind, actor_index, len(encoded)) + encoded,
+        )
+
+    def state(self, munny: int, actors: Sequence[Tuple[int, int, int, int]]) -> None:
+        payload = _STATE.pack(munny, len(actors))
+        for hp, mp, xp, level in actors:
+            payload += _STATE_ACTOR.pack(hp, mp, xp, level)
+        self._append(RecordType.STATE, payload)
+
+    def flush(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+class CombatRecorder(CombatLog):
+    """Streams a combat log to disk from a background writer thread.
+
+    Records are packed on the caller's thread into a pending buffer; ``flush``
+    hands that buffer to a bounded queue without blocking. If the writer falls
+    behind and the queue is full, the data stays pending and goes out with the
+    next flush, so recording never stalls a frame and never drops records.
+    If a write fails (e.g. the disk is full) the writer keeps draining the
+    queue without writing, so nothing blocks, and ``close`` raises the error.
+    """
+
+    # Longest ``close`` waits for the writer to finish the queued chunks.
+    CLOSE_TIMEOUT_S = 10.0
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        header: LogHeader,
+        *,
+        max_pending_chunks: int = 64,
+    ) -> None:
+        super().__init__()
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = self.path.open("wb")
+        self._handle.write(encode_header(header))
+        self._queue: queue.Queue[bytes | None] = queue.Queue(maxsize=max_pending_chunks)
+        self.deferred_flushes = 0
+        self._closed = False
+        self.error: OSError | None = None
+        self._thread = threading.Thread(
+            target=self._write_loop,
+            name="combat-recorder",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _write_loop(self) -> None:
+        while True:
+            chunk = self._queue.get()
+            if chunk is None:
+                break
+            if self.error is not None:
+                continue
+            try:
+                self._handle.write(chunk)
+            except OSError as exc:
+                self.error = exc
+
+    def flush(self) -> None:
+        if not self.buffer or self._closed:
+            return
+        try:
+            self._queue.put_nowait(bytes(self.buffer))
+        except queue.Full:
+            self.deferred_flushes += 1
+            return
+        self.buffer.clear()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self.buffer:
+                self._put(bytes(self.buffer))
+                self.buffer.clear()
+            self._put(None)
+            self._thread.join(self.CLOSE_TIMEOUT_S)
+        finally:
+            self._handle.close()
+        if self.error is not None:
+            raise OSError(f"Could not write combat log {self.path}") from self.error
+
+    def _put(self, chunk: bytes | None) -> None:
+        # Only block while a writer is alive to take the chunk.
+        while self._thread.is_alive():
+            try:
+                self._queue.put(chunk, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+
+def encode_header(header: LogHeader) -> bytes:
+    location = header.location_id.encode("utf-8")
+    state = zlib.compress(json.dumps(header.initial_state).encode("utf-8"))
+    width, height = header.screen_size
+    return (
+        _HEADER.pack(
+            LOG_MAGIC,
+            LOG_VERSION,
+            header.seed,
+            header.tick_length_s,
+            width,
+            height,
+            len(location),
+            len(state),
+        )
+        + location
+        + state
+    )
+
+
+def decode_header(data: bytes) -> Tuple[LogHeader, int]:
+    """Parse a log header; return it with the offset of the first record."""
+
+    if len(data) < _HEADER.size:
+        raise ValueError("Combat log is truncated")
+    magic, version, seed, tick, width, height, loc_len, state_len = _HEADER.unpack_from(data)
+    if magic != LOG_MAGIC:
+        raise ValueError("Not a combat log")
+    if version != LOG_VERSION:
+        raise ValueError(f"Unsupported combat log version {version}")
+    offset = _HEADER.size
+    location = data[offset:offset + loc_len].decode("utf-8")
+    offset += loc_len
+    state = json.loads(zlib.decompress(data[offset:offset + state_len]))
+    offset += state_len
+    header = LogHeader(
+        seed=seed,
+        location_id=location,
+        tick_length_s=tick,
+        screen_size=(width, height),
+        initial_state=state,
+    )
+    return header, offset
+
+
+def iter_records(data: bytes, offset: int = 0) -> Iterator[Tuple[RecordType, tuple, bytes]]:
+    """Yield ``(type, fields, raw_bytes)`` for each record in ``data``."""
+
+    end = len(data)
+    while offset < end:
+        start = offset
+        record_type = RecordType(data[offset])
+        offset += 1
+        if record_type is RecordType.FRAME:
+            fields = _FRAME.unpack_from(data, offset)
+            offset += _FRAME.size
+        elif record_type is RecordType.ATTACK:
+            fields = _ATTACK.unpack_from(data, offset)
+            offset += _ATTACK.size
+        elif record_type is RecordType.SPAWN:
+            serial, level, hp, name_len = _SPAWN.unpack_from(data, offset)
+            offset += _SPAWN.size
+            name = data[offset:offset + name_len].decode("utf-8")
+            offset += name_len
+            fields = (serial, name, level, hp)
+        elif record_type is RecordType.DROP:
+            serial, index, roll, hit = _DROP.unpack_from(data, offset)
+            offset += _DROP.size
+            fields = (serial, index, roll, bool(hit))
+        elif record_type is RecordType.LEVEL_UP:
+            fields = _LEVEL_UP.unpack_from(data, offset)
+            offset += _LEVEL_UP.size
+        elif record_type is RecordType.COMMAND:
+            kind, actor_index, spell_len = _COMMAND.unpack_from(data, offset)
+            offset += _COMMAND.size
+            spell_id = data[offset:offset + spell_len].decode("utf-8") or None
+            offset += spell_len
+            fields = (CommandKind(kind), actor_index, spell_id)
+        else:
+            munny, count = _STATE.unpack_from(data, offset)
+            offset += _STATE.size
+            actors = []
+            for _ in range(count):
+                actors.append(_STATE_ACTOR.unpack_from(data, offset))
+                offset += _STATE_ACTOR.size
+            fields = (munny, tuple(actors))
+        yield record_type, fields, bytes(data[start:offset])
+
+
+def read_log(path: str | os.PathLike[str]) -> Tuple[LogHeader, List[Tuple[RecordType, tuple, bytes]]]:
+    data = Path(path).read_bytes()
+    header, offset = decode_header(data)
+    return header, list(iter_records(data, offset))
+
+
+@dataclass
+class ReplayResult:
+    matched: bool
+    records: int
+    frames: int
+    mismatch_index: int | None = None
+    expected: tuple | None = None
+    actual: tuple | None = None
+
+    def __str__(self) -> str:
+        if self.matched:
+            return f"Replay OK: {self.records} records over {self.frames} frames"
+        return (
+            f"Replay diverged at record {self.mismatch_index}: "
+            f"expected {self.expected}, got {self.actual}"
+        )
+
+
+def replay_log(path: str | os.PathLike[str], *, font=None) -> ReplayResult:
+    """Re-run a recorded session headless and compare every record.
+
+    Uses the SDL dummy video driver when no display is open. Sessions that
+    used overlay scenes (equipping, crafting, item levels) change state the
+    log does not capture and will report a divergence.
+    """
+
+    header, expected = read_log(path)
+
+    import pygame
+
+    if not pygame.display.get_init() or pygame.display.get_surface() is None:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        pygame.display.set_mode(header.screen_size)
+    if not pygame.font.get_init():
+        pygame.font.init()
+    if font is None:
+        font = pygame.font.Font(None, 24)
+
+    from core.data.savegame import state_from_payload
+    from core.scenes.battle_scene import BattleScene
+    from core.scenes.scene import Manager
+
+    state = state_from_payload("replay", header.initial_state)
+    log = CombatLog()
+    manager = Manager()
+    scene = BattleScene(
+        font,
+        controller=manager.controller,
+        location_id=header.location_id,
+        inventory=state.inventory,
+        actors=state.actors,
+        seed=header.seed,
+        recorder=log,
+    )
+    manager.set_scene(scene)
+    screen_rect = pygame.Rect((0, 0), header.screen_size)
+
+    frames = 0
+    for record_type, fields, _ in expected:
+        if record_type is RecordType.COMMAND:
+            kind, actor_index, spell_id = fields
+            if kind is CommandKind.ATTACK:
+                scene._handle_action_attack()
+            elif kind is CommandKind.ASSIGN_SPELL:
+                scene._assign_spell_to_actor(actor_index, spell_id)
+            else:
+                scene.cycle_actor_spell(actor_index)
+        elif record_type is RecordType.FRAME:
+            scene.update(fields[0])
+            scene.sync_board(screen_rect)
+            frames += 1
+        elif record_type is RecordType.STATE:
+            scene.record_state()
+
+    actual = list(iter_records(bytes(log.buffer)))
+    for index, (want, got) in enumerate(zip(expected, actual)):
+        if want[2] != got[2]:
+            return ReplayResult(False, index, frames, index, want[:2], got[:2])
+    if len(expected) != len(actual):
+        index = min(len(expected), len(actual))
+        want = expected[index][:2] if index < len(expected) else None
+        got = actual[index][:2] if index < len(actual) else None
+        return ReplayResult(False, index, frames, index, want, got)
+    return ReplayResult(True, len(expected), frames)
+
+
+__all__ = [
+    "CombatLog",
+    "CombatRecorder",
+    "CommandKind",
+    "LogHeader",
+    "RecordType",
+    "ReplayResult",
+    "SIDE_ACTOR",
+    "SIDE_ENEMY",
+    "decode_header",
+    "encode_header",
+    "iter_records",
+    "read_log",
+    "replay_log",
+]
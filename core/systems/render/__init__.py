@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import os
-
 from enum import Enum, auto
 from typing import Callable, Dict, Optional
 
 import pygame
 
+from core.systems.assets import AssetManager, default_assets
+
 
 class RenderLayer(Enum):
     """Logical render layers processed in back-to-front order."""
@@ -20,7 +20,7 @@ class RenderLayer(Enum):
 class RenderSystem:
     """Owns shared render state such as the board and sprite layers."""
 
-    def __init__(self) -> None:
+    def __init__(self, assets: AssetManager | None = None) -> None:
         self._background_color: tuple[int, int, int] = (20, 20, 20)
         self._board_factory: Optional[Callable[[pygame.Rect], object]] = None
         self._screen_size: tuple[int, int] | None = None
@@ -28,10 +28,8 @@ class RenderSystem:
         self.layers: Dict[RenderLayer, pygame.sprite.LayeredUpdates] = {
             layer: pygame.sprite.LayeredUpdates() for layer in RenderLayer
         }
+        self.assets = assets if assets is not None else default_assets()
         self._background_image_path: str | None = None
-        self._background_surface: pygame.Surface | None = None
-        self._scaled_background: pygame.Surface | None = None
-        self._scaled_background_size: tuple[int, int] | None = None
 
     def set_background_color(self, color: tuple[int, int, int]) -> None:
         self._background_color = tuple(int(c) for c in color)
@@ -42,12 +40,9 @@ class RenderSystem:
         self._board_factory = factory
 
     def set_background_image(self, path: str | None) -> None:
-        """Assign a background image path, reloading on the next draw."""
+        """Assign a background image path, shown once the asset manager has it."""
 
         self._background_image_path = path
-        self._background_surface = None
-        self._scaled_background = None
-        self._scaled_background_size = None
 
     def ensure_board(self, screen_rect: pygame.Rect) -> bool:
         """Ensure the board matches the current screen; return True if rebuilt."""
@@ -58,11 +53,19 @@ class RenderSystem:
         if self.board is None or self._screen_size != size:
             self.board = self._board_factory(screen_rect)
             self._screen_size = size
+            # Boards with static tiles pre-render them once per rebuild.
+            render_static = getattr(self.board, "render_static", None)
+            if render_static is not None:
+                render_static()
             return True
         return False
 
-    def draw(self, surface: pygame.Surface) -> None:
-        """Draw background, board, and any registered sprite layers."""
+    def draw(self, surface: pygame.Surface, *, board_occupants=None) -> None:
+        """Draw background, board, and any registered sprite layers.
+
+        ``board_occupants`` (coord -> token) replaces the board's own
+        occupancy, for drawing a snapshot owned by another thread.
+        """
 
         background = self._background_for_size(surface.get_size())
         if background is not None:
@@ -71,7 +74,10 @@ class RenderSystem:
             surface.fill(self._background_color)
         if self.board is not None:
             try:
-                self.board.draw(surface)
+                if board_occupants is None:
+                    self.board.draw(surface)
+                else:
+                    self.board.draw(surface, occupants=board_occupants)
             except AttributeError:
                 pass
         for layer in RenderLayer:
@@ -82,27 +88,5 @@ class RenderSystem:
     # --- internal helpers -------------------------------------------------
 
     def _background_for_size(self, size: tuple[int, int]) -> pygame.Surface | None:
-        image = self._load_background_surface()
-        if image is None:
-            return None
-        if self._scaled_background is not None and self._scaled_background_size == size:
-            return self._scaled_background
-        self._scaled_background = pygame.transform.smoothscale(image, size)
-        self._scaled_background_size = size
-        return self._scaled_background
-
-    def _load_background_surface(self) -> pygame.Surface | None:
-        if self._background_image_path is None:
-            return None
-        if self._background_surface is not None:
-            return self._background_surface
-        if not os.path.exists(self._background_image_path):
-            self._background_surface = None
-            return None
-        try:
-            self._background_surface = pygame.image.load(
-                self._background_image_path
-            ).convert()
-        except pygame.error:
-            self._background_surface = None
-        return self._background_surface
+        # Decoded and scaled on the asset worker; plain fill until it arrives.
+        return self.assets.get(self._background_image_path, size, alpha=False)
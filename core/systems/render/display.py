@@ -0,0 +1,125 @@
+"""Draw scenes at a fixed internal resolution and scale them to the window.
+
+``ScaledDisplay.surface`` is what scenes draw into. With no internal size
+(or one equal to the window) it is the window itself and ``present`` just
+flips. Otherwise frames go to an off-screen surface of the chosen size and
+are scaled into a letterboxed viewport of the window in one pass, so frame
+cost follows the internal resolution rather than the monitor's. Mouse
+events are mapped back into internal coordinates by ``remap_event``; clicks
+on the letterbox bars land outside the internal surface and hit nothing.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Sequence, Tuple
+
+import pygame
+
+
+_POSITIONED_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION)
+
+
+def parse_size(text: str) -> Tuple[int, int]:
+    """``"1280x720"`` -> ``(1280, 720)``."""
+    try:
+        width, height = (int(part) for part in text.lower().split("x"))
+    except ValueError as exc:
+        raise ValueError(f"Expected WIDTHxHEIGHT, got '{text}'") from exc
+    if width <= 0 or height <= 0:
+        raise ValueError(f"Expected a positive size, got '{text}'")
+    return width, height
+
+
+class ScaledDisplay:
+    """Owns the surface scenes draw into and presents it to the window."""
+
+    def __init__(
+        self,
+        window: pygame.Surface,
+        internal_size: Tuple[int, int] | None = None,
+        *,
+        smooth: bool = True,
+    ) -> None:
+        self.internal_size = tuple(internal_size) if internal_size else None
+        self.smooth = smooth
+        self._offscreen: pygame.Surface | None = None
+        self.resize(window)
+
+    @property
+    def scaled(self) -> bool:
+        return self.surface is not self.window
+
+    def resize(self, window: pygame.Surface) -> None:
+        """Adopt a new window surface, e.g. after ``VIDEORESIZE``."""
+        self.window = window
+        size = self.internal_size
+        if size is None or size == window.get_size():
+            self.surface = window
+            self.viewport = window.get_rect()
+            return
+        if self._offscreen is None:
+            self._offscreen = pygame.Surface(size).convert(window)
+        self.surface = self._offscreen
+        scale = min(window.get_width() / size[0], window.get_height() / size[1])
+        self.viewport = pygame.Rect(0, 0, round(size[0] * scale), round(size[1] * scale))
+        self.viewport.center = window.get_rect().center
+        self._target = window.subsurface(self.viewport)
+        self._needs_clear = True
+
+    def to_internal(self, pos: Sequence[float]) -> Tuple[int, int]:
+        if not self.scaled:
+            return int(pos[0]), int(pos[1])
+        x = (pos[0] - self.viewport.x) * self.surface.get_width() / self.viewport.width
+        y = (pos[1] - self.viewport.y) * self.surface.get_height() / self.viewport.height
+        return math.floor(x), math.floor(y)
+
+    def remap_event(self, event: pygame.event.Event) -> pygame.event.Event:
+        """Return ``event`` with mouse positions in internal coordinates."""
+        if not self.scaled or event.type not in _POSITIONED_EVENTS:
+            return event
+        attributes = dict(event.dict, pos=self.to_internal(event.pos))
+        if "rel" in attributes:
+            rel = event.rel
+            attributes["rel"] = (
+                round(rel[0] * self.surface.get_width() / self.viewport.width),
+                round(rel[1] * self.surface.get_height() / self.viewport.height),
+            )
+        return pygame.event.Event(event.type, attributes)
+
+    def present(self, dirty: Sequence[pygame.Rect] | None) -> None:
+        """Show the frame; ``dirty`` as returned by ``Manager.draw``."""
+        if dirty is not None and not dirty:
+            return
+        if not self.scaled:
+            if dirty is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty)
+            return
+        if self._needs_clear:
+            self.window.fill((0, 0, 0))
+            self._needs_clear = False
+            dirty = None
+        smooth = self.smooth and self.surface.get_bitsize() >= 24
+        scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+        scale(self.surface, self.viewport.size, self._target)
+        if dirty is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update([self._to_window(rect) for rect in dirty])
+
+    def _to_window(self, rect: pygame.Rect) -> pygame.Rect:
+        sx = self.viewport.width / self.surface.get_width()
+        sy = self.viewport.height / self.surface.get_height()
+        left = self.viewport.x + int(rect.left * sx) - 1
+        top = self.viewport.y + int(rect.top * sy) - 1
+        right = self.viewport.x + int(rect.right * sx + 0.999) + 1
+        bottom = self.viewport.y + int(rect.bottom * sy + 0.999) + 1
+        return pygame.Rect(left, top, right - left, bottom - top).clip(self.viewport)
+
+
+__all__ = [
+    "ScaledDisplay",
+    "parse_size",
+]
@@ -0,0 +1,218 @@
+"""Run a scene's simulation on a dedicated thread.
+
+The owner (the pygame main thread) credits wall-clock time with ``feed``;
+the thread spends it in fixed steps, applies queued commands between steps
+and publishes ``snapshot()`` after each one. ``latest`` is replaced by a
+single attribute assignment, so readers never take a lock, which is why
+snapshots must be immutable. ``pause`` waits for the step in flight so the
+owner may touch simulation state directly, e.g. while an overlay scene
+edits the inventory; time fed while paused is banked until ``resume``.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import types
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class Gauge:
+    """Read-only copy of a ``Health``/``Mana`` pool."""
+
+    current: int
+    max: int
+
+    def is_dead(self) -> bool:
+        return self.current <= 0
+
+
+@dataclass(frozen=True, eq=False)
+class CombatantView:
+    """Immutable copy of the parts of a combatant the UI draws.
+
+    Attribute names mirror ``Actor``/``Enemy`` so HUD and board code can
+    draw either. Views compare by identity, as live combatants do.
+    """
+
+    name: str
+    level: int
+    health: Gauge
+    mana: Optional[Gauge] = None
+    current_spell: Any = None
+    spell_id: Optional[str] = None
+    xp: int = 0
+    xp_to_level: int = 0
+    portrait_path: Optional[str] = None
+    # HP at the start of the step this view was taken after, for blending.
+    previous_hp: Optional[int] = None
+
+    @classmethod
+    def of(cls, combatant, *, previous_hp: Optional[int] = None) -> "CombatantView":
+        mana = getattr(combatant, "mana", None)
+        return cls(
+            name=combatant.name,
+            level=getattr(combatant, "level", 1),
+            health=Gauge(combatant.health.current, combatant.health.max),
+            mana=Gauge(mana.current, mana.max) if mana is not None else None,
+            current_spell=getattr(combatant, "current_spell", None),
+            spell_id=getattr(combatant, "spell_id", None),
+            xp=getattr(combatant, "xp", 0),
+            xp_to_level=getattr(combatant, "xp_to_level", 0),
+            portrait_path=getattr(combatant, "portrait_path", None),
+            previous_hp=previous_hp,
+        )
+
+
+@dataclass(frozen=True)
+class BattleSnapshot:
+    """Everything ``BattleScene.draw`` needs, as of one simulation step."""
+
+    step: int
+    munny: int
+    actors: Tuple[CombatantView, ...]
+    enemies: Tuple[CombatantView, ...]
+    board: Mapping[Tuple[int, int], CombatantView]
+    ko_timers: Mapping[CombatantView, float]
+    drop_messages: Tuple[str, ...]
+    save_message: Optional[str]
+    time_scale: float
+    sim_backlog_s: float
+
+
+def frozen_mapping(values: Mapping) -> Mapping:
+    return types.MappingProxyType(dict(values))
+
+
+class SimulationThread:
+    """Fixed-step simulation loop on a daemon thread."""
+
+    def __init__(
+        self,
+        step: Callable[[float], None],
+        snapshot: Callable[[], Any],
+        *,
+        step_s: float,
+        name: str = "simulation",
+    ) -> None:
+        self._step = step
+        self._snapshot = snapshot
+        self.step_s = float(step_s)
+        self._commands: "queue.SimpleQueue[Tuple[Callable[..., Any], tuple]]" = queue.SimpleQueue()
+        self._cond = threading.Condition()
+        self._credit = 0.0
+        self._paused = False
+        self._busy = False
+        self._stopped = False
+        self.steps = 0
+        self.error: BaseException | None = None
+        self.latest = snapshot()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    @property
+    def pending_s(self) -> float:
+        return self._credit
+
+    @property
+    def paused(self) -> bool:
+        return self._paused
+
+    def start(self) -> None:
+        if not self._thread.is_alive() and not self._stopped:
+            self._thread.start()
+
+    def feed(self, dt: float) -> None:
+        """Credit ``dt`` seconds of simulation; banked while paused."""
+        self._raise_error()
+        with self._cond:
+            self._credit += max(0.0, float(dt))
+            self._cond.notify_all()
+
+    def submit(self, command: Callable[..., Any], *args: Any) -> None:
+        """Run ``command(*args)`` on the simulation thread before its next step."""
+        self._commands.put((command, args))
+        with self._cond:
+            self._cond.notify_all()
+
+    def pause(self) -> None:
+        """Stop stepping and wait until the step in flight has finished."""
+        with self._cond:
+            self._paused = True
+            while self._busy:
+                self._cond.wait()
+
+    def resume(self) -> None:
+        """Undo ``pause``; banked time and commands run from here on."""
+        with self._cond:
+            self._paused = False
+            self._cond.notify_all()
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Block until credited time and queued commands are used up."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self._stopped
+                or (not self._busy and self._commands.empty() and self._credit < self.step_s),
+                timeout,
+            )
+
+    def stop(self, timeout: float | None = 1.0) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def _raise_error(self) -> None:
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise RuntimeError("simulation thread failed") from error
+
+    def _run(self) -> None:
+        cond = self._cond
+        while True:
+            with cond:
+                while not self._stopped and (
+                    self._paused or (self._credit < self.step_s and self._commands.empty())
+                ):
+                    cond.wait()
+                if self._stopped:
+                    return
+                run_step = self._credit >= self.step_s
+                if run_step:
+                    self._credit -= self.step_s
+                self._busy = True
+            try:
+                while True:
+                    try:
+                        command, args = self._commands.get_nowait()
+                    except queue.Empty:
+                        break
+                    command(*args)
+                if run_step:
+                    self._step(self.step_s)
+                    self.steps += 1
+                self.latest = self._snapshot()
+            except BaseException as exc:  # surfaced on the owner's next feed
+                self.error = exc
+                with cond:
+                    self._stopped = True
+            finally:
+                with cond:
+                    self._busy = False
+                    cond.notify_all()
+
+
+__all__ = [
+    "BattleSnapshot",
+    "CombatantView",
+    "Gauge",
+    "SimulationThread",
+    "frozen_mapping",
+]
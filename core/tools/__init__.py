@@ -0,0 +1,16 @@
+"""Offline command-line tools for balancing and profiling.
+
+Each module exposes ``main(argv)``; ``python main.py <tool> ...`` dispatches
+to them through ``TOOLS``.
+"""
+
+TOOLS = {
+    "drops": "core.tools.drop_estimator",
+    "soak": "core.tools.soak",
+    "sweep": "core.tools.sweep",
+    "tune": "core.tools.tuner",
+}
+
+__all__ = [
+    "TOOLS",
+]
@@ -0,0 +1,283 @@
+"""Monte Carlo estimates of hourly rewards per location.
+
+Each sampled hour spawns waves of ``MIN_WAVE_SIZE``-``MAX_WAVE_SIZE`` enemies
+drawn uniformly from the location's encounter pool (as ``BattleScene`` and
+``EncounterPool.next_enemy`` do). Every kill spends that enemy's expected
+kill time from ``estimate_rates`` for the whole pool, which accounts for a
+wave attacking at once, and rolls its drops with ``roll_drops``, the same
+helper ``BattleScene`` uses. Hours are grouped into fixed-size chunks, each
+with its own RNG stream derived from ``(seed, location, chunk)``, and chunks
+run on a ``ProcessPoolExecutor``; results are identical for any worker count
+and throughput scales with cores.
+
+    python main.py drops --location destiny_islands_cove --hours 5000 \\
+        --first champion_belt
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import random
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Sequence
+
+from core.data.encounters import MAX_WAVE_SIZE, MIN_WAVE_SIZE, roll_drops
+from core.data.locations import get_location, iter_locations
+from core.gameplay.offline import DEFAULT_TICK_LENGTH_S, estimate_rates, location_enemies
+
+
+HOURS_PER_CHUNK = 50
+PERCENTILES = (5, 25, 50, 75, 95)
+FIRST_DROP_HORIZON_H = 500.0
+
+
+@dataclass
+class _Template:
+    kill_s: float
+    xp: int
+    munny: int
+    drops: List[dict]
+
+
+@dataclass
+class ChunkResult:
+    """Per-hour samples for one chunk: ``{metric: [value per hour]}``."""
+
+    hours: Dict[str, List[float]] = field(default_factory=dict)
+    first_drop_h: List[float] = field(default_factory=list)
+
+
+def _templates(location_id: str, party, tick_length_s: float) -> List[_Template]:
+    enemies = location_enemies(location_id)
+    rates = estimate_rates(party, enemies, tick_length_s=tick_length_s)
+    if rates is None:
+        raise ValueError("The party cannot win a fight here")
+    return [
+        _Template(
+            kill_s=kill_s,
+            xp=int(enemy.xp_reward),
+            munny=max(0, int(enemy.munny_reward or 0)),
+            drops=[dict(drop) for drop in enemy.drops],
+        )
+        for enemy, kill_s in zip(enemies, rates.enemy_kill_s)
+    ]
+
+
+def _drop_key(drop: dict) -> str | None:
+    if drop.get("item_id"):
+        return f"item:{drop['item_id']}"
+    if drop.get("material_id"):
+        return f"material:{drop['material_id']}"
+    return None
+
+
+def _kills(templates: Sequence[_Template], rng: random.Random) -> Iterator[_Template]:
+    """Endless kills, one spawned wave at a time."""
+    count = len(templates)
+    while True:
+        size = rng.randint(MIN_WAVE_SIZE, MAX_WAVE_SIZE)
+        yield from [templates[rng.randrange(count)] for _ in range(size)]
+
+
+def _sample_chunk(
+    templates: Sequence[_Template],
+    hours: int,
+    stream: str,
+    first_item: str | None,
+    trials: int,
+) -> ChunkResult:
+    rng = random.Random(stream)
+    result = ChunkResult()
+    samples: Dict[str, List[float]] = defaultdict(lambda: [0.0] * hours)
+    kills = _kills(templates, rng)
+    for hour in range(hours):
+        elapsed = 0.0
+        while True:
+            template = next(kills)
+            elapsed += template.kill_s
+            if elapsed > 3600.0:
+                break
+            samples["kills"][hour] += 1
+            samples["xp"][hour] += template.xp
+            samples["munny"][hour] += template.munny
+            for _, drop, _, hit in roll_drops(template.drops, rng):
+                key = _drop_key(drop)
+                if hit and key:
+                    samples[key][hour] += int(drop.get("amount", 1) or 1)
+    result.hours = dict(samples)
+
+    if first_item:
+        target = f"item:{first_item}"
+        horizon_s = FIRST_DROP_HORIZON_H * 3600.0
+        for _ in range(trials):
+            elapsed = 0.0
+            found = math.inf
+            kills = _kills(templates, rng)
+            while elapsed < horizon_s:
+                template = next(kills)
+                elapsed += template.kill_s
+                if any(
+                    hit and _drop_key(drop) == target
+                    for _, drop, _, hit in roll_drops(template.drops, rng)
+                ):
+                    found = elapsed / 3600.0
+                    break
+            result.first_drop_h.append(found)
+    return result
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of ``values`` (which need not be sorted)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@dataclass
+class Estimate:
+    location_id: str
+    hours: int
+    samples: Dict[str, List[float]]
+    first_item: str | None = None
+    first_drop_h: List[float] = field(default_factory=list)
+
+    def table(self) -> str:
+        header = ["metric / hour", "mean"] + [f"p{p}" for p in PERCENTILES]
+        rows = [header]
+        for key in sorted(self.samples, key=lambda k: (":" in k, k)):
+            values = self.samples[key]
+            mean = sum(values) / len(values) if values else 0.0
+            rows.append(
+                [key, f"{mean:.1f}"]
+                + [f"{percentile(values, p):g}" for p in PERCENTILES]
+            )
+        widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+        lines = [f"{self.location_id} ({self.hours} sampled hours)"]
+        for row in rows:
+            lines.append("  ".join(cell.rjust(width) for cell, width in zip(row, widths)))
+        if self.first_item:
+            found = [h for h in self.first_drop_h if math.isfinite(h)]
+            label = f"minutes to first {self.first_item}"
+            if not found:
+                lines.append(f"{label}: never within {FIRST_DROP_HORIZON_H:g}h")
+            else:
+                cells = ", ".join(
+                    f"p{p}={percentile(self.first_drop_h, p) * 60:.1f}" for p in PERCENTILES
+                )
+                lines.append(f"{label}: {cells} ({len(self.first_drop_h)} trials)")
+        return "\n".join(lines)
+
+
+def estimate_location(
+    location_id: str,
+    party,
+    *,
+    hours: int = 1000,
+    seed: int = 0,
+    workers: int | None = None,
+    first_item: str | None = None,
+    first_trials: int = 1000,
+    tick_length_s: float = DEFAULT_TICK_LENGTH_S,
+    executor: ProcessPoolExecutor | None = None,
+) -> Estimate:
+    """Sample ``hours`` hours of farming at ``location_id``."""
+
+    get_location(location_id)
+    templates = _templates(location_id, party, tick_length_s)
+    chunks = max(1, math.ceil(hours / HOURS_PER_CHUNK))
+    jobs = []
+    for chunk in range(chunks):
+        chunk_hours = min(HOURS_PER_CHUNK, hours - chunk * HOURS_PER_CHUNK)
+        trials = first_trials // chunks + (1 if chunk < first_trials % chunks else 0)
+        jobs.append(
+            (templates, chunk_hours, f"{seed}/{location_id}/{chunk}", first_item, trials)
+        )
+
+    if workers == 1 and executor is None:
+        results = [_sample_chunk(*job) for job in jobs]
+    else:
+        own = executor is None
+        pool = executor or ProcessPoolExecutor(max_workers=workers)
+        try:
+            results = list(pool.map(_sample_chunk, *zip(*jobs)))
+        finally:
+            if own:
+                pool.shutdown()
+
+    keys = sorted({key for chunk in results for key in chunk.hours})
+    merged: Dict[str, List[float]] = {key: [] for key in keys}
+    first: List[float] = []
+    for (_, chunk_hours, *_), chunk in zip(jobs, results):
+        for key in keys:
+            merged[key].extend(chunk.hours.get(key, [0.0] * chunk_hours))
+        first.extend(chunk.first_drop_h)
+    return Estimate(location_id, hours, merged, first_item, first)
+
+
+def _load_party(slot: str | None):
+    from core.data.savegame import create_default_state, load_state
+
+    state = load_state(slot) if slot else create_default_state("estimate")
+    return state.actors if state is not None else None
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="main.py drops",
+        description="Monte Carlo reward estimates per location.",
+    )
+    parser.add_argument(
+        "--location",
+        action="append",
+        help="location id (repeatable; default: every location)",
+    )
+    parser.add_argument("--hours", type=int, default=1000, help="hours to sample")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--first", metavar="ITEM_ID", help="also report hours to first ITEM_ID")
+    parser.add_argument("--trials", type=int, default=1000, help="trials for --first")
+    parser.add_argument("--slot", help="use the party from this save slot")
+    args = parser.parse_args(argv)
+
+    locations = args.location or [location.location_id for location in iter_locations()]
+    party = _load_party(args.slot)
+    if party is None:
+        parser.error(f"no such save slot: {args.slot}")
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for location_id in locations:
+            try:
+                estimate = estimate_location(
+                    location_id,
+                    party,
+                    hours=args.hours,
+                    seed=args.seed,
+                    first_item=args.first,
+                    first_trials=args.trials,
+                    executor=executor,
+                )
+            except (KeyError, ValueError) as exc:
+                print(f"{location_id}: {exc}", file=sys.stderr)
+                continue
+            print(estimate.table())
+            print()
+    return 0
+
+
+__all__ = [
+    "ChunkResult",
+    "Estimate",
+    "estimate_location",
+    "main",
+    "percentile",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,343 @@
+"""Run the real scene stack headless, driven by scripted input.
+
+Unlike ``main.py demo`` this goes through ``Manager`` and the actual scenes:
+a seeded ``BattleScene`` runs in fixed 60Hz steps as fast as the machine
+allows (no frame cap, no sleeping), is drawn into an off-screen surface
+every ``--draw-every`` simulated seconds, and every ``--cycle`` simulated
+seconds a player script clicks through the game: equip an item in the
+inventory, craft in synthesis, level an item, travel to the next location
+on the world map and save with F5. Saves go to a temporary directory unless
+``--save-dir`` is given.
+
+The report gives simulated seconds per wall-clock second and samples of
+process memory (RSS) and live Python allocations. After a one-cycle warm-up
+the allocation count should stay flat; growth beyond ``--max-growth`` is
+flagged and makes the tool exit with status 1.
+
+    python main.py soak --hours 4
+    python main.py soak --hours 0.5 --cycle 60 --draw-every 0.25
+"""
+
+from __future__ import annotations
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import argparse
+import sys
+import tempfile
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import pygame
+
+from core.data.locations import iter_locations
+from core.data.savegame import SAVE_DIR_ENV, create_default_state
+from core.scenes.battle_scene import BattleScene
+from core.scenes.scene import Manager
+from core.systems.assets import default_assets
+
+
+SCRIPT = ("inventory", "craft", "level", "travel", "save")
+# Longest simulated time handed to ``Manager.advance`` at once.
+_CHUNK_S = 1.0
+
+
+@dataclass(frozen=True)
+class MemorySample:
+    sim_s: float
+    wall_s: float
+    rss_bytes: int
+    blocks: int
+
+
+@dataclass
+class SoakReport:
+    sim_s: float = 0.0
+    wall_s: float = 0.0
+    frames_drawn: int = 0
+    actions: Counter = field(default_factory=Counter)
+    errors: List[str] = field(default_factory=list)
+    samples: List[MemorySample] = field(default_factory=list)
+    warmup_s: float = 0.0
+
+    @property
+    def sim_per_wall(self) -> float:
+        return self.sim_s / self.wall_s if self.wall_s > 0 else 0.0
+
+    def _baseline(self) -> MemorySample | None:
+        settled = [sample for sample in self.samples if sample.sim_s >= self.warmup_s]
+        return settled[0] if len(settled) >= 2 else None
+
+    def block_growth(self) -> float:
+        """Relative growth of live allocations since the end of the warm-up."""
+        baseline = self._baseline()
+        if baseline is None or baseline.blocks == 0:
+            return 0.0
+        return self.samples[-1].blocks / baseline.blocks - 1.0
+
+    def rss_growth(self) -> float:
+        baseline = self._baseline()
+        if baseline is None or baseline.rss_bytes == 0:
+            return 0.0
+        return self.samples[-1].rss_bytes / baseline.rss_bytes - 1.0
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+
+        # Peak rather than current RSS, in KiB on Linux and bytes on macOS.
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class HeadlessGame:
+    """A ``Manager`` with a battle, an off-screen surface and input helpers."""
+
+    def __init__(self, *, seed: int = 0, size: Tuple[int, int] = (1280, 720), slot: str = "soak") -> None:
+        pygame.display.init()
+        pygame.font.init()
+        if pygame.display.get_surface() is None:
+            pygame.display.set_mode((1, 1))
+        self.font = pygame.font.Font(None, 24)
+        self.surface = pygame.Surface(size).convert()
+        self.manager = Manager()
+        state = create_default_state(slot)
+        self.manager.set_scene(
+            BattleScene(
+                self.font,
+                controller=self.manager.controller,
+                location_id=state.location_id,
+                inventory=state.inventory,
+                actors=state.actors,
+                save_slot=slot,
+                save_created_at=state.created_at,
+                save_updated_at=state.updated_at,
+                seed=seed,
+            )
+        )
+        self.sim_s = 0.0
+
+    @property
+    def battle(self) -> BattleScene:
+        return self.manager.scenes[0]
+
+    @property
+    def top(self):
+        return self.manager.scenes[-1]
+
+    def advance(self, seconds: float) -> None:
+        while seconds > 1e-9:
+            chunk = min(seconds, _CHUNK_S)
+            self.manager.advance(chunk, catch_up=True)
+            self.sim_s += chunk
+            seconds -= chunk
+
+    def draw(self) -> None:
+        self.manager.draw(self.surface)
+
+    def click(self, rect: pygame.Rect) -> None:
+        """Left-click the centre of ``rect`` and redraw so new buttons exist."""
+        self.manager.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=rect.center, button=1))
+        self.draw()
+
+    def press(self, key: int) -> None:
+        self.manager.handle_event(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode=""))
+        self.draw()
+
+
+# --- scripted actions ---------------------------------------------------------
+# Each opens its screen through the battle HUD, does one thing a player would
+# and returns to the battle. Button rects are read off the scenes after a draw.
+
+
+def _open(game: HeadlessGame, button: str):
+    game.draw()
+    game.click(getattr(game.battle.hud, button))
+    return game.top
+
+
+def equip_first_item(game: HeadlessGame) -> None:
+    inventory = _open(game, "inventory_button_rect")
+    if inventory._item_buttons:
+        item = inventory._item_buttons[0]
+        game.click(item["rect"])
+        for slot in inventory._slot_buttons:
+            if slot["payload"]["slot"] == item["payload"]["slot"]:
+                game.click(slot["rect"])
+                break
+    game.click(inventory._back_button_rect)
+
+
+def craft_first_recipe(game: HeadlessGame) -> None:
+    synthesis = _open(game, "synthesis_button_rect")
+    buttons = synthesis._recipe_buttons
+    craftable = [
+        button for button in buttons
+        if synthesis.inventory.has_materials(synthesis._recipes[button["recipe_id"]].materials)
+    ]
+    if craftable or buttons:
+        game.click((craftable or buttons)[0]["rect"])
+        game.click(synthesis._craft_button_rect)
+    game.click(synthesis._back_button_rect)
+
+
+def level_first_item(game: HeadlessGame) -> None:
+    leveling = _open(game, "leveling_button_rect")
+    if leveling._item_buttons:
+        game.click(leveling._item_buttons[0]["rect"])
+        game.click(leveling._level_button_rect)
+    game.click(leveling._back_button_rect)
+
+
+def travel_to_next_location(game: HeadlessGame) -> None:
+    order = [location for location in iter_locations()]
+    ids = [location.location_id for location in order]
+    target = order[(ids.index(game.battle.location_id) + 1) % len(order)]
+    game.draw()
+    game.press(pygame.K_m)
+    world_map = game.top
+    for button in world_map._world_buttons:
+        if button["world_id"] == target.world_id:
+            game.click(button["rect"])
+            break
+    for button in world_map._location_buttons:
+        if button["location_id"] == target.location_id:
+            game.click(button["rect"])
+            break
+    # Wait for the new location's images, as a player would see them.
+    default_assets().wait(5.0)
+
+
+def save_game(game: HeadlessGame) -> None:
+    game.press(pygame.K_F5)
+
+
+ACTIONS: Dict[str, Callable[[HeadlessGame], None]] = {
+    "inventory": equip_first_item,
+    "craft": craft_first_recipe,
+    "level": level_first_item,
+    "travel": travel_to_next_location,
+    "save": save_game,
+}
+
+
+def run_soak(
+    hours: float,
+    *,
+    seed: int = 0,
+    cycle_s: float = 600.0,
+    draw_every_s: float = 1.0,
+    sample_every_s: float = 300.0,
+    script: Sequence[str] = SCRIPT,
+    game: HeadlessGame | None = None,
+    progress: Callable[[SoakReport], None] | None = None,
+) -> SoakReport:
+    """Simulate ``hours`` of play; run ``script`` once every ``cycle_s``."""
+    game = game or HeadlessGame(seed=seed)
+    report = SoakReport(warmup_s=cycle_s if script else 0.0)
+    total_s = hours * 3600.0
+    next_cycle = cycle_s
+    next_sample = 0.0
+    start = time.perf_counter()
+    while True:
+        now_s = game.sim_s
+        if now_s >= next_sample - 1e-9:
+            report.samples.append(
+                MemorySample(now_s, time.perf_counter() - start, _rss_bytes(), sys.getallocatedblocks())
+            )
+            next_sample += sample_every_s
+            if progress is not None:
+                report.sim_s, report.wall_s = now_s, time.perf_counter() - start
+                progress(report)
+        if now_s >= total_s - 1e-9:
+            break
+        if script and now_s >= next_cycle - 1e-9:
+            for name in script:
+                try:
+                    ACTIONS[name](game)
+                    report.actions[name] += 1
+                except Exception as exc:  # reported, the soak carries on
+                    report.errors.append(f"{now_s:.0f}s {name}: {type(exc).__name__}: {exc}")
+                if len(game.manager.scenes) > 1:
+                    report.errors.append(f"{now_s:.0f}s {name}: left {type(game.top).__name__} open")
+                    while len(game.manager.scenes) > 1:
+                        game.manager.pop_scene()
+            next_cycle += cycle_s
+        game.advance(min(draw_every_s, total_s - now_s))
+        game.draw()
+        report.frames_drawn += 1
+    report.sim_s = game.sim_s
+    report.wall_s = time.perf_counter() - start
+    return report
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="main.py soak",
+        description="Scripted headless play-through for throughput and memory soak runs.",
+    )
+    parser.add_argument("--hours", type=float, default=1.0, help="simulated hours to play")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cycle", type=float, default=600.0, help="simulated seconds between script runs")
+    parser.add_argument("--draw-every", type=float, default=1.0, help="simulated seconds between drawn frames")
+    parser.add_argument("--sample-every", type=float, default=300.0, help="simulated seconds between memory samples")
+    parser.add_argument("--max-growth", type=float, default=0.10, help="allowed allocation growth after warm-up")
+    parser.add_argument("--no-script", action="store_true", help="only fight; no scripted input")
+    parser.add_argument("--save-dir", help="where F5 saves go (default: a temporary directory)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="soak-saves-") as tmp:
+        os.environ[SAVE_DIR_ENV] = args.save_dir or tmp
+
+        def progress(report: SoakReport) -> None:
+            sample = report.samples[-1]
+            print(
+                f"{sample.sim_s / 3600:7.2f}h sim  {sample.wall_s:8.1f}s wall  "
+                f"{report.sim_per_wall:8.0f}x  rss {sample.rss_bytes / 2**20:7.1f}MiB  blocks {sample.blocks}"
+            )
+
+        report = run_soak(
+            args.hours,
+            seed=args.seed,
+            cycle_s=args.cycle,
+            draw_every_s=args.draw_every,
+            sample_every_s=args.sample_every,
+            script=() if args.no_script else SCRIPT,
+            progress=progress,
+        )
+    print(
+        f"Simulated {report.sim_s / 3600:.2f}h in {report.wall_s:.1f}s: "
+        f"{report.sim_per_wall:.0f} sim-s per wall-s, {report.frames_drawn} frames drawn"
+    )
+    print("Actions: " + ", ".join(f"{name} x{count}" for name, count in report.actions.items()))
+    for error in report.errors:
+        print(f"  error: {error}")
+    blocks, rss = report.block_growth(), report.rss_growth()
+    print(f"Growth after warm-up: allocations {blocks:+.1%}, RSS {rss:+.1%}")
+    if blocks > args.max_growth:
+        print(f"MEMORY GROWTH: allocations grew {blocks:.1%} (limit {args.max_growth:.0%})")
+        return 1
+    return 1 if report.errors else 0
+
+
+__all__ = [
+    "ACTIONS",
+    "HeadlessGame",
+    "MemorySample",
+    "SCRIPT",
+    "SoakReport",
+    "main",
+    "run_soak",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
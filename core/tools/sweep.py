@@ -0,0 +1,455 @@
+"""Headless balance sweep across party builds, loadouts and locations.
+
+Every cell of the grid (party template set x equipment loadout x location)
+builds its party with ``build_party``, then fights waves from the location's
+encounter pool on the same ``CombatSystem`` that ``run_combat_demo`` drives,
+but through an ``AttackScheduler`` so only attack ticks cost anything.
+Rewards, level-ups and knockouts follow ``BattleScene`` tick for tick: XP
+goes to every party member, knocked-out members revive ``KO_REVIVE_S``
+after the tick they fell on and a new wave of 2-4 enemies spawns on the tick
+the last one falls. Targeting does not:
+there is no hex board, so ``CombatSystem``'s default applies (the party
+focuses the first living enemy, enemies hit the first living member). Cells run on a
+``ProcessPoolExecutor``; each has its own RNG streams derived from
+``(seed, party, loadout, location)``, so results do not depend on the
+worker count.
+
+    python main.py sweep --hours 2 --out sweep.csv
+    python main.py sweep --grid grid.json --location destiny_islands_cove
+
+A grid file is JSON with optional ``parties`` (name -> list of templates in
+the shape of ``DEFAULT_PARTY_TEMPLATES``), ``loadouts`` (name -> {actor name
+or ``"*"``: [item ids]}; actors not listed keep their template loadout) and
+``locations`` (list of ids). Missing keys fall back to the defaults below.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import math
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+from core.data.encounters import (
+    DEFAULT_ENCOUNTER_POOLS,
+    MAX_WAVE_SIZE,
+    MIN_WAVE_SIZE,
+    EncounterPool,
+    roll_drops,
+)
+from core.data.locations import get_location, iter_locations
+from core.entities import Actor
+from core.gameplay.combat import KO_EPSILON_S, KO_REVIVE_S, CombatSystem
+from core.gameplay.combat.scheduler import AttackScheduler
+from core.gameplay.inventory import Inventory
+from core.gameplay.offline import DEFAULT_TICK_LENGTH_S
+from core.gameplay.party import DEFAULT_PARTY_TEMPLATES, build_party
+
+
+# Longest run of ticks between settles, as ``BattleScene.SIM_BATCH_TICKS``.
+# Kills, knockouts and revives end a batch early, so results do not depend
+# on it.
+SETTLE_TICKS = 25
+
+DEFAULT_PARTIES: Dict[str, List[dict]] = {
+    "default": [dict(template) for template in DEFAULT_PARTY_TEMPLATES],
+    "sora_solo": [dict(next(iter(DEFAULT_PARTY_TEMPLATES)))],
+}
+
+DEFAULT_LOADOUTS: Dict[str, Dict[str, List[str]]] = {
+    "starter": {},
+    "unarmed": {"*": []},
+    "belted": {
+        "Sora": ["kingdom_key", "champion_belt"],
+        "Donald": ["mages_staff", "champion_belt"],
+        "Goofy": ["knights_shield", "champion_belt"],
+    },
+}
+
+
+@dataclass(frozen=True)
+class Cell:
+    party: str
+    loadout: str
+    location_id: str
+
+    @property
+    def stream(self) -> str:
+        return f"{self.party}/{self.loadout}/{self.location_id}"
+
+
+@dataclass
+class CellResult:
+    """Outcome of one simulated cell; one CSV row."""
+
+    party: str
+    loadout: str
+    location_id: str
+    sim_hours: float
+    kills: int
+    seconds_per_kill: float
+    deaths: int
+    wipes: int
+    xp_per_hour: float
+    munny_per_hour: float
+    final_levels: str = ""
+    error: str = ""
+
+    @classmethod
+    def columns(cls) -> List[str]:
+        return [f.name for f in fields(cls)]
+
+
+@dataclass
+class Grid:
+    parties: Dict[str, List[dict]] = field(default_factory=lambda: dict(DEFAULT_PARTIES))
+    loadouts: Dict[str, Dict[str, List[str]]] = field(default_factory=lambda: dict(DEFAULT_LOADOUTS))
+    locations: List[str] = field(
+        default_factory=lambda: [location.location_id for location in iter_locations()]
+    )
+
+    def cells(self) -> List[Cell]:
+        return [
+            Cell(party, loadout, location_id)
+            for party in self.parties
+            for loadout in self.loadouts
+            for location_id in self.locations
+        ]
+
+    @classmethod
+    def from_file(cls, path: str | os.PathLike[str]) -> "Grid":
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        grid = cls()
+        if "parties" in data:
+            grid.parties = {name: list(templates) for name, templates in data["parties"].items()}
+        if "loadouts" in data:
+            grid.loadouts = {name: dict(loadout) for name, loadout in data["loadouts"].items()}
+        if "locations" in data:
+            grid.locations = list(data["locations"])
+        return grid
+
+
+def apply_loadout(templates: Iterable[Mapping], loadout: Mapping[str, Sequence[str]]) -> List[dict]:
+    """Copy ``templates`` with each actor's ``loadout`` replaced per ``loadout``."""
+    result = []
+    for template in templates:
+        data = dict(template)
+        name = data.get("name")
+        if name in loadout:
+            data["loadout"] = list(loadout[name])
+        elif "*" in loadout:
+            data["loadout"] = list(loadout["*"])
+        result.append(data)
+    return result
+
+
+class HeadlessCombat(CombatSystem):
+    """Combat system that handles party knockouts the way ``BattleScene`` does.
+
+    Knocked-out members keep their MP and revive at full HP ``KO_REVIVE_S``
+    after the tick they fell on. Drive it with ``drain(...,
+    stop=combat.settle_requested)`` in batches of at most
+    ``ticks_until_revive`` ticks and call ``settle`` after each batch, so
+    kills, knockouts and revives are handled on the tick they happen.
+    """
+
+    def __init__(self, actors, **kwargs) -> None:
+        super().__init__(actors, **kwargs)
+        self.ko_timers: Dict[Actor, float] = {}
+        self._ko_mana: Dict[Actor, int] = {}
+        self._new_knockouts: List[Actor] = []
+        self._settle_due = False
+
+    @property
+    def party_down(self) -> bool:
+        return len(self.ko_timers) == len(self.actors)
+
+    def settle_requested(self) -> bool:
+        return self._settle_due
+
+    def ticks_until_revive(self, tick_length_s: float) -> Optional[int]:
+        """Ticks until the next knocked-out member revives, if any is down."""
+        if not self.ko_timers:
+            return None
+        remaining = min(self.ko_timers.values())
+        return max(1, math.ceil(remaining / tick_length_s - KO_EPSILON_S))
+
+    def basic_attack(self, attacker, defender) -> int:
+        damage = super().basic_attack(attacker, defender)
+        if defender.health.is_dead():
+            self._settle_due = True
+            if isinstance(defender, Actor) and defender not in self.ko_timers:
+                self.ko_timers[defender] = KO_REVIVE_S
+                self._new_knockouts.append(defender)
+                self._ko_mana[defender] = defender.mana.current
+                defender.attack_state.reset()
+        return damage
+
+    def settle(self, elapsed_s: float) -> int:
+        """Charge ``elapsed_s`` to revive timers; return new knockouts.
+
+        Members knocked out on the batch's last tick start from there and
+        are not charged.
+        """
+        self._settle_due = False
+        for actor, remaining in list(self.ko_timers.items()):
+            if actor in self._new_knockouts:
+                continue
+            remaining -= elapsed_s
+            if remaining > KO_EPSILON_S:
+                self.ko_timers[actor] = remaining
+                continue
+            del self.ko_timers[actor]
+            actor.health.current = actor.health.max
+            actor.health.clamp()
+            if actor in self._ko_mana:
+                actor.mana.current = self._ko_mana.pop(actor)
+                actor.mana.clamp()
+            actor.attack_state.reset()
+        knockouts = len(self._new_knockouts)
+        self._new_knockouts.clear()
+        return knockouts
+
+
+def farm_waves(
+    party: Sequence[Actor],
+    pool: EncounterPool,
+    wave_rng: random.Random,
+    total_ticks: int,
+    *,
+    tick_length_s: float = DEFAULT_TICK_LENGTH_S,
+    level_up: bool = True,
+) -> Dict[str, int]:
+    """Fight waves of 2-4 enemies from ``pool`` for ``total_ticks`` ticks.
+
+    Wave sizes and drop rolls come off ``wave_rng`` in ``BattleScene``'s
+    order. With ``level_up`` false the party keeps its levels. Returns the
+    raw counters, plus the ``ticks`` that ran.
+    """
+
+    def spawn_wave():
+        return [pool.next_enemy() for _ in range(wave_rng.randint(MIN_WAVE_SIZE, MAX_WAVE_SIZE))]
+
+    enemies = spawn_wave()
+    combat = HeadlessCombat(party, enemies=enemies)
+    driver = AttackScheduler(combat, tick_length_s)
+
+    kills = deaths = wipes = xp = munny = 0
+    wiped = False
+    while driver.ticks_processed < total_ticks:
+        remaining = total_ticks - driver.ticks_processed
+        if driver.backlog_s < tick_length_s:
+            driver.feed(min(SETTLE_TICKS, remaining) * tick_length_s)
+        batch = min(SETTLE_TICKS, remaining, combat.ticks_until_revive(tick_length_s) or SETTLE_TICKS)
+        # Rates follow the ticks that actually ran, not the time handed in.
+        ran = driver.drain(
+            combat.on_tick,
+            max_ticks=batch,
+            batch_ticks=batch,
+            stop=combat.settle_requested,
+        )
+
+        deaths += combat.settle(ran * tick_length_s)
+        if combat.party_down and not wiped:
+            wipes += 1
+        wiped = combat.party_down
+
+        # Same order as ``BattleScene``: XP, drop rolls, munny, then the next
+        # wave, so the wave sizes come off the same RNG stream.
+        for enemy in [enemy for enemy in enemies if enemy.health.is_dead()]:
+            kills += 1
+            reward = int(getattr(enemy, "xp_reward", 0) or 0)
+            xp += reward
+            if level_up:
+                for actor in party:
+                    actor.gain_xp(reward)
+            roll_drops(getattr(enemy, "drops", []), wave_rng)
+            munny += max(0, int(getattr(enemy, "munny_reward", 0) or 0))
+            enemies.remove(enemy)
+        if not enemies:
+            enemies = spawn_wave()
+            combat.set_enemies(enemies)
+
+    return {
+        "ticks": driver.ticks_processed,
+        "kills": kills,
+        "deaths": deaths,
+        "wipes": wipes,
+        "xp": xp,
+        "munny": munny,
+    }
+
+
+def simulate_cell(
+    templates: Sequence[Mapping],
+    location_id: str,
+    *,
+    hours: float = 1.0,
+    stream: str = "0",
+    tick_length_s: float = DEFAULT_TICK_LENGTH_S,
+) -> Dict[str, object]:
+    """Farm ``location_id`` with a party built from ``templates``.
+
+    Returns the raw counters for ``hours`` of simulated time.
+    """
+
+    location = get_location(location_id)
+    inventory = Inventory(keyblade_slots=3, armor_slots=10, accessory_slots=10)
+    party = build_party(templates, inventory=inventory)
+    if not party:
+        raise ValueError("The party is empty")
+    pool = EncounterPool(
+        DEFAULT_ENCOUNTER_POOLS,
+        default_pool=location.encounter_pool,
+        rng=random.Random(f"{stream}/encounters"),
+    )
+    counters = farm_waves(
+        party,
+        pool,
+        random.Random(f"{stream}/battle"),
+        max(1, round(hours * 3600.0 / tick_length_s)),
+        tick_length_s=tick_length_s,
+    )
+    ticks = counters.pop("ticks")
+    return {
+        "sim_s": ticks * tick_length_s,
+        **counters,
+        "levels": {actor.name: actor.level for actor in party},
+    }
+
+
+def _run_cell(
+    cell: Cell,
+    templates: List[dict],
+    hours: float,
+    stream: str,
+    tick_length_s: float,
+) -> CellResult:
+    try:
+        raw = simulate_cell(
+            templates,
+            cell.location_id,
+            hours=hours,
+            stream=stream,
+            tick_length_s=tick_length_s,
+        )
+    except (KeyError, ValueError) as exc:
+        return CellResult(
+            cell.party, cell.loadout, cell.location_id,
+            0.0, 0, 0.0, 0, 0, 0.0, 0.0, error=str(exc),
+        )
+    sim_h = raw["sim_s"] / 3600.0
+    kills = raw["kills"]
+    return CellResult(
+        party=cell.party,
+        loadout=cell.loadout,
+        location_id=cell.location_id,
+        sim_hours=sim_h,
+        kills=kills,
+        seconds_per_kill=raw["sim_s"] / kills if kills else float("inf"),
+        deaths=raw["deaths"],
+        wipes=raw["wipes"],
+        xp_per_hour=raw["xp"] / sim_h,
+        munny_per_hour=raw["munny"] / sim_h,
+        final_levels=" ".join(f"{name}:{level}" for name, level in raw["levels"].items()),
+    )
+
+
+def run_sweep(
+    grid: Grid,
+    *,
+    hours: float = 1.0,
+    seed: int = 0,
+    workers: int | None = None,
+    tick_length_s: float = DEFAULT_TICK_LENGTH_S,
+    executor: ProcessPoolExecutor | None = None,
+) -> List[CellResult]:
+    """Simulate every cell of ``grid``; results keep ``grid.cells()`` order."""
+
+    jobs = []
+    for cell in grid.cells():
+        templates = apply_loadout(grid.parties[cell.party], grid.loadouts[cell.loadout])
+        jobs.append((cell, templates, hours, f"{seed}/{cell.stream}", tick_length_s))
+
+    if workers == 1 and executor is None:
+        return [_run_cell(*job) for job in jobs]
+    own = executor is None
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    try:
+        return list(pool.map(_run_cell, *zip(*jobs)))
+    finally:
+        if own:
+            pool.shutdown()
+
+
+def write_csv(results: Iterable[CellResult], path: str | os.PathLike[str]) -> Path:
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with target.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=CellResult.columns())
+        writer.writeheader()
+        for result in results:
+            writer.writerow(asdict(result))
+    return target
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="main.py sweep",
+        description="Headless balance sweep across parties, loadouts and locations.",
+    )
+    parser.add_argument("--grid", type=Path, help="JSON grid file (see module docs)")
+    parser.add_argument(
+        "--location",
+        action="append",
+        help="location id (repeatable; overrides the grid's locations)",
+    )
+    parser.add_argument("--hours", type=float, default=1.0, help="simulated hours per cell")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--out", type=Path, default=Path("sweep.csv"), help="CSV to write")
+    args = parser.parse_args(argv)
+
+    grid = Grid.from_file(args.grid) if args.grid else Grid()
+    if args.location:
+        grid.locations = list(args.location)
+    results = run_sweep(grid, hours=args.hours, seed=args.seed, workers=args.workers)
+    write_csv(results, args.out)
+    for result in results:
+        if result.error:
+            print(f"{result.party}/{result.loadout}/{result.location_id}: {result.error}", file=sys.stderr)
+            continue
+        print(
+            f"{result.party:<12} {result.loadout:<10} {result.location_id:<32} "
+            f"{result.seconds_per_kill:6.2f}s/kill  {result.deaths:4d} KOs  "
+            f"{result.xp_per_hour:9.0f} xp/h  {result.munny_per_hour:8.0f} munny/h"
+        )
+    print(f"{len(results)} cells written to {args.out}")
+    return 0
+
+
+__all__ = [
+    "Cell",
+    "CellResult",
+    "DEFAULT_LOADOUTS",
+    "DEFAULT_PARTIES",
+    "Grid",
+    "HeadlessCombat",
+    "apply_loadout",
+    "farm_waves",
+    "main",
+    "run_sweep",
+    "simulate_cell",
+    "write_csv",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
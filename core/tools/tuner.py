@@ -0,0 +1,240 @@
+"""Tune encounter levels and rewards towards target pacing curves.
+
+Locations are taken in ``iter_locations()`` order; location ``i`` is tuned
+for a reference party (``DEFAULT_PARTY_TEMPLATES`` levelled to
+``party_level + i * level_step``) and aims for
+
+    seconds per kill = spk * spk_growth ** i
+    XP per hour      = xph * xph_growth ** i
+
+For every pool entry the enemy level is bisected: the highest level at
+which the reference party, farming waves of that entry, still averages a
+kill within the target time is chosen. A measurement is ``FARM_S`` of
+``farm_waves``, the sweep's ``BattleScene``-faithful loop: waves of 2-4
+copies of the entry attack together, the party's HP carries over between
+waves, knockouts revive on their own tick and the next wave spawns on the
+tick the last enemy falls. The party keeps its level while it farms. Enemy
+stats scale monotonically with level, so the search needs ~7 measurements
+per entry. Rewards then follow in closed form: ``xp_reward`` is the target
+XP rate times the entry's measured seconds per kill, and ``munny_reward``
+keeps the entry's current munny-to-XP ratio. Measurements are
+deterministic and cached in memory by (enemy stats, level, party level), so
+within one process repeated ``tune`` calls and shared enemy templates reuse
+earlier runs; each ``main.py tune`` invocation starts with an empty cache.
+
+Pools that mix enemies are tuned entry by entry, while the game mixes them
+within a wave; check the tuned table with ``main.py sweep`` before
+adopting it.
+
+    python main.py tune --spk 2.5 --xph-growth 1.5 --out pools.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import pprint
+import random
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+from core.data.encounters import DEFAULT_ENCOUNTER_POOLS, ENEMY_DEFINITIONS, EncounterPool
+from core.data.locations import iter_locations
+from core.gameplay.offline import DEFAULT_TICK_LENGTH_S
+from core.gameplay.party import DEFAULT_PARTY_TEMPLATES, build_party
+from core.tools.sweep import farm_waves
+
+
+MAX_ENEMY_LEVEL = 99
+# Simulated farming per measurement; entries that die slower than this
+# count as unwinnable.
+FARM_S = 300.0
+# Template keys that affect a fight; rewards and drops do not.
+_COMBAT_KEYS = ("name", "hp", "atk", "defense", "speed", "mp_max", "cd", "mp_gain")
+
+
+@dataclass(frozen=True)
+class Target:
+    location_id: str
+    pool: str
+    party_level: int
+    seconds_per_kill: float
+    xp_per_hour: float
+
+
+@dataclass
+class TunedEntry:
+    pool: str
+    index: int
+    enemy: str
+    level: int
+    kill_s: float
+    xp_reward: int
+    munny_reward: int
+
+
+def target_curve(
+    *,
+    spk: float = 2.0,
+    spk_growth: float = 1.15,
+    xph: float = 30000.0,
+    xph_growth: float = 1.3,
+    party_level: int = 1,
+    level_step: int = 3,
+) -> List[Target]:
+    """One ``Target`` per location, in ``iter_locations()`` order."""
+    return [
+        Target(
+            location.location_id,
+            location.encounter_pool,
+            party_level + index * level_step,
+            spk * spk_growth ** index,
+            xph * xph_growth ** index,
+        )
+        for index, location in enumerate(iter_locations())
+    ]
+
+
+def _combat_stats(entry: Mapping) -> Tuple[Tuple[str, object], ...]:
+    merged = dict(ENEMY_DEFINITIONS.get(entry.get("enemy_id"), {}))
+    merged.update(entry)
+    return tuple((key, merged[key]) for key in _COMBAT_KEYS if key in merged)
+
+
+def _party_at_level(level: int):
+    party = build_party(DEFAULT_PARTY_TEMPLATES)
+    for actor in party:
+        while actor.level < level:
+            actor.gain_xp(actor.xp_to_level - actor.xp)
+    return party
+
+
+@lru_cache(maxsize=None)
+def seconds_per_kill(
+    stats: Tuple[Tuple[str, object], ...],
+    level: int,
+    party_level: int,
+    tick_length_s: float = DEFAULT_TICK_LENGTH_S,
+) -> float:
+    """Average seconds per kill farming waves of one enemy (``inf`` if none die)."""
+
+    pool = EncounterPool(
+        {"tune": [{**dict(stats), "level": level}]},
+        default_pool="tune",
+        rng=random.Random("tune/encounters"),
+    )
+    ticks = max(1, round(FARM_S / tick_length_s))
+    counters = farm_waves(
+        _party_at_level(party_level),
+        pool,
+        random.Random("tune/battle"),
+        ticks,
+        tick_length_s=tick_length_s,
+        level_up=False,
+    )
+    if not counters["kills"]:
+        return math.inf
+    return counters["ticks"] * tick_length_s / counters["kills"]
+
+
+def fit_level(stats, party_level: int, target_s: float, tick_length_s: float = DEFAULT_TICK_LENGTH_S) -> int:
+    """Highest enemy level the party kills every ``target_s`` (at least 1)."""
+    low, high = 1, MAX_ENEMY_LEVEL
+    if seconds_per_kill(stats, low, party_level, tick_length_s) > target_s:
+        return low
+    while low < high:
+        mid = (low + high + 1) // 2
+        if seconds_per_kill(stats, mid, party_level, tick_length_s) <= target_s:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def tune_pools(
+    targets: Sequence[Target],
+    pools: Mapping[str, Sequence[dict]] = DEFAULT_ENCOUNTER_POOLS,
+    *,
+    tick_length_s: float = DEFAULT_TICK_LENGTH_S,
+) -> Tuple[Dict[str, List[dict]], List[TunedEntry]]:
+    """Return tuned copies of ``pools`` and a per-entry report."""
+
+    tuned = {name: [dict(entry) for entry in entries] for name, entries in pools.items()}
+    report: List[TunedEntry] = []
+    for target in targets:
+        if target.pool not in tuned:
+            raise KeyError(f"Unknown enemy pool '{target.pool}'")
+        for index, entry in enumerate(tuned[target.pool]):
+            stats = _combat_stats(entry)
+            level = fit_level(stats, target.party_level, target.seconds_per_kill, tick_length_s)
+            kill_s = seconds_per_kill(stats, level, target.party_level, tick_length_s)
+            base = {**ENEMY_DEFINITIONS.get(entry.get("enemy_id"), {}), **entry}
+            old_xp = int(base.get("xp_reward", 0) or 0)
+            old_munny = int(base.get("munny_reward", 0) or 0)
+            xp = max(1, round(target.xp_per_hour * min(kill_s, FARM_S) / 3600.0))
+            munny = round(xp * old_munny / old_xp) if old_xp else old_munny
+            entry.update(level=level, xp_reward=xp, munny_reward=munny)
+            report.append(
+                TunedEntry(target.pool, index, dict(stats).get("name", "?"), level, kill_s, xp, munny)
+            )
+    return tuned, report
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="main.py tune",
+        description="Fit encounter levels and rewards to pacing targets.",
+    )
+    parser.add_argument("--spk", type=float, default=2.0, help="seconds per kill at the first location")
+    parser.add_argument("--spk-growth", type=float, default=1.15)
+    parser.add_argument("--xph", type=float, default=30000.0, help="XP per hour at the first location")
+    parser.add_argument("--xph-growth", type=float, default=1.3)
+    parser.add_argument("--party-level", type=int, default=1, help="party level at the first location")
+    parser.add_argument("--level-step", type=int, default=3, help="party levels gained per location")
+    parser.add_argument("--out", type=Path, help="write the tuned pools as JSON")
+    args = parser.parse_args(argv)
+
+    targets = target_curve(
+        spk=args.spk,
+        spk_growth=args.spk_growth,
+        xph=args.xph,
+        xph_growth=args.xph_growth,
+        party_level=args.party_level,
+        level_step=args.level_step,
+    )
+    tuned, report = tune_pools(targets)
+    by_pool = {target.pool: target for target in targets}
+    for row in report:
+        target = by_pool[row.pool]
+        print(
+            f"{row.pool:<32} #{row.index} {row.enemy:<8} party Lv{target.party_level:<3} "
+            f"-> Lv{row.level:<3} {row.kill_s:6.1f}s/kill (target {target.seconds_per_kill:.1f})  "
+            f"xp {row.xp_reward:<5} munny {row.munny_reward}"
+        )
+    info = seconds_per_kill.cache_info()
+    print(f"{info.misses} farming runs simulated, {info.hits} cache hits")
+    if args.out:
+        args.out.write_text(json.dumps(tuned, indent=2) + "\n", encoding="utf-8")
+        print(f"Tuned pools written to {args.out}")
+    else:
+        print("DEFAULT_ENCOUNTER_POOLS = " + pprint.pformat(tuned, sort_dicts=False))
+    return 0
+
+
+__all__ = [
+    "Target",
+    "TunedEntry",
+    "fit_level",
+    "main",
+    "seconds_per_kill",
+    "target_curve",
+    "tune_pools",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
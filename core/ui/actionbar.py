@@ -1,5 +1,7 @@
 import pygame
 
+from core.ui.text_cache import render_text
+
 BAR_WIDTH = 260
 BUTTON_HEIGHT = 44
 PADDING = 12
@@ -41,7 +43,7 @@ class ActionBar:
         surface.fill(bg_color, bar_rect)
         pygame.draw.rect(surface, border_color, bar_rect, width=2)
 
-        title_surf = self._font.render("Action Bar", True, text_color)
+        title_surf = render_text(self._font, "Action Bar", True, text_color)
         title_rect = title_surf.get_rect()
         title_rect.topleft = (bar_rect.left + PADDING, bar_rect.top + PADDING)
         surface.blit(title_surf, title_rect)
@@ -60,13 +62,17 @@ class ActionBar:
             pygame.draw.rect(surface, (55, 55, 85), btn_rect)
             pygame.draw.rect(surface, border_color, btn_rect, width=2)
 
-            label_surf = self._font.render(label, True, text_color)
+            label_surf = render_text(self._font, label, True, text_color)
             label_rect = label_surf.get_rect(center=btn_rect.center)
             surface.blit(label_surf, label_rect)
 
             self._buttons.append({"rect": btn_rect, "payload": payload})
             y += BUTTON_HEIGHT + PADDING
 
+    def state_key(self) -> tuple:
+        """Changes whenever the drawn buttons would."""
+        return (self._mode, self._selected_actor)
+
     def estimate_height(self, button_count: int) -> int:
         button_count = max(0, int(button_count))
         title_height = self._font.get_height()
@@ -1,11 +1,22 @@
 from __future__ import annotations
 
-from typing import Sequence
+from typing import Callable, Sequence
 
 import pygame
 
 from core.entities import Actor
 from core.ui.actionbar import ActionBar
+from core.ui.text_cache import render_text
+
+
+def draw_hp_bar(surface: pygame.Surface, rect: pygame.Rect, hp: float, max_hp: int) -> None:
+    fraction = max(0.0, min(1.0, hp / max_hp)) if max_hp > 0 else 0.0
+    pygame.draw.rect(surface, (40, 20, 20), rect)
+    if fraction > 0.0:
+        fill = rect.copy()
+        fill.width = max(1, round(rect.width * fraction))
+        pygame.draw.rect(surface, (90, 200, 90) if fraction > 0.3 else (220, 80, 60), fill)
+    pygame.draw.rect(surface, (10, 10, 10), rect, 1)
 
 
 class BattleHUD:
@@ -18,12 +29,16 @@ class BattleHUD:
         self.synthesis_button_rect = pygame.Rect(0, 0, 0, 0)
         self.leveling_button_rect = pygame.Rect(0, 0, 0, 0)
         self.map_button_rect = pygame.Rect(0, 0, 0, 0)
-        self._inventory_button_label = self.font.render("Inventory", True, (0, 0, 0))
-        self._synthesis_button_label = self.font.render("Synthesis", True, (0, 0, 0))
-        self._leveling_button_label = self.font.render("Item Leveling", True, (0, 0, 0))
-        self._map_button_label = self.font.render("Map", True, (0, 0, 0))
-        self._dead_portraits: dict[Actor, pygame.Surface] = {}
-        self._hint_text = "ESC: Quit | 1-3: Cycle Spells"
+        self._inventory_button_label = render_text(self.font, "Inventory", True, (0, 0, 0))
+        self._synthesis_button_label = render_text(self.font, "Synthesis", True, (0, 0, 0))
+        self._leveling_button_label = render_text(self.font, "Item Leveling", True, (0, 0, 0))
+        self._map_button_label = render_text(self.font, "Map", True, (0, 0, 0))
+        # Keyed by portrait size: the greyed-out panel is the same for everyone.
+        self._dead_portraits: dict[tuple[int, int], pygame.Surface] = {}
+        self._hint_text = "ESC: Quit | 1-3: Cycle Spells | [ ]: Speed"
+        # Screen areas of the changing parts, as of the last draw; sized for
+        # the longest expected text so they stay put while values change.
+        self.regions: dict[object, pygame.Rect] = {}
         subtitle_size = max(12, self.font.get_height() - 6)
         try:
             family = self.font.get_name()
@@ -44,18 +59,22 @@ class BattleHUD:
         available_spells: int,
         location_name: str | None = None,
         location_subtitle: str | None = None,
+        time_scale: float = 1.0,
+        sim_backlog_s: float = 0.0,
+        display_hp: Callable[[Actor], float] | None = None,
     ) -> None:
         screen_rect = surface.get_rect()
         title_baseline = 20
         if location_name:
-            title_surf = self.font.render(location_name, True, (245, 245, 255))
+            title_surf = render_text(self.font, location_name, True, (245, 245, 255))
             title_rect = title_surf.get_rect()
             title_rect.midtop = (screen_rect.centerx, title_baseline)
             surface.blit(title_surf, title_rect)
             title_baseline = title_rect.bottom + 4
         if location_subtitle:
             subtitle_font = self._subtitle_font or self.font
-            subtitle_surf = subtitle_font.render(
+            subtitle_surf = render_text(
+                subtitle_font,
                 location_subtitle,
                 True,
                 (210, 210, 230),
@@ -64,12 +83,22 @@ class BattleHUD:
             subtitle_rect.midtop = (screen_rect.centerx, title_baseline)
             surface.blit(subtitle_surf, subtitle_rect)
 
-        munny_text = self.font.render(
+        munny_text = render_text(
+            self.font,
             f"Munny: {munny}",
             True,
             (250, 220, 120),
         )
         surface.blit(munny_text, (40, 40))
+        line_height = munny_text.get_height()
+        self.regions["munny"] = pygame.Rect(40, 40, 360, line_height)
+        self.regions["speed"] = pygame.Rect(40, 40 + line_height + 6, 480, line_height)
+        if time_scale != 1.0:
+            speed_label = f"Speed x{time_scale:g}"
+            if sim_backlog_s >= 1.0:
+                speed_label += f" | backlog {sim_backlog_s:.0f}s"
+            speed_text = render_text(self.font, speed_label, True, (150, 210, 255))
+            surface.blit(speed_text, (40, 40 + munny_text.get_height() + 6))
 
         button_padding = 16
         label_width = max(
@@ -138,6 +167,12 @@ class BattleHUD:
 
             for index, (actor, portrait) in enumerate(zip(actors, portraits)):
                 top = start_y + index * (portrait_height + spacing)
+                self.regions[("actor", index)] = pygame.Rect(
+                    screen_rect.left + 60,
+                    top,
+                    portrait.get_width() + 28 + 360,
+                    max(portrait_height + 16, 6 * 28),
+                )
                 self._draw_actor_panel(
                     surface,
                     actor,
@@ -145,6 +180,7 @@ class BattleHUD:
                     left=screen_rect.left + 60,
                     top=top,
                     ko_remaining=ko_timers.get(actor),
+                    hp=display_hp(actor) if display_hp else actor.health.current,
                 )
 
         max_button_count = max(2, len(actors), max(0, available_spells))
@@ -157,8 +193,10 @@ class BattleHUD:
             bar_height,
         )
         self.action_bar.draw(surface, bar_rect)
+        self.regions["action_bar"] = bar_rect.copy()
 
-        hint = self.font.render(
+        hint = render_text(
+            self.font,
             self._hint_text,
             True,
             (180, 180, 180),
@@ -179,6 +217,7 @@ class BattleHUD:
         left: int,
         top: int,
         ko_remaining: float | None,
+        hp: float,
     ) -> None:
         portrait_rect = portrait.get_rect()
         portrait_rect.topleft = (left, top)
@@ -188,7 +227,8 @@ class BattleHUD:
         surface.blit(portrait_surface, portrait_rect)
         if ko_remaining is not None:
             countdown = max(0.0, ko_remaining)
-            timer_label = self.font.render(
+            timer_label = render_text(
+                self.font,
                 f"{countdown:.1f}s",
                 True,
                 (255, 255, 255),
@@ -212,19 +252,25 @@ class BattleHUD:
             f"XP: {getattr(actor, 'xp', 0)}/{xp_to_level}",
         ]
         for line in stats:
-            surf = self.font.render(line, True, (255, 255, 255))
+            surf = render_text(self.font, line, True, (255, 255, 255))
             surface.blit(surf, (info_x, y))
             y += 28
+        draw_hp_bar(
+            surface,
+            pygame.Rect(portrait_rect.left, portrait_rect.bottom + 6, portrait_rect.width, 8),
+            hp,
+            actor.health.max,
+        )
 
     def _dead_portrait_for(
         self,
         actor: Actor,
         base_surface: pygame.Surface,
     ) -> pygame.Surface:
-        dead_surface = self._dead_portraits.get(actor)
+        dead_surface = self._dead_portraits.get(base_surface.get_size())
         if dead_surface is None:
             dead_surface = pygame.Surface(base_surface.get_size(), pygame.SRCALPHA)
             dead_surface.fill((100, 100, 100))
             pygame.draw.rect(dead_surface, (40, 40, 40), dead_surface.get_rect(), 2)
-            self._dead_portraits[actor] = dead_surface
+            self._dead_portraits[base_surface.get_size()] = dead_surface
         return dead_surface
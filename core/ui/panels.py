@@ -0,0 +1,113 @@
+"""Cached backdrops for modal scenes.
+
+Overlay scenes draw a translucent full-screen wash and several bordered
+panels every frame. Allocating the wash each frame costs a screen-sized
+surface (about 33MB at 4K), so both are built once per size and colour and
+blitted afterwards; a resize simply builds new ones and the old sizes age
+out of the small LRU.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Tuple
+
+import pygame
+
+
+Color = Tuple[int, ...]
+
+OVERLAY_COLOR = (15, 15, 35, 235)
+PANEL_FILL = (35, 35, 60)
+PANEL_BORDER = (90, 90, 140)
+
+
+class PanelCache:
+    """Built overlay and panel surfaces keyed by size and colours."""
+
+    def __init__(self, max_entries: int = 64) -> None:
+        self.max_entries = int(max_entries)
+        self._surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.builds = 0
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def overlay(self, size: Tuple[int, int], color: Color = OVERLAY_COLOR) -> pygame.Surface:
+        key = ("overlay", tuple(size), tuple(color))
+        surface = self._lookup(key)
+        if surface is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            surface.fill(color)
+            self._store(key, surface)
+        return surface
+
+    def panel(
+        self,
+        size: Tuple[int, int],
+        fill: Color = PANEL_FILL,
+        border: Color = PANEL_BORDER,
+        border_width: int = 2,
+    ) -> pygame.Surface:
+        key = ("panel", tuple(size), tuple(fill), tuple(border), border_width)
+        surface = self._lookup(key)
+        if surface is None:
+            surface = pygame.Surface(size)
+            surface.fill(fill)
+            pygame.draw.rect(surface, border, surface.get_rect(), width=border_width)
+            self._store(key, surface)
+        return surface
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+
+    def _lookup(self, key) -> pygame.Surface | None:
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+        return surface
+
+    def _store(self, key, surface: pygame.Surface) -> None:
+        self.builds += 1
+        self._surfaces[key] = surface
+        while len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+
+
+_default_panels: PanelCache | None = None
+
+
+def default_panels() -> PanelCache:
+    global _default_panels
+    if _default_panels is None:
+        _default_panels = PanelCache()
+    return _default_panels
+
+
+def draw_overlay(surface: pygame.Surface, color: Color = OVERLAY_COLOR) -> None:
+    """Wash the whole of ``surface`` with a translucent ``color``."""
+    surface.blit(default_panels().overlay(surface.get_size(), color), (0, 0))
+
+
+def draw_panel(
+    surface: pygame.Surface,
+    rect: pygame.Rect,
+    fill: Color = PANEL_FILL,
+    border: Color = PANEL_BORDER,
+    border_width: int = 2,
+) -> None:
+    """Filled, bordered box covering ``rect``."""
+    if rect.width <= 0 or rect.height <= 0:
+        return
+    surface.blit(default_panels().panel(rect.size, fill, border, border_width), rect.topleft)
+
+
+__all__ = [
+    "OVERLAY_COLOR",
+    "PANEL_BORDER",
+    "PANEL_FILL",
+    "PanelCache",
+    "default_panels",
+    "draw_overlay",
+    "draw_panel",
+]
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pygame
+
+from core.systems.profiling import Profiler
+from core.ui.text_cache import TextCache
+
+
+GRAPH_HEIGHT = 60
+# Frame-time graph scale: the top of the graph is two 60fps frames.
+GRAPH_MAX_S = 2 / 60
+BUDGET_S = 1 / 60
+# The timing lines change constantly; they get their own small cache so
+# they never push the game's labels out of the shared one.
+TEXT_CACHE_BYTES = 1024 * 1024
+
+
+class ProfilerOverlay:
+    """Opaque panel of frame and span timings, drawn over the scene."""
+
+    def __init__(self, font, profiler: Profiler, *, width: int = 460) -> None:
+        self.font = font
+        self.profiler = profiler
+        self.width = width
+        self.text_cache = TextCache(TEXT_CACHE_BYTES)
+
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        """Draw the panel in the top-left corner; return the area it covers."""
+        profiler = self.profiler
+        line_height = self.font.get_height() + 2
+        frames = profiler.frames
+        mean = sum(frames) / len(frames) if frames else 0.0
+        lines = [
+            (
+                f"frame p50 {profiler.frame_p50 * 1000:5.1f}ms  p99 {profiler.frame_p99 * 1000:5.1f}ms"
+                f"  {1 / mean if mean else 0:4.0f}fps",
+                (250, 220, 120),
+            )
+        ]
+        for name in sorted(profiler.spans):
+            stats = profiler.spans[name]
+            lines.append(
+                (
+                    f"{name:<24} {stats.p50 * 1000:5.2f} / {stats.p99 * 1000:5.2f}ms",
+                    (220, 220, 230),
+                )
+            )
+
+        rect = pygame.Rect(8, 8, self.width, 12 + line_height * len(lines) + GRAPH_HEIGHT + 8)
+        surface.fill((10, 10, 20), rect)
+        pygame.draw.rect(surface, (90, 90, 140), rect, 1)
+        y = rect.top + 6
+        for text, color in lines:
+            surface.blit(self.text_cache.render(self.font, text, True, color), (rect.left + 8, y))
+            y += line_height
+
+        graph = pygame.Rect(rect.left + 8, y + 4, rect.width - 16, GRAPH_HEIGHT)
+        budget_y = graph.bottom - round(GRAPH_HEIGHT * BUDGET_S / GRAPH_MAX_S)
+        pygame.draw.line(surface, (70, 70, 110), (graph.left, budget_y), (graph.right - 1, budget_y))
+        samples = list(frames)[-graph.width // 2:]
+        for index, seconds in enumerate(samples):
+            height = max(1, min(GRAPH_HEIGHT, round(GRAPH_HEIGHT * seconds / GRAPH_MAX_S)))
+            color = (90, 200, 90) if seconds <= BUDGET_S * 1.05 else (220, 80, 60)
+            x = graph.left + index * 2
+            pygame.draw.line(surface, color, (x, graph.bottom - height), (x, graph.bottom - 1))
+        return rect
+
+
+__all__ = ["ProfilerOverlay"]
@@ -0,0 +1,106 @@
+"""Shared cache of rendered text surfaces.
+
+Scenes redraw the same labels every frame; ``render_text`` returns the
+surface ``font.render`` produced the first time for the same font, string,
+antialias flag, colour and background, so steady frames render no text.
+Entries are evicted least-recently-used once their pixel memory exceeds
+``max_bytes``. Returned surfaces are shared: blit them, never draw on them.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+import pygame
+
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+def _color_key(color) -> Hashable:
+    if color is None:
+        return None
+    if isinstance(color, str):
+        return color
+    return tuple(color)
+
+
+class TextCache:
+    """LRU cache of ``font.render`` results with a memory cap."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = int(max_bytes)
+        self._entries: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def render(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        antialias: bool,
+        color,
+        background=None,
+    ) -> pygame.Surface:
+        key = (font, text, bool(antialias), _color_key(color), _color_key(background))
+        entries = self._entries
+        surface = entries.get(key)
+        if surface is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        size = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        entries[key] = surface
+        self.bytes += size
+        while self.bytes > self.max_bytes and len(entries) > 1:
+            _, evicted = entries.popitem(last=False)
+            self.bytes -= evicted.get_width() * evicted.get_height() * evicted.get_bytesize()
+            self.evictions += 1
+        return surface
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+_default_cache: Optional[TextCache] = None
+
+
+def default_text_cache() -> TextCache:
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = TextCache()
+    return _default_cache
+
+
+def render_text(font, text: str, antialias: bool, color, background=None) -> pygame.Surface:
+    """``font.render`` through the shared ``TextCache``."""
+    return default_text_cache().render(font, text, antialias, color, background)
+
+
+__all__ = [
+    "DEFAULT_MAX_BYTES",
+    "TextCache",
+    "default_text_cache",
+    "render_text",
+]
@@ -1,32 +1,148 @@
+import argparse
 import sys
+import time
 
 import pygame
 
 from core.entities import Actor, Enemy
 from core.scenes import Manager, MainMenu
 
-def run_game():
+def _build_recorded_battle(font, manager, screen, *, seed, record_path, slot):
+    """Start straight into a seeded battle, optionally recording it."""
+    from core.data.savegame import create_default_state, load_state, serialize_state
+    from core.scenes.battle_scene import BattleScene
+    from core.systems.recording import CombatRecorder, LogHeader
+
+    state = load_state(slot) if slot else create_default_state("recording")
+    if state is None:
+        pygame.quit()
+        sys.exit(f"no such save slot: {slot}")
+    recorder = None
+    if record_path:
+        header = LogHeader(
+            seed=seed,
+            location_id=state.location_id,
+            tick_length_s=0.2,
+            screen_size=screen.get_size(),
+            initial_state=serialize_state(state),
+        )
+        recorder = CombatRecorder(record_path, header)
+        print(f"Recording seed {seed} to {record_path}")
+    return BattleScene(
+        font,
+        controller=manager.controller,
+        location_id=state.location_id,
+        inventory=state.inventory,
+        actors=state.actors,
+        save_slot=slot,
+        save_created_at=state.created_at,
+        save_updated_at=state.updated_at,
+        seed=seed,
+        recorder=recorder,
+    )
+
+
+def run_game(
+    *,
+    seed=None,
+    record_path=None,
+    slot=None,
+    max_fps=60,
+    threaded=False,
+    render_size=None,
+    low_power=True,
+    idle_after_s=None,
+):
+    """Run the game window.
+
+    Scenes advance in fixed ``Manager.SIM_STEP_S`` steps however fast frames
+    are drawn; ``max_fps`` only caps rendering (0 = uncapped). ``threaded``
+    moves battle simulation onto its own thread. ``render_size`` draws
+    scenes at that fixed resolution and scales each frame to the window.
+    ``low_power`` throttles drawing while the window is unfocused,
+    minimised or has had no input for ``idle_after_s`` seconds; the
+    simulation keeps its full rate. F3 toggles the frame profiler overlay.
+    """
+    from core.scenes.battle_scene import BattleScene
+    from core.systems.power import FramePacer
+    from core.systems.profiling import Profiler, install_default_spans
+    from core.systems.render.display import ScaledDisplay
+    from core.ui.profiler_overlay import ProfilerOverlay
+
+    BattleScene.THREADED_SIM = threaded
     pygame.init()
-    screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+    display = ScaledDisplay(
+        pygame.display.set_mode((0, 0), pygame.FULLSCREEN),
+        render_size,
+    )
+    screen = display.surface
+    BattleScene.DRAW_SIZE = screen.get_size()
     font = pygame.font.Font("assets/Orbitron-VariableFont_wght.ttf", 24)
     manager = Manager()
-    menu = MainMenu(font, controller=manager.controller)
-    manager.set_scene(menu)
+    battle = None
+    if seed is not None or record_path:
+        battle = _build_recorded_battle(
+            font,
+            manager,
+            screen,
+            seed=seed if seed is not None else 0,
+            record_path=record_path,
+            slot=slot,
+        )
+        manager.set_scene(battle)
+    else:
+        menu = MainMenu(font, controller=manager.controller)
+        manager.set_scene(menu)
+    pacer = FramePacer(max_fps, idle_after_s=idle_after_s, enabled=low_power)
+    profiler = install_default_spans(Profiler())
+    manager.profiler = profiler
+    overlay = ProfilerOverlay(font, profiler)
     clock = pygame.time.Clock()
     running = True
     while running:
-        dt = clock.tick(60) / 1000.0
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                running = False
-
-            manager.handle_event(event)
-
-        manager.update(dt)
-        manager.draw(screen)
-        pygame.display.flip()
+        if pacer.active:
+            dt = clock.tick(max_fps) / 1000.0
+            events = pygame.event.get()
+        else:
+            # Sleep until input or the next wake-up; input is handled at once.
+            first = pygame.event.wait(pacer.wait_ms())
+            events = pygame.event.get()
+            if first.type != pygame.NOEVENT:
+                events.insert(0, first)
+            dt = clock.tick() / 1000.0
+        now = time.perf_counter()
+        pacer.tick(now)
+        with profiler.span("events"):
+            for event in events:
+                if pacer.observe(event, now):
+                    manager.invalidate()
+                if event.type == pygame.QUIT:
+                    running = False
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    if not profiler.toggle():
+                        manager.invalidate()
+                    continue
+                elif event.type in (pygame.VIDEORESIZE, pygame.VIDEOEXPOSE, pygame.WINDOWFOCUSGAINED):
+                    display.resize(pygame.display.get_surface())
+                    screen = display.surface
+                    BattleScene.DRAW_SIZE = screen.get_size()
+                    manager.invalidate()
+
+                manager.handle_event(display.remap_event(event))
+
+        manager.advance(dt, catch_up=not pacer.active)
+        if pacer.should_draw(now):
+            dirty = manager.draw(screen)
+            if profiler.enabled:
+                panel = overlay.draw(screen)
+                if dirty is not None:
+                    dirty = [*dirty, panel]
+            display.present(dirty)
+        profiler.end_frame()
+    if battle is not None:
+        battle.finish_recording()
     pygame.quit()
 
 def run_combat_demo():
@@ -66,9 +182,98 @@ def run_combat_demo():
     print(enemy)
 
 
+def run_replay(path):
+    """Re-run a recorded combat log headless and report whether it matches."""
+    from core.systems.recording import replay_log
+
+    result = replay_log(path)
+    print(result)
+    return 0 if result.matched else 1
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Kingdom Hearts incremental")
+    parser.add_argument(
+        "mode",
+        nargs="?",
+        default="play",
+        type=str.lower,
+        choices=["play", "demo", "replay"],
+    )
+    parser.add_argument("log", nargs="?", help="combat log to replay")
+    parser.add_argument("--seed", type=int, help="start a seeded battle")
+    parser.add_argument("--record", metavar="PATH", help="record the battle to PATH")
+    parser.add_argument("--slot", help="save slot to start the seeded battle from")
+    parser.add_argument(
+        "--fps",
+        type=int,
+        default=60,
+        help="render frame cap (0 = uncapped); the simulation rate is fixed",
+    )
+    parser.add_argument(
+        "--threaded",
+        action="store_true",
+        help="simulate battles on a separate thread from rendering",
+    )
+    parser.add_argument(
+        "--render-size",
+        metavar="WxH",
+        type=_render_size,
+        help="draw at this fixed resolution (e.g. 1280x720) and scale to the screen",
+    )
+    parser.add_argument(
+        "--idle-after",
+        type=float,
+        metavar="SECONDS",
+        help="seconds without input before drawing is throttled (0 = never)",
+    )
+    parser.add_argument(
+        "--no-low-power",
+        dest="low_power",
+        action="store_false",
+        help="keep drawing at full rate when unfocused, minimised or idle",
+    )
+    return parser.parse_args(argv)
+
+
+def _render_size(text):
+    from core.systems.render.display import parse_size
+
+    try:
+        return parse_size(text)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+
+
+def run_tool(name, argv):
+    """Run one of the offline tools registered in ``core.tools.TOOLS``."""
+    import importlib
+
+    from core.tools import TOOLS
+
+    return importlib.import_module(TOOLS[name]).main(argv)
+
+
 if __name__ == "__main__":
-    args = [a.lower() for a in sys.argv[1:]]
-    if "demo" in args:
+    from core.tools import TOOLS
+
+    if len(sys.argv) > 1 and sys.argv[1].lower() in TOOLS:
+        sys.exit(run_tool(sys.argv[1].lower(), sys.argv[2:]))
+    args = parse_args()
+    if args.mode == "demo":
         run_combat_demo()
+    elif args.mode == "replay":
+        if not args.log:
+            sys.exit("replay needs the path of a combat log")
+        sys.exit(run_replay(args.log))
     else:
-        run_game()
+        run_game(
+            seed=args.seed,
+            record_path=args.record,
+            slot=args.slot,
+            max_fps=args.fps,
+            threaded=args.threaded,
+            render_size=args.render_size,
+            low_power=args.low_power,
+            idle_after_s=args.idle_after,
+        )
@@ -0,0 +1,137 @@
+import gc
+import os
+import threading
+import weakref
+import unittest
+from unittest import mock
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core.data.locations import adjacent_locations
+from core.data.savegame import create_default_state
+from core.scenes.battle_scene import BattleScene
+from core.scenes.scene import Manager
+from core.systems.assets import SPRITE_SIZE, AssetManager, default_assets
+from core.systems.render.display import ScaledDisplay
+
+
+SCREEN_SIZE = (1280, 720)
+PORTRAIT = "assets/portraits/sora.png"
+
+
+class AssetManagerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.font.init()
+        pygame.display.set_mode(SCREEN_SIZE)
+        cls.font = pygame.font.Font(None, 24)
+
+    def test_images_are_decoded_on_the_worker_and_shared(self):
+        assets = AssetManager()
+        self.assertIsNone(assets.get(PORTRAIT, (96, 96)))
+        self.assertTrue(assets.wait(5.0))
+
+        image = assets.get(PORTRAIT, (96, 96))
+        self.assertEqual(image.get_size(), (96, 96))
+        self.assertIs(assets.get(PORTRAIT, (96, 96)), image)
+        self.assertEqual(assets.generation, 1)
+
+    def test_missing_files_are_remembered(self):
+        assets = AssetManager()
+        assets.request("assets/nope.png")
+        assets.wait(5.0)
+
+        self.assertTrue(assets.ready("assets/nope.png"))
+        self.assertIsNone(assets.get("assets/nope.png"))
+        self.assertEqual(assets.stats()["missing"], 1)
+
+    def test_full_size_decodes_are_not_kept_after_scaling(self):
+        real_load = pygame.image.load
+        decoded = []
+
+        def load(*args, **kwargs):
+            image = real_load(*args, **kwargs)
+            decoded.append(weakref.ref(image))
+            return image
+
+        assets = AssetManager()
+        with mock.patch("pygame.image.load", load):
+            assets.request(PORTRAIT, (96, 96))
+            assets.request(PORTRAIT, (48, 48))
+            self.assertTrue(assets.wait(5.0))
+        gc.collect()
+
+        self.assertEqual(len(decoded), 2)
+        self.assertTrue(all(ref() is None for ref in decoded))
+        self.assertEqual(assets.get(PORTRAIT, (48, 48)).get_size(), (48, 48))
+
+    def test_prefetch_covers_neighbouring_locations(self):
+        assets = AssetManager()
+        assets.prefetch_location("destiny_islands_cove", SCREEN_SIZE)
+        assets.wait(5.0)
+
+        for location in adjacent_locations("destiny_islands_cove"):
+            self.assertIsNotNone(assets.get(location.background_image, SCREEN_SIZE, alpha=False))
+        self.assertIsNotNone(assets.get("assets/portraits/enemies/shadow.png", SPRITE_SIZE))
+
+    def test_scene_creation_does_no_disk_io_on_the_main_thread(self):
+        real_load = pygame.image.load
+        loads_on_main = []
+
+        def load(*args, **kwargs):
+            if threading.current_thread() is threading.main_thread():
+                loads_on_main.append(args[0])
+            return real_load(*args, **kwargs)
+
+        state = create_default_state("assets")
+        manager = Manager()
+        surface = pygame.Surface(SCREEN_SIZE)
+        with mock.patch("pygame.image.load", load):
+            scene = BattleScene(
+                self.font,
+                controller=manager.controller,
+                location_id="traverse_town_first_district",
+                inventory=state.inventory,
+                actors=state.actors,
+                seed=3,
+            )
+            manager.set_scene(scene)
+            scene.draw(surface)
+            default_assets().wait(5.0)
+            scene.draw(surface)
+
+        self.assertEqual(loads_on_main, [])
+        self.assertTrue(default_assets().ready("assets/backgrounds/traverse_town.png", SCREEN_SIZE, alpha=False))
+
+    def test_backgrounds_are_prefetched_at_the_scaled_draw_size(self):
+        display = ScaledDisplay(pygame.display.get_surface(), (640, 360))
+        location_id = "traverse_town_first_district"
+        state = create_default_state("assets")
+        manager = Manager()
+        with mock.patch("core.systems.assets._default_assets", AssetManager()):
+            assets = default_assets()
+            scene = BattleScene(
+                self.font,
+                controller=manager.controller,
+                location_id=location_id,
+                inventory=state.inventory,
+                actors=state.actors,
+                seed=3,
+            )
+            manager.set_scene(scene)
+            manager.draw(display.surface)
+            assets.wait(5.0)
+            requested = set(assets._requested)
+
+        backgrounds = {location.background_image for location in adjacent_locations(location_id)}
+        sizes = {size for path, size, _ in requested if path.startswith("assets/backgrounds/")}
+        self.assertEqual(sizes, {(640, 360)})
+        for path in backgrounds:
+            self.assertTrue(assets.ready(path, (640, 360), alpha=False), path)
+
+
+if __name__ == "__main__":
+    unittest.main()
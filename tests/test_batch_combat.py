@@ -0,0 +1,86 @@
+import random
+import unittest
+
+try:
+    import numpy  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+from core.entities import Actor, Enemy
+from core.gameplay.combat import CombatSystem
+
+
+def _seeded_battle(rng: random.Random):
+    actors = []
+    for index in range(rng.randint(1, 3)):
+        actor = Actor(
+            f"A{index}",
+            hp=rng.randint(5, 30),
+            atk=rng.randint(1, 9),
+            defense=rng.randint(0, 3),
+            mp_max=rng.randint(1, 6),
+            cd=rng.choice([0.2, 0.3, 0.4, 0.6, 1.0]),
+            mp_gain=rng.randint(0, 2),
+            spell_id=rng.choice([None, "fire", "blizzard", "thunder"]),
+        )
+        actor.mana.max = rng.randint(1, 6)
+        actor.mana.clamp()
+        actors.append(actor)
+    enemy = Enemy(
+        hp=rng.randint(15, 60),
+        atk=rng.randint(1, 6),
+        defense=rng.randint(0, 4),
+        cd=rng.choice([0.8, 1.0, 2.0, 2.5]),
+        level=rng.randint(1, 3),
+    )
+    return actors, enemy
+
+
+@unittest.skipIf(numpy is None, "numpy is required for the batch simulator")
+class BatchCombatSimulatorTests(unittest.TestCase):
+    def test_matches_scalar_engine_tick_for_tick(self):
+        from core.gameplay.combat.batch import BatchCombatSimulator
+
+        rng = random.Random(1234)
+        battles = [_seeded_battle(rng) for _ in range(40)]
+        # The simulator snapshots the battles, so the scalar engine can
+        # mutate the same objects afterwards.
+        sim = BatchCombatSimulator(battles, tick_length_s=0.2)
+        systems = [CombatSystem(actors, enemy) for actors, enemy in battles]
+
+        for _ in range(150):
+            for cs in systems:
+                cs.on_tick(0.2)
+            sim.step()
+            for row, cs in enumerate(systems):
+                self.assertEqual(sim.enemy_hp[row], cs.enemy.health.current)
+                self.assertEqual(
+                    sim.enemy_timer[row],
+                    cs.enemy.attack_state.time_since_attack_s,
+                )
+                for col, actor in enumerate(cs.actors):
+                    self.assertEqual(sim.actor_hp[row, col], actor.health.current)
+                    self.assertEqual(sim.actor_mp[row, col], actor.mana.current)
+                    self.assertEqual(
+                        sim.actor_timer[row, col],
+                        actor.attack_state.time_since_attack_s,
+                    )
+
+    def test_run_reports_outcomes(self):
+        from core.gameplay.combat.batch import BatchCombatSimulator
+
+        battles = [
+            ([Actor("A", atk=5, cd=0.2)], Enemy(hp=18, defense=2)),
+            ([Actor("B", hp=1, atk=1, cd=1.0)], Enemy(hp=50, atk=9, cd=0.2)),
+        ]
+        result = BatchCombatSimulator(battles).run(500)
+        self.assertTrue(result.enemy_defeated[0])
+        self.assertFalse(result.party_defeated[0])
+        self.assertEqual(result.damage_dealt[0, 0], 18)
+        self.assertTrue(result.party_defeated[1])
+        self.assertEqual(result.ticks[1], 1)
+        self.assertEqual(result.enemy_attacks[1], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
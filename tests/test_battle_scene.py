@@ -0,0 +1,314 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core.data.savegame import create_default_state
+from core.gameplay.combat import KO_REVIVE_S
+from core.scenes.battle_scene import BattleScene
+from core.scenes.scene import Manager, Scene
+
+
+SCREEN_SIZE = (1280, 720)
+
+
+class _BattleSceneCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.font.init()
+        pygame.display.set_mode(SCREEN_SIZE)
+        cls.font = pygame.font.Font(None, 24)
+
+    def _scene(self, **kwargs):
+        state = create_default_state("speed")
+        manager = Manager()
+        scene = BattleScene(
+            self.font,
+            controller=manager.controller,
+            location_id=state.location_id,
+            inventory=state.inventory,
+            actors=state.actors,
+            seed=3,
+            **kwargs,
+        )
+        manager.set_scene(scene)
+        scene.sync_board(pygame.Rect((0, 0), SCREEN_SIZE))
+        return scene
+
+
+class BattleSceneTimeScaleTests(_BattleSceneCase):
+    def test_accelerated_frames_run_many_ticks(self):
+        scene = self._scene()
+        scene.step_time_scale(1)
+        self.assertEqual(scene.time_scale, 2.0)
+        scene.set_time_scale(1000)
+
+        for _ in range(30):
+            scene.update(1 / 60)
+            scene.sync_board(pygame.Rect((0, 0), SCREEN_SIZE))
+
+        self.assertGreater(scene.inventory.munny, 0)
+        self.assertGreater(scene.actors[0].xp + scene.actors[0].level, 1)
+
+    def _farm(self, scale, *, ticks=None, seconds=0.0):
+        """Farm a hard location; return the outcome and each KO's downtime in ticks."""
+        state = create_default_state("speed")
+        manager = Manager()
+        scene = BattleScene(
+            self.font,
+            controller=manager.controller,
+            location_id="traverse_town_second_district",
+            inventory=state.inventory,
+            actors=state.actors,
+            seed=3,
+        )
+        manager.set_scene(scene)
+        scene.sync_board(pygame.Rect((0, 0), SCREEN_SIZE))
+        scene.SIM_BUDGET_S = 60.0
+        scene.set_time_scale(scale)
+        knocked_out = {}
+        downtimes = []
+        real_revive = scene._revive_actor
+
+        def revive(actor):
+            downtimes.append(scene.cs.tick_count - knocked_out.pop(actor))
+            real_revive(actor)
+
+        scene._revive_actor = revive
+        real_post_attack = scene._handle_post_attack
+
+        def post_attack(attacker, defender):
+            if defender in scene.actors and defender.health.is_dead():
+                knocked_out.setdefault(defender, scene.cs.tick_count)
+            real_post_attack(attacker, defender)
+
+        scene._handle_post_attack = post_attack
+        if ticks is None:
+            for _ in range(round(seconds * 60 / scale)):
+                scene.update(1 / 60)
+        else:
+            while scene.cs.tick_count < ticks:
+                scene.update(1 / 60)
+        outcome = (
+            scene.cs.tick_count,
+            scene.inventory.munny,
+            scene._next_enemy_serial,
+            [(actor.level, actor.xp) for actor in scene.actors],
+        )
+        return outcome, downtimes
+
+    def test_acceleration_does_not_change_the_outcome(self):
+        fast, fast_downtimes = self._farm(100.0, seconds=300.0)
+        # Real time runs the same number of ticks, however frames add up.
+        real, real_downtimes = self._farm(1.0, ticks=fast[0])
+
+        self.assertEqual(real, fast)
+        self.assertGreater(len(fast_downtimes), 5)
+        self.assertEqual(fast_downtimes, real_downtimes)
+        self.assertEqual(set(fast_downtimes), {round(KO_REVIVE_S / 0.2)})
+
+    def test_queued_time_is_worked_off_within_budget(self):
+        scene = self._scene(event_driven=True)
+        scene.SIM_BUDGET_S = 0.0
+        scene.queue_sim_time(3600)
+        scene.update(1 / 60)
+
+        # A zero budget still runs one batch per frame and reports the rest.
+        self.assertGreater(scene.sim_backlog_s, 3000)
+        before = scene.sim_backlog_s
+        scene.update(1 / 60)
+        self.assertLess(scene.sim_backlog_s, before)
+
+        scene.set_time_scale(1.0)
+        self.assertEqual(scene.time_scale, 1.0)
+
+
+class FixedStepTests(_BattleSceneCase):
+    def _snapshot(self, scene):
+        return (
+            scene.inventory.munny,
+            [(a.health.current, a.xp, a.level) for a in scene.actors],
+            [e.health.current for e in scene.enemies],
+        )
+
+    def _run(self, frames):
+        scene = self._scene()
+        manager = Manager(scene)
+        steps = 0
+        for dt in frames:
+            steps += manager.advance(dt)
+            manager.draw(pygame.Surface(SCREEN_SIZE))
+        return steps, self._snapshot(scene)
+
+    def test_frame_hitches_do_not_change_the_simulation(self):
+        # Slow frames (0.15s, then 30fps) against a steady 60fps run of the
+        # same number of sim steps.
+        hitchy = ([1 / 60] * 20 + [0.15] + [1 / 30] * 20) * 4
+        steps, hitchy_state = self._run(hitchy)
+        smooth_steps, smooth_state = self._run([1 / 60] * steps)
+
+        self.assertEqual(smooth_steps, steps)
+        self.assertEqual(hitchy_state, smooth_state)
+
+    def test_hp_bars_blend_between_steps(self):
+        scene = self._scene()
+        actor = scene.actors[0]
+        scene.update(1 / 60)
+        scene._hp_previous[actor] = actor.health.current + 10
+
+        scene.interpolate(0.0)
+        self.assertEqual(scene.display_hp(actor), actor.health.current + 10)
+        scene.interpolate(0.5)
+        self.assertEqual(scene.display_hp(actor), actor.health.current + 5)
+        scene.interpolate(1.0)
+        self.assertEqual(scene.display_hp(actor), actor.health.current)
+
+
+class ThreadedSimTests(_BattleSceneCase):
+    def test_threaded_battle_matches_main_thread_battle(self):
+        plain = self._scene()
+        threaded = self._scene(threaded=True)
+        self.addCleanup(threaded.close)
+        cycle = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_2, mod=0, unicode="2")
+        surface = pygame.Surface(SCREEN_SIZE)
+
+        for frame in range(240):
+            if frame == 30:
+                plain.handle_event(cycle)
+                threaded.handle_event(cycle)
+            plain.update(1 / 60)
+            threaded.update(1 / 60)
+            self.assertTrue(threaded.sim_thread.wait_idle(5.0))
+            threaded.draw(surface)
+
+        snap = threaded.sim_thread.latest
+        self.assertEqual(snap.step, 240)
+        self.assertEqual(snap.munny, plain.inventory.munny)
+        self.assertEqual(
+            [(view.health.current, view.xp, view.spell_id) for view in snap.actors],
+            [(actor.health.current, actor.xp, actor.spell_id) for actor in plain.actors],
+        )
+        self.assertNotEqual(snap.actors[1].spell_id, create_default_state("x").actors[1].spell_id)
+        self.assertEqual(len(snap.board), len(plain.enemies))
+        with self.assertRaises(TypeError):
+            snap.board[(0, 0)] = None
+
+    def test_errors_on_the_sim_thread_surface_on_the_main_thread(self):
+        scene = self._scene(threaded=True)
+        self.addCleanup(scene.close)
+
+        def boom():
+            raise ValueError("bad command")
+
+        scene._command(boom)
+        with self.assertRaises(RuntimeError):
+            for _ in range(10):
+                scene.update(1 / 60)
+                scene.sim_thread.wait_idle(5.0)
+
+
+    def test_overlays_keep_the_simulation_paused_until_they_close(self):
+        state = create_default_state("overlay")
+        manager = Manager()
+        scene = BattleScene(
+            self.font,
+            controller=manager.controller,
+            location_id=state.location_id,
+            inventory=state.inventory,
+            actors=state.actors,
+            seed=3,
+            threaded=True,
+        )
+        self.addCleanup(scene.close)
+        manager.set_scene(scene)
+        surface = pygame.Surface(SCREEN_SIZE)
+        manager.draw(surface)
+        for _ in range(30):
+            manager.advance(1 / 60)
+        self.assertTrue(scene.sim_thread.wait_idle(5.0))
+
+        click = pygame.event.Event(
+            pygame.MOUSEBUTTONDOWN, pos=scene.hud.inventory_button_rect.center, button=1
+        )
+        manager.handle_event(click)
+        self.assertEqual(type(manager.scenes[-1]).__name__, "InventoryScene")
+        steps = scene.sim_thread.steps
+        for _ in range(30):
+            manager.advance(1 / 60)
+        self.assertTrue(scene.sim_thread.paused)
+        self.assertEqual(scene.sim_thread.steps, steps)
+
+        manager.pop_scene()
+        manager.advance(1 / 60)
+        self.assertFalse(scene.sim_thread.paused)
+        self.assertTrue(scene.sim_thread.wait_idle(5.0))
+        self.assertEqual(scene.sim_thread.steps, steps + 31)
+
+    def test_threaded_hp_bars_blend_between_steps(self):
+        scene = self._scene(threaded=True)
+        self.addCleanup(scene.close)
+        blended = None
+        for _ in range(600):
+            scene.update(1 / 60)
+            self.assertTrue(scene.sim_thread.wait_idle(5.0))
+            snap = scene.sim_thread.latest
+            hit = [
+                view for view in snap.actors + snap.enemies
+                if view.previous_hp is not None and view.previous_hp != view.health.current
+            ]
+            if hit:
+                blended = hit[0]
+                break
+        self.assertIsNotNone(blended)
+        scene.interpolate(0.5)
+        self.assertEqual(
+            scene.display_hp(blended),
+            (blended.previous_hp + blended.health.current) / 2,
+        )
+
+
+class DirtyRectTests(_BattleSceneCase):
+    def test_partial_repaints_match_full_redraws(self):
+        scene = self._scene()
+        manager = Manager(scene)
+        partial = pygame.Surface(SCREEN_SIZE)
+        full = pygame.Surface(SCREEN_SIZE)
+
+        self.assertIsNone(manager.draw(partial))
+        self.assertEqual(manager.draw(partial), [])
+        repainted = 0
+        for frame in range(600):
+            manager.advance(1 / 60)
+            rects = manager.draw(partial)
+            self.assertIsNotNone(rects, f"frame {frame}")
+            repainted += len(rects)
+            if frame % 60 == 59:
+                scene.draw(full)
+                self.assertEqual(
+                    pygame.image.tobytes(partial, "RGB"),
+                    pygame.image.tobytes(full, "RGB"),
+                    f"frame {frame}",
+                )
+        self.assertGreater(repainted, 0)
+        self.assertGreater(scene.inventory.munny, 0)
+
+    def test_scene_changes_and_resizes_redraw_everything(self):
+        scene = self._scene()
+        manager = Manager(scene)
+        surface = pygame.Surface(SCREEN_SIZE)
+        manager.draw(surface)
+        self.assertIsNotNone(manager.draw(surface))
+
+        manager.push_scene(Scene())
+        self.assertIsNone(manager.draw(surface))
+        manager.pop_scene()
+        self.assertIsNone(manager.draw(surface))
+        self.assertEqual(manager.draw(surface), [])
+        self.assertIsNone(manager.draw(pygame.Surface((1024, 600))))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+import pygame
+
+from benchmarks import frames
+from benchmarks.__main__ import compare, measure
+from benchmarks.combat import CASES
+
+
+class BenchmarkSuiteTests(unittest.TestCase):
+    def test_every_case_sets_up_and_runs(self):
+        for case in CASES:
+            op, ops = case.setup(**case.params)
+            self.assertGreater(ops, 0, case.case_id)
+            op()
+
+    def test_measure_reports_throughput_and_memory(self):
+        result = measure(CASES[0], min_time_s=0.01, repeat=1)
+        self.assertGreater(result["ops_per_s"], 0)
+        self.assertGreater(result["relative"], 0)
+        self.assertGreaterEqual(result["peak_bytes_per_op"], 0)
+
+    def test_compare_flags_slowdowns_beyond_threshold(self):
+        base = {"ops_per_s": 1000.0, "peak_bytes_per_op": 10.0}
+        self.assertEqual(compare({"ops_per_s": 850.0, "peak_bytes_per_op": 10.0}, base, 0.2), [])
+        self.assertEqual(
+            compare({"ops_per_s": 700.0, "peak_bytes_per_op": 10.0}, base, 0.2),
+            ["throughput -30%"],
+        )
+        self.assertEqual(len(compare({"ops_per_s": 1000.0, "peak_bytes_per_op": 500.0}, base, 0.2)), 1)
+        self.assertEqual(compare({"ops_per_s": 1.0, "peak_bytes_per_op": 0.0}, None, 0.2), [])
+
+    def test_compare_uses_machine_relative_throughput_when_recorded(self):
+        base = {"ops_per_s": 1000.0, "relative": 0.1, "peak_bytes_per_op": 10.0}
+        # Half the raw speed on a machine half as fast is no regression.
+        slower_machine = {"ops_per_s": 500.0, "relative": 0.1, "peak_bytes_per_op": 10.0}
+        self.assertEqual(compare(slower_machine, base, 0.2), [])
+        self.assertEqual(
+            compare({"ops_per_s": 1500.0, "relative": 0.07, "peak_bytes_per_op": 10.0}, base, 0.2),
+            ["throughput -30%"],
+        )
+
+
+class FrameBenchmarkTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.font.init()
+        pygame.display.set_mode((1, 1))
+        cls.font = pygame.font.Font(None, 24)
+
+    def test_every_scene_opens_and_reports_distributions(self):
+        for scene_name in frames.SCENES:
+            result = frames.measure(scene_name, (640, 360), self.font, frames=3)
+            self.assertEqual(result["size"], "640x360")
+            for phase in ("update", "draw"):
+                summary = result[phase]
+                self.assertLessEqual(summary["p50_ms"], summary["max_ms"], scene_name)
+            self.assertGreater(result["draw"]["max_ms"], 0, scene_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
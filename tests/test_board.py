@@ -0,0 +1,142 @@
+import os
+import random
+import unittest
+from unittest import mock
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core.entities import Enemy
+from core.scenes.board import HexBoard, hex_distance
+
+
+def _brute_nearest(board, source):
+    best = None
+    best_key = None
+    for order, tile in enumerate(board.tiles()):
+        token = board.occupant_at(*tile)
+        if token is None or token.health.is_dead():
+            continue
+        key = (hex_distance(source, tile), order)
+        if best_key is None or key < best_key:
+            best, best_key = token, key
+    return best
+
+
+class TargetingIndexTests(unittest.TestCase):
+    def test_nearest_occupant_tracks_placement_and_deaths(self):
+        board = HexBoard(pygame.Rect(0, 0, 1280, 720), cols=12, rows=12)
+        rng = random.Random(5)
+        sources = [(-1, 1), (-1, 3), (-1, 5), (4, 4), (11, 0)]
+        tiles = list(board.tiles())
+        rng.shuffle(tiles)
+        enemies = []
+        for tile in tiles[:40]:
+            enemy = Enemy(hp=5)
+            board.place(enemy, *tile)
+            enemies.append(enemy)
+
+        for step in range(120):
+            action = rng.random()
+            if action < 0.5:
+                victim = rng.choice(enemies)
+                victim.health.current = 0
+            elif action < 0.75:
+                occupied = [t for t in board.tiles() if board.occupant_at(*t)]
+                free = [t for t in board.tiles() if not board.occupant_at(*t)]
+                if occupied and free:
+                    board.move(rng.choice(occupied), rng.choice(free))
+            else:
+                free = [t for t in board.tiles() if not board.occupant_at(*t)]
+                if free:
+                    enemy = Enemy(hp=5)
+                    enemies.append(enemy)
+                    board.place(enemy, *rng.choice(free))
+            for source in sources:
+                self.assertIs(
+                    board.targeting.nearest_occupant(source),
+                    _brute_nearest(board, source),
+                    f"step {step} from {source}",
+                )
+
+    def test_nearest_unit_skips_knocked_out_units(self):
+        board = HexBoard(pygame.Rect(0, 0, 1280, 720))
+        near, far = Enemy(hp=5), Enemy(hp=5)
+        board.targeting.set_units({far: (-1, 5), near: (-1, 1)})
+
+        self.assertIs(board.targeting.nearest_unit((0, 0)), near)
+        near.health.current = 0
+        self.assertIs(board.targeting.nearest_unit((0, 0)), far)
+        near.health.current = 5
+        self.assertIs(board.targeting.nearest_unit((0, 0)), near)
+
+
+class BoardOccupancyTests(unittest.TestCase):
+    def test_free_tiles_and_positions_follow_occupancy(self):
+        board = HexBoard(pygame.Rect(0, 0, 1280, 720))
+        a, b = Enemy(hp=5), Enemy(hp=5)
+        board.place(a, 0, 0)
+        board.place(b, 2, 3)
+        board.move((2, 3), (4, 4))
+
+        self.assertEqual(board.position_of(b), (4, 4))
+        self.assertEqual(dict(board.occupied), {(0, 0): a, (4, 4): b})
+        self.assertNotIn((4, 4), board.free_tiles)
+        self.assertIn((2, 3), board.free_tiles)
+        self.assertEqual(len(board.free_tiles), 36 - 2)
+        with self.assertRaises(ValueError):
+            board.place(a, 1, 1)
+
+        self.assertEqual(board.remove_token(a), (0, 0))
+        self.assertIsNone(board.position_of(a))
+        self.assertEqual(dict(board.occupied), {(4, 4): b})
+        board.clear()
+        self.assertEqual(board.occupant_count, 0)
+        self.assertEqual(dict(board.occupied), {})
+        self.assertEqual(len(board.free_tiles), 36)
+
+
+class StaticBoardTests(unittest.TestCase):
+    def test_prerendered_tiles_match_per_tile_drawing(self):
+        rect = pygame.Rect(0, 0, 1280, 720)
+        board = HexBoard(rect)
+        drawn = pygame.Surface(rect.size)
+        board.draw(drawn)
+
+        expected = pygame.Surface(rect.size)
+        for q, r in board.tiles():
+            corners = board._hex_corners(*board.axial_to_pixel(q, r))
+            pygame.draw.polygon(expected, board.FILL_COLOR, corners)
+            pygame.draw.polygon(expected, board.BORDER_COLOR, corners, width=2)
+        for x in range(0, rect.width, 7):
+            for y in range(0, rect.height, 7):
+                self.assertEqual(drawn.get_at((x, y)), expected.get_at((x, y)), (x, y))
+
+    def test_frames_only_draw_tokens(self):
+        board = HexBoard(pygame.Rect(0, 0, 1920, 1080), cols=40, rows=30, size=12)
+        board.render_static()
+        board.place(Enemy(hp=5), 3, 4)
+        surface = pygame.Surface((1920, 1080))
+        with mock.patch("pygame.draw.polygon") as polygon, mock.patch("pygame.draw.circle") as circle:
+            board.draw(surface)
+        polygon.assert_not_called()
+        self.assertEqual(circle.call_count, 1)
+
+    def test_tokens_are_sorted_only_when_occupancy_changes(self):
+        board = HexBoard(pygame.Rect(0, 0, 1280, 720))
+        board.render_static()
+        board.place(Enemy(hp=5), 3, 4)
+        board.place(Enemy(hp=5), 1, 2)
+        surface = pygame.Surface((1280, 720))
+        with mock.patch("core.scenes.board.sorted", side_effect=sorted, create=True) as sort:
+            board.draw(surface)
+            board.draw(surface, board.occupied)
+            self.assertEqual(sort.call_count, 1)
+            board.remove(1, 2)
+            board.draw(surface)
+            self.assertEqual(sort.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
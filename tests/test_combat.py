@@ -1,10 +1,14 @@
+import json
+import random
 import unittest
 
 
 # Test doubles and imports kept minimal to focus on CombatSystem behavior.
-from core.gameplay.combat import TickController, CombatSystem
+from core.gameplay.combat import TickController, CombatSystem, elapsed_after_ticks, ticks_until_ready
 from core.gameplay.stats import Stats, Health, Mana
 from core.gameplay.attack import AttackProfile, AttackState
+from core.gameplay.combat.scheduler import AttackScheduler
+from core import entities
 
 
 class TestAttackState(AttackState):
@@ -86,6 +90,54 @@ class TickControllerTests(unittest.TestCase):
         # 0.40 accumulates into two more ticks of 0.2
         self.assertEqual(calls, [0.2, 0.2, 0.2])
 
+    def test_drain_runs_banked_ticks_in_bounded_batches(self):
+        tc = TickController(0.2)
+        calls = []
+        batches = []
+        tc.feed(10.05)
+        self.assertEqual(tc.pending_ticks, 50)
+
+        ran = tc.drain(calls.append, max_ticks=12, batch_ticks=5, on_batch=batches.append)
+        self.assertEqual(ran, 12)
+        self.assertEqual(batches, [5, 5, 2])
+        self.assertEqual(tc.pending_ticks, 38)
+
+        # An expired deadline still runs one batch so progress is guaranteed.
+        self.assertEqual(tc.drain(calls.append, batch_ticks=4, deadline=0.0), 4)
+        self.assertEqual(tc.drain(calls.append), 34)
+        self.assertEqual(len(calls), 50)
+        self.assertLess(tc.backlog_s, 0.2)
+
+    def test_drain_stops_on_the_tick_stop_asks_for(self):
+        tc = TickController(0.2)
+        calls = []
+        tc.feed(4.05)
+        self.assertEqual(tc.drain(calls.append, batch_ticks=10, stop=lambda: len(calls) >= 6), 6)
+        self.assertEqual(tc.pending_ticks, 14)
+
+        # The scheduler only asks on ticks it runs, here the actor's attacks.
+        cs = CombatSystem([Actor(cd=0.6)], Enemy(hp=500))
+        scheduler = AttackScheduler(cs, 0.2)
+        scheduler.feed(4.05)
+        self.assertEqual(scheduler.drain(cs.on_tick, batch_ticks=10, stop=lambda: cs.tick_count >= 5), 6)
+        self.assertEqual(cs.tick_count, 6)
+        self.assertEqual(scheduler.ticks_processed, 6)
+        self.assertEqual(scheduler.pending_ticks, 14)
+
+    def test_scheduler_drain_matches_polling(self):
+        polled = CombatSystem([Actor(cd=0.2), Actor(cd=0.6)], Enemy(hp=500, cd=1.0))
+        evented = CombatSystem([Actor(cd=0.2), Actor(cd=0.6)], Enemy(hp=500, cd=1.0))
+        tc = TickController(0.2)
+        scheduler = AttackScheduler(evented, 0.2)
+
+        tc.update(37.3, polled.on_tick)
+        scheduler.feed(37.3)
+        while scheduler.drain(evented.on_tick, batch_ticks=7):
+            pass
+
+        self.assertEqual(polled.enemy.health.current, evented.enemy.health.current)
+        self.assertEqual(scheduler.ticks_processed, 186)
+
 
 class CombatOnTickTests(unittest.TestCase):
     def test_actor_attacks_once_when_cooldown_reached(self):
@@ -158,5 +210,279 @@ class CombatBasicAttackTests(unittest.TestCase):
         self.assertEqual(a.attack_state.time_since_attack_s, 0.0)
 
 
+class RecordingCombat(CombatSystem):
+    def __init__(self, actors, enemy):
+        super().__init__(actors, enemy)
+        self.log = []
+
+    def basic_attack(self, attacker, defender) -> int:
+        damage = super().basic_attack(attacker, defender)
+        self.log.append((attacker.name, defender.name, damage, defender.health.current))
+        return damage
+
+
+def _farming_party():
+    return [
+        entities.Actor("Sora", hp=40, atk=6, cd=0.2, spell_id="fire"),
+        entities.Actor("Donald", hp=30, atk=5, cd=0.3, spell_id="blizzard"),
+        entities.Actor("Goofy", hp=50, atk=4, cd=0.4, spell_id="thunder"),
+    ]
+
+
+def _polled_ticks(frames):
+    ticks = []
+    tc = TickController(0.2)
+    for dt in frames:
+        tc.update(dt, ticks.append)
+    return len(ticks)
+
+
+def _farm(driver_factory, frames, party=_farming_party):
+    """Drive a respawning fight frame by frame, like BattleScene.update."""
+    actors = party()
+    spawned = [0]
+
+    def spawn():
+        spawned[0] += 1
+        return entities.Enemy(name=f"Shadow{spawned[0]}", hp=60, atk=6, cd=1.0, level=2)
+
+    cs = RecordingCombat(actors, spawn())
+    driver = driver_factory(cs)
+    for dt in frames:
+        driver.update(dt, cs.on_tick)
+        if cs.enemy.health.is_dead():
+            cs.enemy = spawn()
+        for actor in actors:
+            if actor.health.is_dead():
+                actor.health.current = actor.health.max
+                actor.attack_state.reset()
+    return cs, driver
+
+
+class AttackSchedulerTests(unittest.TestCase):
+    def test_matches_polling_for_variable_frames(self):
+        rng = random.Random(7)
+        frames = [rng.choice([1 / 60, 1 / 30, 0.05, 0.25, 0.7]) for _ in range(3000)]
+
+        polled, _ = _farm(lambda cs: TickController(0.2), frames)
+        evented, _ = _farm(lambda cs: AttackScheduler(cs, 0.2), frames)
+
+        self.assertGreater(len(polled.log), 100)
+        self.assertEqual(polled.log, evented.log)
+        for a, b in zip(polled.actors, evented.actors):
+            self.assertEqual(a.health.current, b.health.current)
+            self.assertEqual(a.mana.current, b.mana.current)
+            self.assertEqual(
+                a.attack_state.time_since_attack_s,
+                b.attack_state.time_since_attack_s,
+            )
+
+    def test_hour_of_farming_runs_one_step_per_attack_tick(self):
+        def slow_party():
+            party = _farming_party()
+            party[0].attack_profile.cooldown_s = 0.6
+            return party
+
+        frames = [60.0] * 60
+        polled, _ = _farm(lambda cs: TickController(0.2), frames, slow_party)
+        evented, scheduler = _farm(lambda cs: AttackScheduler(cs, 0.2), frames, slow_party)
+
+        self.assertEqual(polled.log, evented.log)
+        self.assertEqual(scheduler.ticks_processed, _polled_ticks(frames))
+        self.assertLess(scheduler.events_processed, 18000 // 2)
+
+    def test_polls_while_an_actor_attacks_every_tick(self):
+        frames = [60.0] * 60
+        polled, _ = _farm(lambda cs: TickController(0.2), frames)
+        evented, scheduler = _farm(lambda cs: AttackScheduler(cs, 0.2), frames)
+
+        self.assertEqual(polled.log, evented.log)
+        self.assertEqual(scheduler.ticks_processed, _polled_ticks(frames))
+        self.assertEqual(scheduler.events_processed, scheduler.ticks_processed)
+
+    def test_large_updates_run_as_many_ticks_as_polling(self):
+        for frames in ([10.0], [3600.0], [1.0] * 30, [0.7, 10.0, 1.3] * 5):
+            polled_ticks = []
+            tc = TickController(0.2)
+            for dt in frames:
+                tc.update(dt, polled_ticks.append)
+            polled, _ = _farm(lambda cs: TickController(0.2), frames)
+            evented, scheduler = _farm(lambda cs: AttackScheduler(cs, 0.2), frames)
+
+            self.assertEqual(scheduler.ticks_processed, len(polled_ticks), frames[:3])
+            self.assertEqual(polled.log, evented.log)
+
+    def test_accumulates_partial_ticks(self):
+        cs = CombatSystem([Actor(cd=0.2)], Enemy(hp=100))
+        scheduler = AttackScheduler(cs, 0.2)
+        scheduler.update(0.1, cs.on_tick)
+        self.assertEqual(scheduler.ticks_processed, 0)
+        scheduler.update(0.1, cs.on_tick)
+        self.assertEqual(scheduler.ticks_processed, 1)
+        self.assertEqual(cs.enemy.health.current, 97)
+
+
+class TimerArithmeticTests(unittest.TestCase):
+    def test_elapsed_after_ticks_matches_repeated_ticks_until_ready(self):
+        for dt in (0.2, 1 / 60, 0.05):
+            for cooldown in (0.2, 0.3, 0.7, 1.0, 2.5):
+                for start in (0.0, 0.1, 0.35):
+                    state = AttackState()
+                    state.time_since_attack_s = start
+                    ready_at = ticks_until_ready(start, cooldown, dt)
+                    for ticks in range(1, ready_at + 1):
+                        state.tick(dt)
+                        self.assertEqual(
+                            elapsed_after_ticks(start, ticks, cooldown, dt),
+                            state.time_since_attack_s,
+                            (dt, cooldown, start, ticks),
+                        )
+                    self.assertTrue(state.ready(cooldown))
+
+    def test_elapsed_past_readiness_stays_ready(self):
+        self.assertEqual(elapsed_after_ticks(0.4, 0, 1.0, 0.2), 0.4)
+        late = elapsed_after_ticks(0.0, 10_000, 1.0, 0.2)
+        self.assertGreaterEqual(late, 1.0)
+        self.assertAlmostEqual(late, 2000.0, places=6)
+
+    def test_idle_hour_is_skipped_in_a_few_events(self):
+        actors = [entities.Actor("Sora", hp=400, atk=1, cd=60.0, spell_id="fire")]
+        enemy = entities.Enemy(name="Shadow", hp=10**6, atk=1, cd=90.0, level=1)
+        polled_actors = [entities.Actor("Sora", hp=400, atk=1, cd=60.0, spell_id="fire")]
+        polled_enemy = entities.Enemy(name="Shadow", hp=10**6, atk=1, cd=90.0, level=1)
+        polled = RecordingCombat(polled_actors, polled_enemy)
+        evented = RecordingCombat(actors, enemy)
+        scheduler = AttackScheduler(evented, 0.2)
+        TickController(0.2).update(3600.0, polled.on_tick)
+        scheduler.update(3600.0, evented.on_tick)
+
+        self.assertEqual(polled.log, evented.log)
+        self.assertEqual(scheduler.ticks_processed, 18000)
+        self.assertLessEqual(scheduler.events_processed, 60 + 40)
+        evented.sync_timers()
+        polled.sync_timers()
+        self.assertEqual(
+            polled_actors[0].attack_state.time_since_attack_s,
+            actors[0].attack_state.time_since_attack_s,
+        )
+        self.assertEqual(
+            polled_enemy.attack_state.time_since_attack_s,
+            enemy.attack_state.time_since_attack_s,
+        )
+
+
+def _horde(count, seed=3):
+    rng = random.Random(seed)
+    actors = [
+        entities.Actor("Sora", hp=400, atk=9, defense=2, cd=0.2),
+        entities.Actor("Donald", hp=300, atk=7, defense=1, cd=0.3),
+    ]
+    enemies = [
+        entities.Enemy(
+            name=f"Shadow{index}",
+            hp=rng.randint(5, 30),
+            atk=rng.randint(1, 3),
+            cd=rng.choice([0.8, 1.0, 1.4, 2.5]),
+        )
+        for index in range(count)
+    ]
+    return actors, enemies
+
+
+def _eager_tick(actors, enemies, dt, log):
+    """Reference multi-enemy tick: every enemy timer advances every tick."""
+    damage = CombatSystem([]).basic_attack
+    for actor in actors:
+        if actor.health.is_dead():
+            continue
+        actor.attack_state.tick(dt)
+        if not actor.attack_state.ready(actor.attack_profile.cooldown_s):
+            continue
+        target = next((e for e in enemies if not e.health.is_dead()), None)
+        if target is not None:
+            log.append((actor.name, target.name, damage(actor, target)))
+    for enemy in enemies:
+        if enemy.health.is_dead():
+            continue
+        enemy.attack_state.tick(dt)
+        if not enemy.attack_state.ready(enemy.attack_profile.cooldown_s):
+            continue
+        target = next((a for a in actors if not a.health.is_dead()), None)
+        if target is not None:
+            log.append((enemy.name, target.name, damage(enemy, target)))
+
+
+class MultiEnemyCombatTests(unittest.TestCase):
+    def test_every_enemy_attacks_on_its_own_cooldown(self):
+        ref_actors, ref_enemies = _horde(300)
+        actors, enemies = _horde(300)
+        cs = RecordingCombat(actors, None)
+        cs.set_enemies(enemies)
+        ref_log = []
+
+        for _ in range(400):
+            _eager_tick(ref_actors, ref_enemies, 0.2, ref_log)
+            cs.on_tick(0.2)
+
+        self.assertEqual([entry[:3] for entry in cs.log], ref_log)
+        self.assertGreater(sum(1 for e in enemies if e.health.is_dead()), 0)
+        cs.sync_timers()
+        for ref, enemy in zip(ref_enemies, enemies):
+            self.assertEqual(ref.health.current, enemy.health.current)
+            self.assertEqual(
+                ref.attack_state.time_since_attack_s,
+                enemy.attack_state.time_since_attack_s,
+            )
+
+    def test_scheduler_matches_polling_with_a_roster(self):
+        polled_actors, polled_enemies = _horde(40)
+        evented_actors, evented_enemies = _horde(40)
+        # Slower than a tick, so the queue is used rather than polling.
+        for actor in (polled_actors[0], evented_actors[0]):
+            actor.attack_profile.cooldown_s = 0.4
+        polled = RecordingCombat(polled_actors, None)
+        polled.set_enemies(polled_enemies)
+        evented = RecordingCombat(evented_actors, None)
+        evented.set_enemies(evented_enemies)
+        tc = TickController(0.2)
+        scheduler = AttackScheduler(evented, 0.2)
+
+        rng = random.Random(11)
+        for _ in range(600):
+            dt = rng.choice([1 / 60, 0.05, 0.25, 1.3])
+            tc.update(dt, polled.on_tick)
+            scheduler.update(dt, evented.on_tick)
+
+        self.assertEqual(polled.log, evented.log)
+        self.assertLess(scheduler.events_processed, scheduler.ticks_processed)
+
+
+class InstrumentationTests(unittest.TestCase):
+    def test_stats_follow_ticks_attacks_and_frames(self):
+        actors, enemies = _horde(5)
+        cs = CombatSystem(actors, enemies=enemies)
+        tc = TickController(0.2)
+        stats = cs.enable_instrumentation()
+        tc.instrumentation = stats
+
+        tc.update(1.0, cs.on_tick)
+        tc.update(0.1, cs.on_tick)
+
+        self.assertEqual(stats.ticks, 5)
+        self.assertEqual(stats.frames, 2)
+        self.assertEqual(stats.ticks_per_frame[5], 1)
+        self.assertEqual(stats.ticks_per_frame[0], 1)
+        self.assertEqual(stats.attacks_by_attacker["Sora"], 5)
+        self.assertEqual(stats.damage_by_attacker["Sora"], 5 * (9 - enemies[0].stats.defense))
+        self.assertGreaterEqual(stats.target_selections, stats.attacks)
+        self.assertEqual(json.loads(json.dumps(stats.to_dict()))["ticks"], 5)
+
+        selector = cs._select_actor_target
+        self.assertIs(cs.disable_instrumentation(), stats)
+        self.assertIsNot(cs._select_actor_target, selector)
+        cs.on_tick(0.2)
+        self.assertEqual(stats.ticks, 5)
+
+
 if __name__ == "__main__":
     unittest.main()
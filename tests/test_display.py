@@ -0,0 +1,60 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core.systems.render.display import ScaledDisplay, parse_size
+
+
+class ScaledDisplayTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+
+    def test_without_an_internal_size_scenes_draw_to_the_window(self):
+        window = pygame.display.set_mode((640, 360))
+        display = ScaledDisplay(window)
+        self.assertIs(display.surface, window)
+        self.assertFalse(display.scaled)
+
+        event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(10, 20), button=1)
+        self.assertIs(display.remap_event(event), event)
+
+    def test_frames_are_scaled_into_a_letterboxed_viewport(self):
+        window = pygame.display.set_mode((1920, 1200))
+        display = ScaledDisplay(window, parse_size("1280x720"), smooth=False)
+        self.assertEqual(display.surface.get_size(), (1280, 720))
+        self.assertEqual(display.viewport, pygame.Rect(0, 60, 1920, 1080))
+
+        display.surface.fill((0, 0, 255))
+        display.surface.fill((255, 0, 0), pygame.Rect(640, 360, 640, 360))
+        display.present(None)
+        self.assertEqual(window.get_at((10, 10))[:3], (0, 0, 0))
+        self.assertEqual(window.get_at((100, 100))[:3], (0, 0, 255))
+        self.assertEqual(window.get_at((1900, 1100))[:3], (255, 0, 0))
+
+    def test_mouse_events_are_mapped_to_internal_coordinates(self):
+        window = pygame.display.set_mode((1920, 1200))
+        display = ScaledDisplay(window, (1280, 720))
+
+        click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(960, 600), button=1)
+        motion = pygame.event.Event(pygame.MOUSEMOTION, pos=(0, 30), rel=(30, 15), buttons=(0, 0, 0))
+        key = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)
+
+        self.assertEqual(display.remap_event(click).pos, (640, 360))
+        self.assertEqual(display.remap_event(click).button, 1)
+        moved = display.remap_event(motion)
+        self.assertLess(moved.pos[1], 0)
+        self.assertEqual(moved.rel, (20, 10))
+        self.assertIs(display.remap_event(key), key)
+
+    def test_bad_sizes_are_rejected(self):
+        for text in ("1280", "0x720", "wide"):
+            with self.assertRaises(ValueError):
+                parse_size(text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import contextlib
+import io
+import os
+import random
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from core.data import savegame
+from core.data.encounters import roll_drops
+from core.data.savegame import create_default_state
+from core.gameplay.offline import estimate_rates, location_enemies
+from core.tools.drop_estimator import estimate_location, main, percentile
+
+
+class DropEstimatorTests(unittest.TestCase):
+    def test_roll_drops_consumes_one_roll_per_entry(self):
+        drops = [{"item_id": "a", "chance": 0.0}, {"material_id": "b", "chance": 1.0}]
+        rng = random.Random(4)
+        rolls = roll_drops(drops, rng)
+
+        expected = random.Random(4)
+        self.assertEqual([r[2] for r in rolls], [expected.random(), expected.random()])
+        self.assertEqual([r[3] for r in rolls], [False, True])
+
+    def test_results_do_not_depend_on_worker_count(self):
+        party = create_default_state("estimate").actors
+        serial = estimate_location(
+            "destiny_islands_cove",
+            party,
+            hours=70,
+            seed=9,
+            workers=1,
+            first_item="champion_belt",
+            first_trials=20,
+        )
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            pooled = estimate_location(
+                "destiny_islands_cove",
+                party,
+                hours=70,
+                seed=9,
+                first_item="champion_belt",
+                first_trials=20,
+                executor=executor,
+            )
+
+        self.assertEqual(serial.samples, pooled.samples)
+        self.assertEqual(serial.first_drop_h, pooled.first_drop_h)
+        self.assertEqual(len(serial.samples["kills"]), 70)
+        self.assertEqual(len(serial.first_drop_h), 20)
+        self.assertIn("item:champion_belt", serial.table())
+
+    def test_sampled_kills_follow_the_offline_rates(self):
+        party = create_default_state("estimate").actors
+        estimate = estimate_location("destiny_islands_cove", party, hours=50, workers=1)
+        rates = estimate_rates(party, location_enemies("destiny_islands_cove"))
+
+        kills = estimate.samples["kills"]
+        self.assertAlmostEqual(sum(kills) / len(kills) / (rates.kills_per_s * 3600), 1.0, delta=0.02)
+
+    def test_unknown_save_slot_is_a_usage_error(self):
+        with TemporaryDirectory() as tmp, mock.patch.dict(os.environ, {savegame.SAVE_DIR_ENV: tmp}):
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr), self.assertRaises(SystemExit) as caught:
+                main(["--slot", "nope", "--hours", "1", "--workers", "1"])
+
+        self.assertEqual(caught.exception.code, 2)
+        self.assertIn("no such save slot: nope", stderr.getvalue())
+
+    def test_percentile_uses_nearest_rank(self):
+        values = [5, 1, 4, 2, 3]
+        self.assertEqual(percentile(values, 50), 3)
+        self.assertEqual(percentile(values, 95), 5)
+        self.assertEqual(percentile(values, 5), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
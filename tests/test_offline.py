@@ -0,0 +1,128 @@
+import math
+import os
+import random
+import unittest
+from datetime import timedelta
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from core.data import savegame
+from core.data.encounters import DEFAULT_ENCOUNTER_POOLS, EncounterPool
+from core.data.locations import get_location
+from core.entities import Actor, Enemy
+from core.gameplay.combat import KO_REVIVE_S
+from core.gameplay.offline import estimate_rates, location_enemies, project_rewards
+from core.gameplay.party import DEFAULT_PARTY_TEMPLATES, build_party
+from core.tools.sweep import farm_waves
+
+
+class EstimateRatesTests(unittest.TestCase):
+    def test_single_matchup_rates(self):
+        # 3 damage per 0.2s plus a 12 damage burst every 10 attacks -> 21 dps.
+        actor = Actor("A", hp=100, atk=5, cd=0.2)
+        enemy = Enemy(hp=42, atk=1, defense=2, cd=1.0, xp_reward=10, munny_reward=4)
+
+        rates = estimate_rates([actor], [enemy])
+
+        # Waves average 3 enemies and each hits for 1 per second from spawn
+        # until its kill: (3 * 2 + 10/3 * 2) / (3 * 2) damage per second.
+        self.assertAlmostEqual(rates.damage_taken_per_s, 19 / 9)
+        # Each life starts with a volley from the idle wave, then KO_REVIVE_S down.
+        alive_s = (100 - 19 / 9) / (19 / 9)
+        self.assertAlmostEqual(rates.uptime, alive_s / (alive_s + KO_REVIVE_S))
+        self.assertAlmostEqual(rates.seconds_per_kill, 2.0 / rates.uptime)
+        self.assertAlmostEqual(rates.xp_per_s, 10 / rates.seconds_per_kill)
+        self.assertAlmostEqual(rates.munny_per_s, 4 / rates.seconds_per_kill)
+
+    def test_kills_cost_whole_hits(self):
+        actor = Actor("A", hp=10**6, atk=5, cd=0.2)
+        exact = estimate_rates([actor], [Enemy(hp=42, atk=1, defense=2, cd=1.0)])
+        # 40 HP still takes 14 hits of 3.
+        overkill = estimate_rates([actor], [Enemy(hp=40, atk=1, defense=2, cd=1.0)])
+
+        self.assertAlmostEqual(overkill.seconds_per_kill, exact.seconds_per_kill)
+
+    def test_unwinnable_fights_grant_nothing(self):
+        actor = Actor("A", hp=10, atk=1, cd=1.0)
+        enemy = Enemy(hp=500, atk=20, defense=0, cd=0.2, xp_reward=10)
+
+        rates = estimate_rates([actor], [enemy])
+        report = project_rewards(rates, 8 * 3600)
+
+        self.assertIsNone(rates)
+        self.assertTrue(report.capped)
+        self.assertEqual(report.kills, 0)
+
+    def test_rates_match_a_headless_simulation(self):
+        hour_ticks = round(3600 / 0.2)
+        for location_id, level in (("destiny_islands_beach", 6), ("traverse_town_second_district", 6)):
+            with self.subTest(location_id=location_id):
+                location = get_location(location_id)
+                pool = EncounterPool(
+                    DEFAULT_ENCOUNTER_POOLS,
+                    default_pool=location.encounter_pool,
+                    rng=random.Random("offline/encounters"),
+                )
+                party = self._party_at_level(level)
+                simulated = farm_waves(
+                    party, pool, random.Random("offline/battle"), hour_ticks, level_up=False
+                )
+
+                rates = estimate_rates(self._party_at_level(level), location_enemies(location_id))
+                report = project_rewards(rates, 3600)
+
+                self.assertAlmostEqual(report.kills / simulated["kills"], 1.0, delta=0.1)
+                self.assertAlmostEqual(report.xp / simulated["xp"], 1.0, delta=0.1)
+                self.assertAlmostEqual(report.munny / simulated["munny"], 1.0, delta=0.1)
+
+    @staticmethod
+    def _party_at_level(level):
+        party = build_party(DEFAULT_PARTY_TEMPLATES)
+        for actor in party:
+            while actor.level < level:
+                actor.gain_xp(actor.xp_to_level - actor.xp)
+        return party
+
+    def test_projection_is_linear_in_time(self):
+        state = savegame.create_default_state("slot1")
+        rates = estimate_rates(state.actors, location_enemies(state.location_id))
+
+        hour = project_rewards(rates, 3600)
+        eight = project_rewards(rates, 8 * 3600)
+
+        self.assertGreater(hour.kills, 0)
+        self.assertTrue(math.isclose(eight.munny, hour.munny * 8, rel_tol=1e-3))
+
+
+class OfflineLoadTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        patcher = mock.patch.dict(
+            os.environ,
+            {savegame.SAVE_DIR_ENV: self._tmp.name},
+            clear=False,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_load_state_applies_offline_rewards(self):
+        state = savegame.create_default_state("slot1")
+        savegame.save_state(state)
+
+        plain = savegame.load_state("slot1")
+        self.assertIsNone(plain.offline_report)
+        self.assertEqual(plain.inventory.munny, 0)
+
+        later = state.updated_at + timedelta(hours=1)
+        loaded = savegame.load_state("slot1", offline_progress=True, now=later)
+
+        report = loaded.offline_report
+        self.assertEqual(report.elapsed_s, 3600)
+        self.assertGreater(report.kills, 0)
+        self.assertEqual(loaded.inventory.munny, report.munny)
+        self.assertGreater(loaded.actors[0].level, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core.data.savegame import create_default_state
+from core.scenes.item_level_scene import ItemLevelScene
+from core.scenes.scene import Manager
+from core.scenes.synthesis_scene import SynthesisScene
+from core.ui.panels import PANEL_BORDER, PANEL_FILL, default_panels, draw_overlay, draw_panel
+
+
+class PanelTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.font.init()
+        cls.font = pygame.font.Font(None, 24)
+
+    def test_cached_panels_match_direct_drawing(self):
+        rect = pygame.Rect(30, 40, 200, 120)
+        direct = pygame.Surface((320, 240))
+        direct.fill((90, 10, 10))
+        overlay = pygame.Surface(direct.get_size(), pygame.SRCALPHA)
+        overlay.fill((15, 15, 35, 235))
+        direct.blit(overlay, (0, 0))
+        direct.fill(PANEL_FILL, rect)
+        pygame.draw.rect(direct, PANEL_BORDER, rect, width=2)
+
+        cached = pygame.Surface((320, 240))
+        cached.fill((90, 10, 10))
+        draw_overlay(cached)
+        draw_panel(cached, rect)
+
+        self.assertEqual(
+            pygame.image.tobytes(direct, "RGB"),
+            pygame.image.tobytes(cached, "RGB"),
+        )
+
+    def test_overlay_scenes_build_surfaces_only_when_the_size_changes(self):
+        state = create_default_state("panels")
+        controller = Manager().controller
+        scenes = [
+            SynthesisScene(self.font, controller=controller, inventory=state.inventory),
+            ItemLevelScene(self.font, controller=controller, inventory=state.inventory, actors=state.actors),
+        ]
+        panels = default_panels()
+        for size in ((1280, 720), (1920, 1080)):
+            surface = pygame.Surface(size)
+            for scene in scenes:
+                scene.draw(surface)
+            builds = panels.builds
+            for _ in range(3):
+                for scene in scenes:
+                    scene.draw(surface)
+            self.assertEqual(panels.builds, builds, size)
+        self.assertGreater(panels.builds, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+
+import pygame
+
+from core.scenes.scene import Manager, Scene
+from core.systems.power import FramePacer, PowerMode
+
+
+def _event(kind, **attributes):
+    return pygame.event.Event(kind, attributes)
+
+
+class _Counter(Scene):
+    def __init__(self):
+        self.steps = 0
+
+    def update(self, dt):
+        self.steps += 1
+
+
+class FramePacerTests(unittest.TestCase):
+    def _draws(self, pacer, start, seconds, fps=60):
+        frames = int(seconds * fps)
+        return sum(pacer.should_draw(start + i / fps) for i in range(frames))
+
+    def test_no_input_drops_to_the_idle_rate(self):
+        pacer = FramePacer(idle_after_s=10)
+        pacer.tick(0.0)
+        self.assertEqual(self._draws(pacer, 0.0, 1.0), 60)
+
+        pacer.tick(11.0)
+        self.assertIs(pacer.mode, PowerMode.IDLE)
+        self.assertLessEqual(self._draws(pacer, 11.0, 2.0), 2 * FramePacer.DRAW_FPS[PowerMode.IDLE] + 1)
+
+    def test_input_wakes_the_loop_at_once(self):
+        pacer = FramePacer(idle_after_s=10)
+        pacer.tick(0.0)
+        pacer.tick(20.0)
+        self.assertFalse(pacer.active)
+
+        self.assertTrue(pacer.observe(_event(pygame.MOUSEMOTION, pos=(1, 1), rel=(1, 1), buttons=(0, 0, 0)), 20.0))
+        self.assertTrue(pacer.active)
+        self.assertTrue(pacer.should_draw(20.0))
+        self.assertTrue(pacer.should_draw(20.0 + 1 / 60))
+
+    def test_focus_and_minimise(self):
+        pacer = FramePacer()
+        pacer.tick(0.0)
+        pacer.observe(_event(pygame.WINDOWFOCUSLOST), 0.0)
+        self.assertIs(pacer.mode, PowerMode.UNFOCUSED)
+        pacer.observe(_event(pygame.WINDOWMINIMIZED), 0.0)
+        self.assertIs(pacer.mode, PowerMode.HIDDEN)
+        self.assertEqual(self._draws(pacer, 0.0, 2.0), 0)
+
+        self.assertTrue(pacer.observe(_event(pygame.WINDOWFOCUSGAINED), 3.0))
+        self.assertIs(pacer.mode, PowerMode.ACTIVE)
+
+    def test_disabled_pacer_stays_active(self):
+        pacer = FramePacer(enabled=False, idle_after_s=1)
+        pacer.tick(0.0)
+        pacer.observe(_event(pygame.WINDOWFOCUSLOST), 5.0)
+        self.assertTrue(pacer.active)
+
+
+class CatchUpTests(unittest.TestCase):
+    def test_rare_wakeups_still_run_every_step(self):
+        capped, caught_up = _Counter(), _Counter()
+        capped_manager, caught_up_manager = Manager(capped), Manager(caught_up)
+        for _ in range(8):
+            capped_manager.advance(0.25)
+            caught_up_manager.advance(0.25, catch_up=True)
+
+        self.assertEqual(caught_up.steps, round(2.0 / Manager.SIM_STEP_S))
+        self.assertLess(capped.steps, caught_up.steps)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core.data.savegame import create_default_state
+from core.gameplay.combat import TickController
+from core.scenes.battle_scene import BattleScene
+from core.scenes.scene import Manager
+from core.systems.profiling import Profiler, install_default_spans, percentile
+from core.systems.render import RenderSystem
+from core.ui.profiler_overlay import TEXT_CACHE_BYTES, ProfilerOverlay
+from core.ui.text_cache import default_text_cache
+
+
+SCREEN_SIZE = (1280, 720)
+
+
+class ProfilerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.font.init()
+        pygame.display.set_mode(SCREEN_SIZE)
+        cls.font = pygame.font.Font(None, 24)
+
+    def test_percentiles(self):
+        values = [float(v) for v in range(1, 101)]
+        self.assertEqual(percentile(values, 0.5), 51.0)
+        self.assertEqual(percentile(values, 0.99), 100.0)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+    def test_disabled_profiler_leaves_methods_untouched(self):
+        original_draw = RenderSystem.__dict__["draw"]
+        original_update = TickController.__dict__["update"]
+        profiler = install_default_spans(Profiler())
+        self.assertIs(RenderSystem.__dict__["draw"], original_draw)
+
+        profiler.enable()
+        self.assertIsNot(RenderSystem.__dict__["draw"], original_draw)
+        profiler.disable()
+        self.assertIs(RenderSystem.__dict__["draw"], original_draw)
+        self.assertIs(TickController.__dict__["update"], original_update)
+
+    def test_battle_frames_report_scene_and_subsystem_spans(self):
+        state = create_default_state("profile")
+        manager = Manager()
+        manager.set_scene(
+            BattleScene(
+                self.font,
+                controller=manager.controller,
+                location_id=state.location_id,
+                inventory=state.inventory,
+                actors=state.actors,
+                seed=3,
+            )
+        )
+        profiler = install_default_spans(Profiler())
+        manager.profiler = profiler
+        surface = pygame.Surface(SCREEN_SIZE)
+        profiler.enable()
+        try:
+            for frame in range(20):
+                manager.advance(1 / 60)
+                manager.draw(surface)
+                profiler.end_frame(frame / 60)
+            panel = ProfilerOverlay(self.font, profiler).draw(surface)
+            spans = set(profiler.spans)
+            self.assertEqual(len(profiler.frames), 19)
+        finally:
+            profiler.disable()
+
+        for name in (
+            "BattleScene.update",
+            "BattleScene.draw",
+            "RenderSystem.draw",
+            "HexBoard.draw",
+            "BattleHUD.draw",
+            "TickController.drain",
+        ):
+            self.assertIn(name, spans)
+        self.assertTrue(surface.get_rect().contains(panel))
+
+    def test_spans_are_closed_per_frame(self):
+        profiler = Profiler()
+        profiler.enable()
+        profiler.end_frame(0.0)
+        for frame in range(1, 4):
+            profiler.record("work", 0.001)
+            profiler.record("work", 0.002)
+            profiler.end_frame(frame * 0.25)
+
+        self.assertEqual(list(profiler.frames), [0.25] * 3)
+        self.assertAlmostEqual(profiler.spans["work"].p50, 0.003)
+
+    def test_overlay_text_stays_out_of_the_shared_cache(self):
+        profiler = Profiler()
+        profiler.enable()
+        overlay = ProfilerOverlay(self.font, profiler)
+        surface = pygame.Surface(SCREEN_SIZE)
+        shared = default_text_cache().stats()["entries"]
+        for frame in range(1, 600):
+            profiler.record("work", frame * 1e-5)
+            profiler.end_frame(frame * (1 / 60 + frame * 1e-6))
+            overlay.draw(surface)
+
+        self.assertEqual(default_text_cache().stats()["entries"], shared)
+        self.assertLessEqual(overlay.text_cache.bytes, TEXT_CACHE_BYTES)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import os
+import threading
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core.data.savegame import create_default_state, serialize_state
+from core.scenes.battle_scene import BattleScene
+from core.scenes.scene import Manager
+from core.systems.recording import (
+    CombatRecorder,
+    LogHeader,
+    RecordType,
+    read_log,
+    replay_log,
+)
+
+
+SCREEN_SIZE = (1280, 720)
+
+
+class CombatRecordingTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.font.init()
+        pygame.display.set_mode(SCREEN_SIZE)
+        cls.font = pygame.font.Font(None, 24)
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    def _record(self, path: Path, seed: int, frames: int = 600) -> None:
+        state = create_default_state("recording")
+        header = LogHeader(
+            seed=seed,
+            location_id=state.location_id,
+            tick_length_s=0.2,
+            screen_size=SCREEN_SIZE,
+            initial_state=serialize_state(state),
+        )
+        recorder = CombatRecorder(path, header, max_pending_chunks=2)
+        manager = Manager()
+        scene = BattleScene(
+            self.font,
+            controller=manager.controller,
+            location_id=state.location_id,
+            inventory=state.inventory,
+            actors=state.actors,
+            seed=seed,
+            recorder=recorder,
+        )
+        manager.set_scene(scene)
+        rect = pygame.Rect((0, 0), SCREEN_SIZE)
+        for frame in range(frames):
+            if frame == 100:
+                scene.cycle_actor_spell(0)
+            if frame % 50 == 25:
+                scene._handle_action_attack()
+            scene.update(1 / 60 + (frame % 7) * 0.003)
+            scene.sync_board(rect)
+        scene.finish_recording()
+
+    def test_replay_reproduces_recorded_session(self):
+        path = Path(self._tmp.name) / "battle.khcl"
+        self._record(path, seed=42)
+
+        header, records = read_log(path)
+        self.assertEqual(header.seed, 42)
+        kinds = {record[0] for record in records}
+        for kind in (RecordType.FRAME, RecordType.ATTACK, RecordType.SPAWN,
+                     RecordType.COMMAND, RecordType.STATE):
+            self.assertIn(kind, kinds)
+
+        result = replay_log(path, font=self.font)
+        self.assertTrue(result.matched, str(result))
+        self.assertEqual(result.frames, 600)
+
+    def test_same_seed_writes_identical_logs(self):
+        first = Path(self._tmp.name) / "a.khcl"
+        second = Path(self._tmp.name) / "b.khcl"
+        self._record(first, seed=7, frames=300)
+        self._record(second, seed=7, frames=300)
+        self.assertEqual(first.read_bytes(), second.read_bytes())
+
+    def test_close_surfaces_write_errors_instead_of_hanging(self):
+        state = create_default_state("recording")
+        header = LogHeader(
+            seed=1,
+            location_id=state.location_id,
+            tick_length_s=0.2,
+            screen_size=SCREEN_SIZE,
+            initial_state=serialize_state(state),
+        )
+        recorder = CombatRecorder(Path(self._tmp.name) / "full.khcl", header, max_pending_chunks=1)
+        real_handle = recorder._handle
+
+        class FullDisk:
+            def write(self, data):
+                raise OSError(28, "No space left on device")
+
+            def close(self):
+                real_handle.close()
+
+        recorder._handle = FullDisk()
+        for _ in range(20):
+            recorder.frame(1 / 60)
+            recorder.flush()
+
+        raised = []
+
+        def close():
+            try:
+                recorder.close()
+            except OSError as exc:
+                raised.append(exc)
+
+        closer = threading.Thread(target=close, daemon=True)
+        closer.start()
+        closer.join(5.0)
+        self.assertFalse(closer.is_alive())
+        self.assertEqual(len(raised), 1)
+        self.assertIs(raised[0].__cause__, recorder.error)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from core.data.savegame import SAVE_DIR_ENV
+from core.tools.soak import SCRIPT, HeadlessGame, MemorySample, SoakReport, run_soak
+
+
+class SoakTests(unittest.TestCase):
+    def test_script_drives_the_real_scene_stack(self):
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.dict(os.environ, {SAVE_DIR_ENV: tmp}):
+            game = HeadlessGame(seed=2)
+            start_location = game.battle.location_id
+            report = run_soak(
+                0.02,
+                cycle_s=30.0,
+                draw_every_s=1.0,
+                sample_every_s=30.0,
+                game=game,
+            )
+            saves = list(Path(tmp).iterdir())
+
+        self.assertEqual(report.errors, [])
+        self.assertEqual(set(report.actions), set(SCRIPT))
+        self.assertAlmostEqual(report.sim_s, 72.0)
+        self.assertGreater(report.sim_per_wall, 1.0)
+        self.assertEqual(report.frames_drawn, 72)
+        self.assertNotEqual(game.battle.location_id, start_location)
+        self.assertEqual(len(game.manager.scenes), 1)
+        self.assertTrue(saves)
+        self.assertGreaterEqual(len(report.samples), 3)
+
+    def test_growth_is_measured_from_the_end_of_the_warm_up(self):
+        report = SoakReport(warmup_s=100.0)
+        report.samples = [
+            MemorySample(0.0, 0.0, 50, 100),
+            MemorySample(100.0, 1.0, 100, 1000),
+            MemorySample(200.0, 2.0, 110, 1250),
+        ]
+        self.assertAlmostEqual(report.block_growth(), 0.25)
+        self.assertAlmostEqual(report.rss_growth(), 0.10)
+
+
+if __name__ == "__main__":
+    unittest.main()
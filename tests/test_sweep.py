@@ -0,0 +1,110 @@
+import csv
+import os
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core.gameplay.inventory import Inventory
+from core.gameplay.party import DEFAULT_PARTY_TEMPLATES
+from core.scenes.battle_scene import BattleScene
+from core.scenes.scene import Manager
+from core.tools.sweep import CellResult, Grid, apply_loadout, run_sweep, simulate_cell, write_csv
+
+
+class SweepTests(unittest.TestCase):
+    def _grid(self):
+        return Grid(
+            parties={"default": list(DEFAULT_PARTY_TEMPLATES)},
+            loadouts={"starter": {}, "unarmed": {"*": []}},
+            locations=["destiny_islands_beach", "traverse_town_second_district"],
+        )
+
+    def test_apply_loadout_overrides_named_actors_then_wildcard(self):
+        templates = apply_loadout(
+            DEFAULT_PARTY_TEMPLATES,
+            {"Sora": ["kingdom_key", "champion_belt"], "*": []},
+        )
+        loadouts = {template["name"]: template["loadout"] for template in templates}
+        self.assertEqual(loadouts["Sora"], ["kingdom_key", "champion_belt"])
+        self.assertEqual(loadouts["Donald"], [])
+        self.assertEqual(next(iter(DEFAULT_PARTY_TEMPLATES))["loadout"], ["kingdom_key"])
+
+    def test_results_do_not_depend_on_worker_count(self):
+        grid = self._grid()
+        serial = run_sweep(grid, hours=0.02, seed=3, workers=1)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            pooled = run_sweep(grid, hours=0.02, seed=3, executor=executor)
+
+        self.assertEqual(serial, pooled)
+        self.assertEqual(len(serial), 4)
+        beach = [result for result in serial if result.location_id == "destiny_islands_beach"]
+        for result in beach:
+            self.assertFalse(result.error)
+            self.assertGreater(result.kills, 0)
+            self.assertGreater(result.xp_per_hour, 0)
+        # A fresh level-1 party is overwhelmed in the late district.
+        late = [result for result in serial if result.location_id != "destiny_islands_beach"]
+        self.assertTrue(all(result.deaths > 0 for result in late))
+
+    def test_simulated_time_counts_the_ticks_that_ran(self):
+        raw = simulate_cell(DEFAULT_PARTY_TEMPLATES, "destiny_islands_beach", hours=0.05)
+        self.assertEqual(raw["sim_s"], round(0.05 * 3600 / 0.2) * 0.2)
+
+    def test_cells_match_a_battle_played_frame_by_frame(self):
+        location_id = "traverse_town_first_district"
+        raw = simulate_cell(DEFAULT_PARTY_TEMPLATES, location_id, hours=0.05, stream="7")
+
+        pygame.display.init()
+        pygame.font.init()
+        pygame.display.set_mode((1280, 720))
+        manager = Manager()
+        scene = BattleScene(
+            pygame.font.Font(None, 24),
+            controller=manager.controller,
+            location_id=location_id,
+            inventory=Inventory(keyblade_slots=3, armor_slots=10, accessory_slots=10),
+            seed="7",
+        )
+        manager.set_scene(scene)
+        # The sweep has no board, so both sides use the default targeting.
+        scene.cs._select_actor_target = scene.cs._default_actor_target
+        scene.cs._select_enemy_target = scene.cs._default_enemy_target
+        knockouts = []
+        real_post_attack = scene._handle_post_attack
+
+        def post_attack(attacker, defender):
+            if defender in scene.actors and defender.health.is_dead() and defender not in scene._ko_timers:
+                knockouts.append(scene.cs.tick_count)
+            real_post_attack(attacker, defender)
+
+        scene._handle_post_attack = post_attack
+        ticks = round(raw["sim_s"] / 0.2)
+        while scene.cs.tick_count < ticks:
+            scene.update(1 / 60)
+
+        self.assertGreater(len(knockouts), 0)
+        self.assertEqual(raw["deaths"], len(knockouts))
+        self.assertEqual(raw["kills"], scene._next_enemy_serial - len(scene.enemies))
+        self.assertEqual(raw["munny"], scene.inventory.munny)
+        self.assertEqual(raw["levels"], {actor.name: actor.level for actor in scene.actors})
+
+    def test_unknown_location_is_reported_in_the_row(self):
+        grid = Grid(parties={"default": list(DEFAULT_PARTY_TEMPLATES)}, loadouts={"starter": {}}, locations=["nowhere"])
+        (result,) = run_sweep(grid, hours=0.01, workers=1)
+        self.assertTrue(result.error)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = write_csv([result], Path(tmp) / "sweep.csv")
+            with path.open(newline="", encoding="utf-8") as handle:
+                rows = list(csv.DictReader(handle))
+        self.assertEqual(list(rows[0]), CellResult.columns())
+        self.assertEqual(rows[0]["location_id"], "nowhere")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core.data.savegame import create_default_state
+from core.scenes.battle_scene import BattleScene
+from core.scenes.map_scene import MapScene
+from core.scenes.scene import Manager
+from core.ui.text_cache import TextCache, default_text_cache
+
+
+SCREEN_SIZE = (1280, 720)
+
+
+class TextCacheTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.font.init()
+        pygame.display.set_mode(SCREEN_SIZE)
+        cls.font = pygame.font.Font(None, 24)
+
+    def test_repeated_text_is_rendered_once(self):
+        cache = TextCache()
+        first = cache.render(self.font, "Munny: 5", True, (250, 220, 120))
+        again = cache.render(self.font, "Munny: 5", True, [250, 220, 120])
+        other = cache.render(self.font, "Munny: 5", True, (255, 255, 255))
+
+        self.assertIs(first, again)
+        self.assertIsNot(first, other)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_least_recently_used_entries_are_evicted_past_the_cap(self):
+        probe = self.font.render("line 0", True, (255, 255, 255))
+        entry_bytes = probe.get_width() * probe.get_height() * probe.get_bytesize()
+        cache = TextCache(max_bytes=entry_bytes * 2)
+
+        cache.render(self.font, "line 0", True, (255, 255, 255))
+        cache.render(self.font, "line 1", True, (255, 255, 255))
+        cache.render(self.font, "line 0", True, (255, 255, 255))
+        cache.render(self.font, "line 2", True, (255, 255, 255))
+
+        self.assertLessEqual(cache.bytes, cache.max_bytes)
+        self.assertGreaterEqual(cache.evictions, 1)
+        misses = cache.misses
+        cache.render(self.font, "line 0", True, (255, 255, 255))
+        self.assertEqual(cache.misses, misses)
+
+    def test_steady_frames_render_no_new_text(self):
+        surface = pygame.Surface(SCREEN_SIZE)
+        manager = Manager()
+        state = create_default_state("cache")
+        battle = BattleScene(
+            self.font,
+            controller=manager.controller,
+            location_id=state.location_id,
+            inventory=state.inventory,
+            actors=state.actors,
+            seed=3,
+        )
+        map_scene = MapScene(
+            self.font,
+            controller=manager.controller,
+            current_location_id=state.location_id,
+            on_select=lambda location_id: None,
+        )
+        scenes = [battle, map_scene]
+        cache = default_text_cache()
+        for scene in scenes:
+            scene.draw(surface)
+            misses = cache.misses
+            scene.draw(surface)
+            scene.draw(surface)
+            self.assertEqual(cache.misses, misses, type(scene).__name__)
+
+
+if __name__ == "__main__":
+    unittest.main()
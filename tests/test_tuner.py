@@ -0,0 +1,41 @@
+import unittest
+
+from core.data.encounters import DEFAULT_ENCOUNTER_POOLS
+from core.tools.tuner import _combat_stats, fit_level, seconds_per_kill, target_curve, tune_pools
+
+
+class TunerTests(unittest.TestCase):
+    def test_fit_level_matches_a_linear_scan(self):
+        stats = _combat_stats({"enemy_id": "soldier"})
+        for party_level, target_s in ((1, 2.0), (7, 2.6), (10, 30.0)):
+            expected = 1
+            for level in range(1, 40):
+                if seconds_per_kill(stats, level, party_level) <= target_s:
+                    expected = level
+            self.assertEqual(fit_level(stats, party_level, target_s), expected)
+
+    def test_tuned_pools_keep_drops_and_meet_the_targets(self):
+        targets = target_curve()
+        tuned, report = tune_pools(targets)
+
+        self.assertEqual(set(tuned), set(DEFAULT_ENCOUNTER_POOLS))
+        self.assertEqual(
+            tuned["destiny_islands_cove"][1]["drops"],
+            DEFAULT_ENCOUNTER_POOLS["destiny_islands_cove"][1]["drops"],
+        )
+        self.assertEqual(DEFAULT_ENCOUNTER_POOLS["traverse_town_second_district"][0]["level"], 5)
+        by_pool = {target.pool: target for target in targets}
+        for row in report:
+            target = by_pool[row.pool]
+            if row.level > 1:
+                self.assertLessEqual(row.kill_s, target.seconds_per_kill)
+            rate = row.xp_reward / row.kill_s * 3600.0
+            self.assertAlmostEqual(rate / target.xp_per_hour, 1.0, delta=0.1)
+
+        misses = seconds_per_kill.cache_info().misses
+        tune_pools(targets)
+        self.assertEqual(seconds_per_kill.cache_info().misses, misses)
+
+
+if __name__ == "__main__":
+    unittest.main()